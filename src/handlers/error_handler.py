@@ -1,6 +1,7 @@
 import logging, pprint
 from collections.abc import Mapping, Sequence
 from ui.managers.message_box_manager import MessageBoxManager
+from handlers.response_schema import compile_schema
 
 logger = logging.getLogger(__name__)
 
@@ -8,10 +9,22 @@ logger = logging.getLogger(__name__)
 class BackendError(Exception):
     """Custom exception for backend (HTTP) errors."""
 
-    def __init__(self, message, status_code=None):
+    def __init__(self, message, status_code=None, retry_after=None):
         super().__init__(message)
         self.message = message
         self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(BackendError):
+    """Raised without contacting the backend while an endpoint's circuit breaker is open."""
+
+    def __init__(self, endpoint, retry_after=None):
+        message = f"Backend endpoint '{endpoint}' is failing; requests are paused"
+        if retry_after:
+            message += f" for {retry_after:.1f}s"
+        super().__init__(message + ".", retry_after=retry_after)
+        self.endpoint = endpoint
 
 
 class MissingKeyError(Exception):
@@ -22,6 +35,14 @@ class MissingKeyError(Exception):
         self.message = message
 
 
+class RequestCancelledError(Exception):
+    """Raised when a request is abandoned through its cancellation token."""
+
+    def __init__(self, message="Request cancelled."):
+        super().__init__(message)
+        self.message = message
+
+
 def handle_http_status(response, url=None):
     """
     Handle specific HTTP status codes and show a message box.
@@ -67,10 +88,12 @@ def truncate_json(data, max_length=500):
     return pretty_data
 
 
-def validate_json_keys(json_data, required_keys, endpoint, max_display_length=500):
+def validate_json_keys(json_data, required_keys, endpoint, max_display_length=500, sample_size=None):
     """
     Checks if all required_keys are present in the given json_data.
     Handles nested dictionaries and lists of dictionaries based on a dot-separated key path.
+    The key paths are compiled once per distinct list (see handlers/response_schema.py)
+    and the data is checked in a single pass.
     Raises MissingKeyError if any required key is missing.
 
     Args:
@@ -78,6 +101,8 @@ def validate_json_keys(json_data, required_keys, endpoint, max_display_length=50
         required_keys (list): List of required keys or key paths to check for (dot-separated).
         endpoint (str): The API endpoint for context in error messages.
         max_display_length (int): Maximum length of the truncated data for display.
+        sample_size (int, optional): Validate lists longer than this on an
+            evenly spread sample of this many elements.
 
     Raises:
         MissingKeyError: If any required key is missing.
@@ -85,54 +110,22 @@ def validate_json_keys(json_data, required_keys, endpoint, max_display_length=50
     if not required_keys:
         return  # No required keys to check
 
-    def check_key_path(data, key_path):
-        """
-        Recursively check if a key path exists in the data.
-
-        Args:
-            data (dict or list): The JSON data to check.
-            key_path (str): Dot-separated path of keys to check.
-
-        Returns:
-            bool: True if the key path exists, False otherwise.
-        """
-        keys = key_path.split(".")
-        current_data = data
-        for key in keys:
-            if isinstance(current_data, list):
-                # If it's a list, check each element for the next key
-                if not all(check_key_path(item, ".".join(keys)) for item in current_data if isinstance(item, dict)):
-                    return False
-                return True
-            elif isinstance(current_data, dict):
-                # If it's a dictionary, check for the key
-                if key not in current_data:
-                    return False
-                current_data = current_data[key]
-            else:
-                return False
-        return True
-
-    missing_keys = []
-    for key_path in required_keys:
-        if not check_key_path(json_data, key_path):
-            missing_keys.append(key_path)
-
-    if missing_keys:
-        # Format and truncate the data for display
-        truncated_data = truncate_json(json_data, max_display_length)
+    missing = compile_schema(tuple(required_keys), sample_size).find_missing(json_data)
+    if missing:
+        details = "; ".join(
+            f"{item.path} (missing in {item.count} place{'s' if item.count != 1 else ''}, "
+            f"e.g. {', '.join(item.examples)})"
+            for item in missing
+        )
+        # Only the first offending record is shown, truncated, never the whole payload
+        truncated_data = truncate_json(missing[0].first_record, max_display_length)
         msg = (
-            f"Missing keys in response from '{endpoint}': {', '.join(missing_keys)}. "
-            f"Received data:\n{truncated_data}"
+            f"Missing keys in response from '{endpoint}': {', '.join(item.path for item in missing)}. "
+            f"Received data (first offending record):\n{truncated_data}"
         )
-        # Show truncated data in the MessageBox
-        # MessageBoxManager.show_error(msg)
-
-        # Log full data to the console using pprint
-        logger.error(f"Full data for debugging from '{endpoint}':")
-        pprint.pprint(json_data, width=120)
+        logger.error(f"Response from '{endpoint}' failed validation: {details}")
 
-        # Raise the exception with the full message
+        # Raise the exception with the bounded message
         raise MissingKeyError(msg)
 
 
@@ -0,0 +1,261 @@
+"""
+response_schema.py
+
+Compiles the required key paths of a response (e.g. ["name", "status",
+"shot_detail.status"]) into a ResponseSchema once, then checks responses
+against it in a single pass. Paths are merged into a tree, so every list
+element is visited once however many paths are required, and the keys
+required at each level are checked with one set operation. Locations are
+only worked out for elements that fail.
+
+Huge lists can be validated by sampling, and failures are summarised with a
+bounded number of example locations instead of dumping the whole payload.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Example locations reported per missing key path.
+MAX_EXAMPLES = 3
+
+
+class MissingPath:
+    """
+    A required key path missing from a response.
+
+    Attributes:
+        path (str): The dot-separated key path.
+        count (int): Number of places (records) it is missing from.
+        examples (list): Up to MAX_EXAMPLES locations, e.g. "[17].shot_detail".
+        first_record: The first container found without the key.
+    """
+
+    __slots__ = ("path", "count", "examples", "first_record")
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.examples = []
+        self.first_record = None
+
+    def __repr__(self):
+        return f"MissingPath({self.path!r}, count={self.count}, examples={self.examples})"
+
+
+class _Node:
+    """Required keys at one level of the path tree."""
+
+    __slots__ = ("children", "paths", "leaf_keys", "required_keys")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # Key -> full paths ending at that key
+        self.paths: Dict[str, List[str]] = {}
+        self.leaf_keys = frozenset()
+        self.required_keys = frozenset()
+
+    def subtree_paths(self, key):
+        """Return every full path going through key."""
+        paths = list(self.paths.get(key, ()))
+        child = self.children.get(key)
+        if child is not None:
+            for child_key in set(child.paths) | set(child.children):
+                paths.extend(child.subtree_paths(child_key))
+        return paths
+
+
+class ResponseSchema:
+    """
+    Precompiled set of required key paths.
+
+    Lists met anywhere along a path apply the rest of the path to each of
+    their dictionary elements; other elements are ignored.
+    """
+
+    def __init__(self, required_keys: Sequence[str], sample_size: Optional[int] = None,
+                 max_examples: int = MAX_EXAMPLES):
+        """
+        Compile a schema.
+
+        Args:
+            required_keys (Sequence[str]): Dot-separated key paths.
+            sample_size (int, optional): Lists longer than this are validated
+                on an evenly spread sample of this many elements (always
+                including the first and last). None validates every element.
+            max_examples (int): Example locations kept per missing path.
+        """
+        self.required_keys = tuple(required_keys)
+        self.sample_size = sample_size
+        self.max_examples = max_examples
+        self._root = _Node()
+        for path in self.required_keys:
+            node = self._root
+            keys = path.split(".")
+            for key in keys[:-1]:
+                node = node.children.setdefault(key, _Node())
+            node.paths.setdefault(keys[-1], []).append(path)
+        self._finalize(self._root)
+
+    def _finalize(self, node):
+        # Keys needing no descent can be checked together with a set operation.
+        node.leaf_keys = frozenset(key for key in node.paths if key not in node.children)
+        node.required_keys = frozenset(node.paths) | frozenset(node.children)
+        for child in node.children.values():
+            self._finalize(child)
+
+    # ------------------------------
+    # Validation
+    # ------------------------------
+
+    def find_missing(self, data) -> List[MissingPath]:
+        """
+        Validate data against the schema.
+
+        Returns:
+            List[MissingPath]: Missing paths in the order they were declared;
+            empty if the data is valid.
+        """
+        if not self.required_keys:
+            return []
+        report = {}
+        self._check(self._root, data, (), report)
+        return [report[path] for path in self.required_keys if path in report]
+
+    def is_valid(self, data) -> bool:
+        return not self.find_missing(data)
+
+    def _indices(self, length):
+        if self.sample_size is None or length <= self.sample_size:
+            return range(length)
+        if self.sample_size < 2:
+            return [0]
+        last = length - 1
+        return sorted({round(i * last / (self.sample_size - 1)) for i in range(self.sample_size)})
+
+    def _is_complete(self, node, item):
+        """Return True if a dictionary holds every path of node (no diagnostics)."""
+        if not node.required_keys <= item.keys():
+            return False
+        for key, child in node.children.items():
+            value = item[key]
+            if isinstance(value, dict):
+                if not self._is_complete(child, value):
+                    return False
+            elif isinstance(value, list):
+                for index in self._indices(len(value)):
+                    element = value[index]
+                    if isinstance(element, dict) and not self._is_complete(child, element):
+                        return False
+            else:
+                return False
+        return True
+
+    def _check(self, node, value, location, report):
+        if isinstance(value, list):
+            leaf_only = not node.children
+            required_keys = node.required_keys
+            for index in self._indices(len(value)):
+                item = value[index]
+                if not isinstance(item, dict):
+                    continue
+                if required_keys <= item.keys() if leaf_only else self._is_complete(node, item):
+                    continue
+                self._check_dict(node, item, location + (index,), report)
+            return
+        if isinstance(value, dict):
+            if not self._is_complete(node, value):
+                self._check_dict(node, value, location, report)
+            return
+        for key in set(node.paths) | set(node.children):
+            self._report(report, node.subtree_paths(key), location, value)
+
+    def _check_dict(self, node, item, location, report):
+        for key in node.leaf_keys:
+            if key not in item:
+                self._report(report, node.paths[key], location, item)
+        for key, child in node.children.items():
+            if key not in item:
+                self._report(report, node.subtree_paths(key), location, item)
+            else:
+                self._check(child, item[key], location + (key,), report)
+
+    def _report(self, report, paths, location, record):
+        for path in paths:
+            missing = report.get(path)
+            if missing is None:
+                missing = report[path] = MissingPath(path)
+                missing.first_record = record
+            missing.count += 1
+            if len(missing.examples) < self.max_examples:
+                missing.examples.append(format_location(location))
+
+
+def format_location(location):
+    """Format a location tuple as e.g. '[17].shot_detail' ('<root>' if empty)."""
+    if not location:
+        return "<root>"
+    text = ""
+    for part in location:
+        text += f"[{part}]" if isinstance(part, int) else (f".{part}" if text else part)
+    return text
+
+
+@lru_cache(maxsize=256)
+def compile_schema(required_keys: tuple, sample_size: Optional[int] = None) -> ResponseSchema:
+    """
+    Return the compiled schema of a tuple of key paths, compiling it on first use.
+    """
+    return ResponseSchema(required_keys, sample_size)
+
+
+if __name__ == "__main__":
+    import timeit
+
+    from services.mock_backend import generate_tasks
+
+    def legacy_validate_json_keys(json_data, required_keys):
+        """The previous validate_json_keys check, kept for comparison."""
+
+        def check_key_path(data, key_path):
+            keys = key_path.split(".")
+            current_data = data
+            for key in keys:
+                if isinstance(current_data, list):
+                    if not all(check_key_path(item, ".".join(keys)) for item in current_data if isinstance(item, dict)):
+                        return False
+                    return True
+                elif isinstance(current_data, dict):
+                    if key not in current_data:
+                        return False
+                    current_data = current_data[key]
+                else:
+                    return False
+            return True
+
+        return [key_path for key_path in required_keys if not check_key_path(json_data, key_path)]
+
+    tasks = generate_tasks("DemoProject", 50_000)
+    cases = {
+        "list fields": ["name", "status"],
+        "nested fields": ["name", "status", "shot_detail.status", "sequence_details.name"],
+    }
+    for label, required_keys in cases.items():
+        schema = compile_schema(tuple(required_keys))
+        sampled = compile_schema(tuple(required_keys), 1000)
+        assert not schema.find_missing(tasks)
+        timings = {
+            "legacy": min(timeit.repeat(lambda: legacy_validate_json_keys(tasks, required_keys), number=1, repeat=3)),
+            "compiled": min(timeit.repeat(lambda: schema.find_missing(tasks), number=1, repeat=3)),
+            "sampled(1000)": min(timeit.repeat(lambda: sampled.find_missing(tasks), number=1, repeat=3)),
+        }
+        print(f"{label} ({len(tasks)} tasks): " + ", ".join(
+            f"{name} {seconds * 1000:.2f} ms" for name, seconds in timings.items()
+        ))
+
+    broken = [dict(task) for task in tasks[:1000]]
+    del broken[17]["status"], broken[500]["shot_detail"]
+    print(compile_schema(("name", "status", "shot_detail.status")).find_missing(broken))
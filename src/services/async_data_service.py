@@ -0,0 +1,250 @@
+"""
+async_data_service.py
+
+Non-blocking counterparts of the data_service API. Each call runs on a
+worker thread and returns a DataFuture whose callbacks are invoked on the
+Qt main thread, so widgets can be updated directly from them.
+
+Calls can be given a priority class and a cancellation token (see
+services/request_scheduler.py); a cancelled call fails with
+RequestCancelledError.
+"""
+
+import logging
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from services import data_service
+from services.request_scheduler import Priority, request_context
+from handlers.error_handler import RequestCancelledError
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Worker threads for backend calls; matches the HTTP pool size so requests
+# never wait on a free connection.
+MAX_WORKER_THREADS = data_service.POOL_MAXSIZE
+
+_thread_pool = QThreadPool()
+_thread_pool.setMaxThreadCount(MAX_WORKER_THREADS)
+
+# Futures are kept alive here until they resolve.
+_pending_futures = set()
+
+
+class DataFuture(QObject):
+    """
+    Result of an asynchronous data service call.
+
+    Must be created on the main thread. The worker emits the private signals
+    from its own thread; Qt queues them to this object's thread, so the
+    registered callbacks always run on the main thread.
+    """
+
+    resolved = Signal(object)
+    failed = Signal(object)
+
+    _finished = Signal(object)
+    _errored = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._done = False
+        self._result = None
+        self._error = None
+        self._callbacks = []
+        self._errbacks = []
+
+        self._finished.connect(self._on_finished)
+        self._errored.connect(self._on_errored)
+
+    def then(self, on_success=None, on_error=None):
+        """
+        Register callbacks for the result or the error.
+
+        If the future is already done the matching callback runs immediately.
+
+        Args:
+            on_success (callable, optional): Called with the result.
+            on_error (callable, optional): Called with the raised exception.
+
+        Returns:
+            DataFuture: self, to allow chaining.
+        """
+        if on_success:
+            if self._done and self._error is None:
+                on_success(self._result)
+            elif not self._done:
+                self._callbacks.append(on_success)
+        if on_error:
+            if self._done and self._error is not None:
+                on_error(self._error)
+            elif not self._done:
+                self._errbacks.append(on_error)
+        return self
+
+    def is_done(self) -> bool:
+        """Return True once the call has finished (successfully or not)."""
+        return self._done
+
+    def result(self):
+        """Return the result, or None if not done or failed."""
+        return self._result
+
+    def error(self):
+        """Return the raised exception, or None."""
+        return self._error
+
+    @Slot(object)
+    def _on_finished(self, result):
+        self._done = True
+        self._result = result
+        for callback in self._callbacks:
+            self._invoke(callback, result)
+        self._release()
+        self.resolved.emit(result)
+
+    @Slot(object)
+    def _on_errored(self, error):
+        self._done = True
+        self._error = error
+        if isinstance(error, RequestCancelledError):
+            logger.debug(f"Asynchronous data call cancelled: {error}")
+        elif not self._errbacks:
+            logger.error(f"Unhandled error in asynchronous data call: {error}")
+        for errback in self._errbacks:
+            self._invoke(errback, error)
+        self._release()
+        self.failed.emit(error)
+
+    def _release(self):
+        self._callbacks.clear()
+        self._errbacks.clear()
+        _pending_futures.discard(self)
+
+    @staticmethod
+    def _invoke(callback, value):
+        try:
+            callback(value)
+        except Exception as ex:
+            logger.error(f"Error in DataFuture callback {callback}: {ex}", exc_info=True)
+
+
+class _DataCallRunnable(QRunnable):
+    """
+    Runs one blocking data service call on a pool thread.
+    """
+
+    def __init__(self, future, func, args, kwargs, priority=None, token=None):
+        super().__init__()
+        self._future = future
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._priority = priority
+        self._token = token
+
+    def run(self):
+        try:
+            if self._token is not None:
+                self._token.raise_if_cancelled()
+            with request_context(self._priority, self._token):
+                result = self._func(*self._args, **self._kwargs)
+        except Exception as ex:
+            self._future._errored.emit(ex)
+        else:
+            self._future._finished.emit(result)
+
+
+def run_async(func, *args, **kwargs):
+    """
+    Run any blocking callable on the data worker pool.
+
+    Args:
+        func (callable): Function to run on a worker thread.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        DataFuture: Resolves on the main thread with func's return value.
+    """
+    future = DataFuture()
+    _pending_futures.add(future)
+    _thread_pool.start(_DataCallRunnable(future, func, args, kwargs))
+    return future
+
+
+def run_scheduled(priority, token, func, *args, **kwargs):
+    """
+    Run a blocking callable on the data worker pool with a request priority
+    class and an optional cancellation token. More urgent calls also start
+    ahead of less urgent ones waiting for a worker thread.
+
+    Args:
+        priority (Priority): Priority class of the requests func makes.
+        token (CancellationToken, optional): Cancels the call and its requests.
+        func (callable): Function to run on a worker thread.
+
+    Returns:
+        DataFuture: Resolves on the main thread with func's return value.
+    """
+    future = DataFuture()
+    _pending_futures.add(future)
+    _thread_pool.start(
+        _DataCallRunnable(future, func, args, kwargs, priority, token),
+        len(Priority) - int(priority)
+    )
+    return future
+
+
+# Asynchronous API functions
+def login_user_async(credentials):
+    return run_async(data_service.login_user, credentials)
+
+
+def get_formUiData_async():
+    return run_async(data_service.get_formUiData)
+
+
+def get_projects_async(data):
+    return run_async(data_service.get_projects, data)
+
+
+def get_episodes_async(project_name):
+    return run_async(data_service.get_episodes, project_name)
+
+
+def get_scenes_async(project_name):
+    return run_async(data_service.get_scenes, project_name)
+
+
+def get_tasks_async(project_name):
+    return run_async(data_service.get_tasks, project_name)
+
+
+def get_workFiles_async(data, token=None):
+    return run_scheduled(Priority.INTERACTIVE, token, data_service.get_workFiles, data)
+
+
+def get_workDetails_async(data, token=None):
+    return run_scheduled(Priority.INTERACTIVE, token, data_service.get_workDetails, data)
+
+
+def get_fileDetails_async(data, token=None):
+    return run_scheduled(Priority.INTERACTIVE, token, data_service.get_fileDetails, data)
+
+
+def get_taskDetail_async(task_data, token=None):
+    return run_scheduled(Priority.INTERACTIVE, token, data_service.get_taskDetail, task_data)
+
+
+def get_taskLog_async(task_name, token=None):
+    return run_scheduled(Priority.INTERACTIVE, token, data_service.get_taskLog, task_name)
+
+
+def get_taskData_async(data):
+    return run_async(data_service.get_taskData, data)
+
+
+def get_taskStatus_async(data):
+    return run_async(data_service.get_taskStatus, data)
@@ -0,0 +1,187 @@
+"""
+circuit_breaker.py
+
+Provides the CircuitBreaker class, which stops sending requests to a backend
+endpoint that keeps failing, and the CircuitBreakerRegistry that keeps one
+breaker per endpoint.
+
+A breaker is closed while the endpoint works. After a run of consecutive
+failures it opens and requests fail fast without touching the network. Once
+the open period is over it turns half-open and lets a single trial request
+through: success closes it again, failure re-opens it. Open periods are
+jittered so that many workstations tripped by the same outage do not all
+probe the backend at the same moment.
+"""
+
+import logging
+import random
+import threading
+import time
+from enum import Enum
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Consecutive failures that open a breaker.
+FAILURE_THRESHOLD = 5
+# Seconds a breaker stays open before allowing a trial request.
+RESET_TIMEOUT = 15.0
+# Open periods are stretched by a random factor of up to this much.
+RESET_JITTER = 0.5
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker for one endpoint. Thread-safe.
+    """
+
+    def __init__(self, name, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT,
+                 reset_jitter=RESET_JITTER):
+        """
+        Initialize the CircuitBreaker.
+
+        Args:
+            name (str): Name used in log messages (usually the endpoint).
+            failure_threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds the breaker stays open.
+            reset_jitter (float): Random stretch of the open period, as a fraction of reset_timeout.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.reset_jitter = reset_jitter
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_until = 0.0
+        self._trial_in_flight = False
+        self._stats = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if self._state == CircuitState.OPEN and time.monotonic() >= self._opened_until:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def retry_after(self) -> float:
+        """Return the seconds until the breaker allows a trial request (0 if it does now)."""
+        with self._lock:
+            if self._current_state() != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_until - time.monotonic())
+
+    # ------------------------------
+    # Admission & Outcomes
+    # ------------------------------
+
+    def allow_request(self) -> bool:
+        """
+        Return True if a request may be sent now. In the half-open state only
+        one trial request is allowed until its outcome is recorded.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._stats["successes"] += 1
+            self._failures = 0
+            if self._state != CircuitState.CLOSED:
+                logger.info(f"Circuit '{self.name}' closed; backend endpoint recovered.")
+            self._state = CircuitState.CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._stats["failures"] += 1
+            self._failures += 1
+            state = self._current_state()
+            if state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open()
+
+    def release_trial(self):
+        """
+        Give up a half-open trial without an outcome (e.g. the request was
+        cancelled), so another request can take it.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _open(self):
+        duration = self.reset_timeout * (1 + random.uniform(0, self.reset_jitter))
+        if self._state != CircuitState.OPEN:
+            self._stats["opened"] += 1
+            logger.warning(
+                f"Circuit '{self.name}' opened after {self._failures} consecutive failures; "
+                f"failing fast for {duration:.1f}s."
+            )
+        self._state = CircuitState.OPEN
+        self._opened_until = time.monotonic() + duration
+        self._trial_in_flight = False
+
+    def reset(self):
+        """Close the breaker and forget its failures."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def stats(self):
+        """Return the breaker's state and outcome counters."""
+        with self._lock:
+            return {"state": self._current_state().value, "consecutive_failures": self._failures, **self._stats}
+
+
+class CircuitBreakerRegistry:
+    """
+    One CircuitBreaker per endpoint, created on first use.
+    """
+
+    def __init__(self, **breaker_settings):
+        """
+        Args:
+            **breaker_settings: failure_threshold, reset_timeout or reset_jitter
+                for the breakers created.
+        """
+        self._lock = threading.Lock()
+        self._breakers = {}
+        self.breaker_settings = breaker_settings
+
+    def get(self, name) -> CircuitBreaker:
+        """Return the breaker of an endpoint."""
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name, **self.breaker_settings)
+            return breaker
+
+    def reset(self):
+        """Close every breaker."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+    def stats(self):
+        """Return the stats of every breaker, by endpoint."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.stats() for name, breaker in breakers.items()}
@@ -0,0 +1,236 @@
+"""
+compact_records.py
+
+Provides the TaskRecord class, a compact read-mostly task record, and the
+InternTable class that backs it.
+
+A task held as a dict costs a hash table plus its own copy of every string
+value, repeated for every task of a production; Qt item data converted
+from a dict adds one more copy per list row. A TaskRecord keeps the name in
+a slot and the low-cardinality fields (status, department) as small int
+codes into shared, interned string tables. The remaining fields of a
+complete record stay in a details dict whose nested objects are the shared
+instances of the entity store.
+
+TaskRecord is a read-only Mapping, so code reading tasks with task[key],
+task.get(key) and the like works unchanged; TaskFilter matches statuses by
+code. Convert with to_dict() where a real dict is needed (e.g. JSON).
+"""
+
+import logging
+import sys
+import threading
+from collections.abc import Mapping
+
+from services.constants import TASK_NAME, TASK_STATUS
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+TASK_DEPARTMENT = "department"
+
+# Code of a field the record does not hold.
+ABSENT = -1
+
+
+class InternTable:
+    """
+    Maps the values of a low-cardinality string field to small int codes
+    and back. Codes are never reused, so they can be compared and stored
+    anywhere. Thread-safe.
+    """
+
+    __slots__ = ("_codes", "_values", "_lock")
+
+    def __init__(self):
+        self._codes = {}
+        self._values = []
+        self._lock = threading.Lock()
+
+    def code(self, value: str) -> int:
+        """Return the code of a value, assigning the next free one on first use."""
+        code = self._codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(value)
+                if code is None:
+                    value = sys.intern(value)
+                    code = len(self._values)
+                    self._values.append(value)
+                    self._codes[value] = code
+        return code
+
+    def value(self, code: int) -> str:
+        """Return the (interned) value of a code."""
+        return self._values[code]
+
+    def codes_matching(self, predicate) -> frozenset:
+        """Return the codes of the values for which predicate(value) is true."""
+        return frozenset(code for code, value in enumerate(list(self._values)) if predicate(value))
+
+    def __len__(self):
+        return len(self._values)
+
+
+task_statuses = InternTable()
+task_departments = InternTable()
+
+_CODED_FIELDS = {TASK_STATUS: task_statuses, TASK_DEPARTMENT: task_departments}
+
+
+class TaskRecord(Mapping):
+    """
+    Compact task record with the mapping interface of a task dict.
+
+    Attributes:
+        name (str): The task name.
+        status_code (int): Code of the status in task_statuses, or ABSENT.
+        department_code (int): Code of the department in task_departments, or ABSENT.
+    """
+
+    __slots__ = ("name", "status_code", "department_code", "_details")
+
+    def __init__(self, fields):
+        """
+        Args:
+            fields (Mapping): The task's fields; must include the name.
+        """
+        self.name = fields[TASK_NAME]
+        self.status_code = ABSENT
+        self.department_code = ABSENT
+        self._details = None
+        self.update(fields)
+
+    @property
+    def status(self):
+        """The task status, or None."""
+        return task_statuses.value(self.status_code) if self.status_code != ABSENT else self.get(TASK_STATUS)
+
+    # ------------------------------
+    # Mapping Interface
+    # ------------------------------
+
+    def __getitem__(self, key):
+        if key == TASK_NAME:
+            return self.name
+        if key == TASK_STATUS and self.status_code != ABSENT:
+            return task_statuses.value(self.status_code)
+        if key == TASK_DEPARTMENT and self.department_code != ABSENT:
+            return task_departments.value(self.department_code)
+        if self._details is None:
+            raise KeyError(key)
+        return self._details[key]
+
+    def __iter__(self):
+        yield TASK_NAME
+        if self.status_code != ABSENT:
+            yield TASK_STATUS
+        if self.department_code != ABSENT:
+            yield TASK_DEPARTMENT
+        if self._details:
+            yield from self._details
+
+    def __len__(self):
+        return (1 + (self.status_code != ABSENT) + (self.department_code != ABSENT)
+                + (len(self._details) if self._details else 0))
+
+    def __repr__(self):
+        return f"TaskRecord({self.to_dict()!r})"
+
+    # ------------------------------
+    # Updates & Conversion
+    # ------------------------------
+
+    def merged(self, fields):
+        """
+        Return a new record with fields merged into a copy of this one. The
+        record itself is left unchanged, so holders of it (possibly on
+        other threads) never see a half-applied update.
+        """
+        record = TaskRecord.__new__(TaskRecord)
+        record.name = self.name
+        record.status_code = self.status_code
+        record.department_code = self.department_code
+        record._details = dict(self._details) if self._details else None
+        record.update(fields)
+        return record
+
+    def update(self, fields):
+        """
+        Merge fields into the record. Only used while a record is built;
+        records handed out are replaced through merged() instead.
+        """
+        for key, value in fields.items():
+            if key == TASK_NAME:
+                self.name = value
+                continue
+            table = _CODED_FIELDS.get(key)
+            if table is not None and isinstance(value, str):
+                code = table.code(value)
+                if key == TASK_STATUS:
+                    self.status_code = code
+                else:
+                    self.department_code = code
+                if self._details:
+                    self._details.pop(key, None)
+                continue
+            if key == TASK_STATUS:
+                self.status_code = ABSENT
+            elif key == TASK_DEPARTMENT:
+                self.department_code = ABSENT
+            if self._details is None:
+                self._details = {}
+            self._details[key] = value
+
+    def to_dict(self):
+        """Return the record as a plain dict (nested objects are shared, not copied)."""
+        return dict(self.items())
+
+
+def to_plain(value):
+    """Return a TaskRecord as a dict; anything else is returned unchanged."""
+    return value.to_dict() if isinstance(value, TaskRecord) else value
+
+
+if __name__ == "__main__":
+    import json
+    import time
+    import tracemalloc
+
+    from services.mock_backend import generate_tasks
+    from services.entity_store import EntityStore
+
+    def traced(build):
+        """Return (result, traced bytes held by result, seconds to build without tracing)."""
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        result = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return result, size, elapsed
+
+    NUM_TASKS = 100_000
+    full_payload = json.dumps(generate_tasks("DemoProject", NUM_TASKS))
+    list_payload = json.dumps([
+        {TASK_NAME: task[TASK_NAME], TASK_STATUS: task[TASK_STATUS]} for task in json.loads(full_payload)
+    ])
+
+    print(f"Synthetic project of {NUM_TASKS} tasks")
+    for label, payload in (("list records", list_payload), ("complete records", full_payload)):
+        _, dict_size, _ = traced(lambda: json.loads(payload))
+        _, compact_size, seconds = traced(lambda: [TaskRecord(task) for task in json.loads(payload)])
+        print(f"  {label:>16}: dicts ~{dict_size / 1e6:.1f} MB, "
+              f"TaskRecords ~{compact_size / 1e6:.1f} MB (decoded and built in {seconds * 1000:.0f} ms)")
+
+    def load_store():
+        store = EntityStore()
+        store.upsert_tasks("DemoProject", json.loads(full_payload), announce_new=False)
+        return store
+
+    # The entity store also shares the nested employee, sequence and episode objects.
+    store, store_size, seconds = traced(load_store)
+    print(f"  complete records in the entity store: ~{store_size / 1e6:.1f} MB "
+          f"(decoded and upserted in {seconds * 1000:.0f} ms)")
+    print(f"  distinct statuses: {len(task_statuses)}, departments: {len(task_departments)}")
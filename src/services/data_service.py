@@ -1,3 +1,6 @@
+import logging
+import threading
+
 import requests
 from services.constants import (
     TASK_NAME, TASK_STATUS, USERNAME, DATE, COMMENT, STATUS_COLOR,
@@ -7,15 +10,220 @@ from services.constants import (
 from ui.managers.message_box_manager import MessageBoxManager
 from handlers.error_handler import (
     BackendError,
+    CircuitOpenError,
     MissingKeyError,
+    RequestCancelledError,
     handle_http_status,
     validate_json_keys
 )
+from services.session_pool import SUPPORTED_ENCODINGS, SessionPool
+from services.response_cache import ResponseCache
+from services.single_flight import SingleFlight
+from services.request_scheduler import RequestScheduler, current_token
+from services.circuit_breaker import CircuitBreakerRegistry
+from services.retry_policy import RetryPolicy, parse_retry_after
+from services import json_codec
+from services.entity_store import entity_store
+from services.compact_records import to_plain
+
+# Initialize logger
+logger = logging.getLogger(__name__)
 
 BASE_URL = "http://127.0.0.1:5000/api"
 
+# HTTP session pool settings (see services/session_pool.py)
+POOL_CONNECTIONS = 4       # Number of hosts to keep connection pools for
+POOL_MAXSIZE = 10          # Keep-alive connections per host
+HOST_POOL_SIZES = {}       # Per-host overrides, e.g. {"127.0.0.1": 16}
+CONNECT_TIMEOUT = 3.05     # Seconds
+READ_TIMEOUT = 60          # Seconds
+# Response codings to negotiate; set to "identity" to disable compression.
+ACCEPT_ENCODING = SUPPORTED_ENCODINGS
+
+_session_pool = SessionPool(
+    pool_connections=POOL_CONNECTIONS,
+    pool_maxsize=POOL_MAXSIZE,
+    host_pool_sizes=HOST_POOL_SIZES,
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=READ_TIMEOUT,
+    accept_encoding=ACCEPT_ENCODING
+)
+
+
+# Response cache settings (see services/response_cache.py)
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Seconds a response stays cached per endpoint; unlisted endpoints are never cached.
+CACHE_TTLS = {
+    "formUiData": 300,
+    "projects": 60,
+    "episodes": 300,
+    "scenes": 300,
+    "tasks": 300,
+    "taskStatus": 300,
+    "taskData": 30,
+    "workFiles": 30,
+    "workDetails": 60,
+    "fileDetails": 60,
+    "TaskDetail": 30,
+    "TaskLog": 15,
+}
+
+# Expired responses are kept until evicted, to be served while the backend is down.
+_response_cache = ResponseCache(max_bytes=CACHE_MAX_BYTES, keep_expired=True)
+
+# Read-only endpoints: safe to cache, coalesce and retry.
+READ_ENDPOINTS = frozenset(CACHE_TTLS) | {"batch", "taskData/page", "taskData/delta", "taskData/records"}
+
+# Field masks: the task fields each view needs. List endpoints send the mask
+# as 'fields' so the backend leaves out everything else; None requests
+# complete records (see services/task_records.py for on-demand hydration).
+TASK_LIST_FIELDS = (TASK_NAME, TASK_STATUS)
+TASK_DETAIL_FIELDS = None
+
+# Responses are validated against their required keys (see handlers/response_schema.py);
+# lists longer than this are checked on an evenly spread sample of this many elements.
+VALIDATION_SAMPLE_SIZE = 5000
+
+# Number of tasks requested per page when streaming taskData.
+TASK_PAGE_SIZE = 500
+
+# Merge concurrent identical read requests into one network call.
+COALESCE_REQUESTS = True
+
+_single_flight = SingleFlight()
+
+# Conditional request settings. Responses carrying an ETag or Last-Modified
+# header are remembered (without expiry) so that later requests can send
+# If-None-Match / If-Modified-Since and reuse the body on 304 Not Modified.
+CONDITIONAL_REQUESTS = True
+VALIDATOR_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+_validator_cache = ResponseCache(max_bytes=VALIDATOR_CACHE_MAX_BYTES)
+_conditional_lock = threading.Lock()
+_conditional_stats = {"conditional_requests": 0, "not_modified": 0, "bytes_saved": 0}
+
+# Every request takes a slot from the scheduler, by the priority class and
+# cancellation token of its calling context (see services/request_scheduler.py).
+_request_scheduler = RequestScheduler(max_concurrency=POOL_MAXSIZE)
+
+# Failure handling (see services/circuit_breaker.py and services/retry_policy.py).
+# Reads that fail with a connection error, a timeout or an overload status are
+# retried with jittered exponential backoff. Each endpoint has a circuit
+# breaker; while it is open, requests fail fast and reads are answered with
+# the last cached response when there is one.
+CIRCUIT_BREAKERS = True
+RETRY_POLICY = RetryPolicy(max_attempts=3, base_delay=0.25, max_delay=4.0)
+
+_circuit_breakers = CircuitBreakerRegistry()
+_resilience_lock = threading.Lock()
+_resilience_stats = {"retries": 0, "fast_failures": 0, "stale_served": 0}
+
+
+def configure_session(**settings):
+    """
+    Reconfigure the shared HTTP session pool.
+
+    Args:
+        **settings: pool_connections, pool_maxsize, host_pool_sizes,
+            connect_timeout, read_timeout, pool_block or accept_encoding.
+    """
+    _session_pool.configure(**settings)
+    if "pool_maxsize" in settings:
+        _request_scheduler.max_concurrency = settings["pool_maxsize"]
+
+
+def get_connection_stats():
+    """
+    Return counters of requests, new and reused connections, and body bytes
+    received on the wire and after decompression.
+    """
+    return _session_pool.stats()
+
+
+def get_cache_stats():
+    """
+    Return hit/miss statistics and the current size of the response cache.
+    """
+    return _response_cache.stats()
+
+
+def invalidate_cache(endpoint=None, data=None, all_payloads=False):
+    """
+    Drop cached responses.
+
+    Args:
+        endpoint (str, optional): Endpoint to invalidate. Clears the whole cache if omitted.
+        data (optional): Only drop the response cached for this payload.
+        all_payloads (bool): Drop every cached response of the endpoint.
+    """
+    if endpoint is None:
+        _response_cache.clear()
+        _validator_cache.clear()
+    else:
+        _response_cache.invalidate(endpoint, data, all_payloads=all_payloads)
+        _validator_cache.invalidate(endpoint, data, all_payloads=all_payloads)
+
+
+def get_coalescing_stats():
+    """
+    Return counters of read calls made, network calls executed and calls
+    collapsed into an identical in-flight request.
+    """
+    return _single_flight.stats()
+
+
+def get_conditional_stats():
+    """
+    Return counters of conditional requests, 304 responses and body bytes
+    not re-downloaded thanks to them.
+    """
+    with _conditional_lock:
+        stats = dict(_conditional_stats)
+    stats["validators"] = _validator_cache.stats()["entries"]
+    return stats
+
 
-def make_request(method, endpoint, data=None, required_keys=None):
+def get_scheduler_stats():
+    """
+    Return per-priority-class admission counters of the request scheduler.
+    """
+    return _request_scheduler.stats()
+
+
+def get_resilience_stats():
+    """
+    Return retry and fast-fail counters and the state of every endpoint's
+    circuit breaker.
+    """
+    with _resilience_lock:
+        stats = dict(_resilience_stats)
+    stats["breakers"] = _circuit_breakers.stats()
+    return stats
+
+
+def reset_circuit_breakers():
+    """
+    Close every circuit breaker, e.g. after the user fixed their connection.
+    """
+    _circuit_breakers.reset()
+
+
+def latest_request_token(key):
+    """
+    Return a new cancellation token for key, cancelling the previous one,
+    so only the newest request of a consumer (e.g. a detail pane) proceeds.
+    """
+    return _request_scheduler.latest(key)
+
+
+def add_cache_invalidation_listener(callback):
+    """
+    Register callback(endpoint, data), called whenever cached responses are dropped.
+    """
+    _response_cache.add_invalidation_listener(callback)
+
+
+def make_request(method, endpoint, data=None, required_keys=None, silent=False):
     """
     Generic function for making API requests.
 
@@ -24,6 +232,8 @@ def make_request(method, endpoint, data=None, required_keys=None):
         endpoint (str): API endpoint relative to the base URL.
         data (dict): Payload to send with the request.
         required_keys (list): Keys expected in the response.
+        silent (bool): If True, no message boxes are shown and any non-200
+            status raises BackendError, leaving error handling to the caller.
 
     Returns:
         dict: JSON response from the server.
@@ -31,52 +241,256 @@ def make_request(method, endpoint, data=None, required_keys=None):
     Raises:
         BackendError: For HTTP or connection errors.
         MissingKeyError: If required keys are missing in the response.
+        CircuitOpenError: If the endpoint's circuit breaker is open.
+        RequestCancelledError: If the context's cancellation token was cancelled.
     """
-    try:
-        url = f"{BASE_URL}/{endpoint}"
-        response = requests.request(
-            method,
-            url,
-            json=data,
-            headers={'Content-Type': 'application/json'}
-        )
-
-        if response.status_code != 200:
-            handle_http_status(response, url)
+    return _make_sized_request(method, endpoint, data, required_keys, silent)[0]
 
-        json_data = response.json()
-        validate_json_keys(json_data, required_keys, endpoint)
-        return json_data
 
+def _make_sized_request(method, endpoint, data, required_keys, silent):
+    """
+    Same as make_request, returning (JSON response, size of its body in
+    bytes) so the response cache does not have to serialise it again.
+    """
+    show_error = (lambda message: None) if silent else MessageBoxManager.show_error
+    try:
+        return _send_with_retries(method, endpoint, data, required_keys, silent)
+    except RequestCancelledError:
+        raise
+    except CircuitOpenError as coe:
+        # The failures that opened the breaker were already reported.
+        logger.warning(coe.message)
+        raise
     except BackendError as be:
-        MessageBoxManager.show_error(be.message)
+        show_error(be.message)
         raise
     except MissingKeyError as mke:
-        MessageBoxManager.show_error(mke.message)
+        show_error(mke.message)
         raise
-    except requests.RequestException as req_err:
-        error_message = f"Request error occurred: {req_err}\n Check backend!"
-        MessageBoxManager.show_error(error_message)
-        raise BackendError(error_message) from req_err
     except Exception as ex:
+        # A cancelled request fails however its aborted socket happens to surface.
+        token = current_token()
+        if token is not None and token.cancelled:
+            raise RequestCancelledError(f"Request to '{endpoint}' cancelled.") from ex
+        if isinstance(ex, requests.RequestException):
+            error_message = f"Request error occurred: {ex}\n Check backend!"
+            show_error(error_message)
+            raise BackendError(error_message) from ex
         error_message = f"An unexpected error occurred: {ex}"
-        MessageBoxManager.show_error(error_message)
+        show_error(error_message)
         raise BackendError(error_message) from ex
 
 
+def _send_with_retries(method, endpoint, data, required_keys, silent):
+    """
+    Send a request through the endpoint's circuit breaker, retrying reads
+    that fail transiently; see _make_sized_request.
+    """
+    breaker = _circuit_breakers.get(endpoint) if CIRCUIT_BREAKERS else None
+    max_attempts = RETRY_POLICY.max_attempts if endpoint in READ_ENDPOINTS else 1
+    token = current_token()
+    attempt = 0
+    while True:
+        attempt += 1
+        if breaker is not None and not breaker.allow_request():
+            with _resilience_lock:
+                _resilience_stats["fast_failures"] += 1
+            raise CircuitOpenError(endpoint, breaker.retry_after())
+        try:
+            with _request_scheduler.slot():
+                result = _send_request(method, endpoint, data, required_keys, silent)
+        except Exception as ex:
+            cancelled = isinstance(ex, RequestCancelledError) or (token is not None and token.cancelled)
+            if breaker is not None:
+                if cancelled:
+                    breaker.release_trial()
+                elif _is_backend_failure(ex):
+                    breaker.record_failure()
+                else:
+                    # The backend answered (e.g. 4xx); the endpoint itself is healthy.
+                    breaker.record_success()
+            if cancelled or attempt >= max_attempts or not RETRY_POLICY.is_retryable(ex):
+                raise
+            delay = RETRY_POLICY.backoff(attempt, getattr(ex, "retry_after", None))
+            logger.info(f"Request to '{endpoint}' failed ({ex}); retry {attempt} in {delay:.2f}s.")
+            with _resilience_lock:
+                _resilience_stats["retries"] += 1
+            if not RETRY_POLICY.wait(delay, token):
+                raise RequestCancelledError(f"Request to '{endpoint}' cancelled.") from ex
+            continue
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+def _is_backend_failure(error):
+    """
+    Return True if an error means the backend is unhealthy (as opposed to
+    rejecting this particular request).
+    """
+    if isinstance(error, BackendError):
+        return error.status_code is not None and (error.status_code >= 500 or error.status_code == 429)
+    return isinstance(error, requests.RequestException)
+
+
+def _stale_response(endpoint, data):
+    """
+    Return (hit, value) for the last response received from an endpoint,
+    expired or not.
+    """
+    hit, value = _response_cache.get_stale(endpoint, data)
+    if hit:
+        return hit, value
+    hit, validated = _validator_cache.get_stale(endpoint, data)
+    return hit, validated["body"] if hit else None
+
+
+def _send_request(method, endpoint, data, required_keys, silent):
+    """
+    Send one request and decode its response; see _make_sized_request.
+    """
+    url = f"{BASE_URL}/{endpoint}"
+    headers = {'Content-Type': 'application/json'}
+
+    validated = None
+    if CONDITIONAL_REQUESTS:
+        hit, validated = _validator_cache.get(endpoint, data)
+        if hit:
+            if validated["etag"]:
+                headers["If-None-Match"] = validated["etag"]
+            if validated["last_modified"]:
+                headers["If-Modified-Since"] = validated["last_modified"]
+
+    # Streamed, so the body is decompressed as it arrives (see read_body).
+    response = _session_pool.request(
+        method,
+        url,
+        json=data,
+        headers=headers,
+        stream=True
+    )
+
+    if validated is not None:
+        with _conditional_lock:
+            _conditional_stats["conditional_requests"] += 1
+            if response.status_code == 304:
+                _conditional_stats["not_modified"] += 1
+                _conditional_stats["bytes_saved"] += validated["size"]
+        if response.status_code == 304:
+            response.close()
+            return validated["body"], validated["size"]
+
+    if response.status_code != 200:
+        if silent or response.status_code >= 500 or response.status_code == 429:
+            response.close()
+            # Overload and server errors are reported by make_request once
+            # retries are exhausted, not on every attempt.
+            raise BackendError(
+                f"Backend Error: {response.status_code} {response.reason} from '{endpoint}'",
+                status_code=response.status_code,
+                retry_after=parse_retry_after(response.headers.get("Retry-After"))
+            )
+        handle_http_status(response, url)
+
+    body = _session_pool.read_body(response)
+    try:
+        json_data = json_codec.loads(body)
+    except ValueError as ex:
+        raise BackendError(f"Malformed JSON response from '{endpoint}': {ex}") from ex
+    validate_json_keys(json_data, required_keys, endpoint, sample_size=VALIDATION_SAMPLE_SIZE)
+
+    size = len(body)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if CONDITIONAL_REQUESTS and response.status_code == 200 and (etag or last_modified):
+        _validator_cache.put(
+            endpoint, data,
+            {"etag": etag, "last_modified": last_modified, "body": json_data, "size": size},
+            ttl=float("inf"),
+            size=size
+        )
+    return json_data, size
+
+
+def _cached_request(method, endpoint, data, required_keys, silent, use_cache):
+    """
+    Serve a request from the response cache when possible, otherwise
+    perform it (joining an identical in-flight read if there is one) and
+    cache the response according to CACHE_TTLS. While the endpoint's circuit
+    breaker is open, reads are answered with the last response received,
+    expired or not, if there is one.
+    """
+    ttl = CACHE_TTLS.get(endpoint, 0) if use_cache else 0
+    if ttl:
+        hit, cached = _response_cache.get(endpoint, data)
+        if hit:
+            return cached
+
+    try:
+        json_data, size = _coalesced_request(method, endpoint, data, required_keys, silent)
+    except CircuitOpenError:
+        if endpoint not in READ_ENDPOINTS:
+            raise
+        hit, stale = _stale_response(endpoint, data)
+        if not hit:
+            raise
+        logger.info(f"Serving the last cached response of '{endpoint}' while its circuit is open.")
+        with _resilience_lock:
+            _resilience_stats["stale_served"] += 1
+        return stale
+    if ttl:
+        # The body length, so the cache does not serialise the response to size it
+        _response_cache.put(endpoint, data, json_data, ttl, size=size)
+    return json_data
+
+
+def _coalesced_request(method, endpoint, data, required_keys, silent):
+    """
+    Perform a request, joining an identical in-flight read if there is one.
+    Returns (JSON response, body size in bytes), as _make_sized_request.
+
+    Coalesced reads are made silently, so silent (e.g. prefetch) and
+    interactive callers share them; each caller that is not silent reports
+    the error itself.
+    """
+    if COALESCE_REQUESTS and endpoint in READ_ENDPOINTS:
+        key = (method, ResponseCache.make_key(endpoint, data), tuple(required_keys or ()))
+        while True:
+            try:
+                return _single_flight.do(
+                    key, _make_sized_request, method, endpoint, data, required_keys, True
+                )
+            except RequestCancelledError:
+                # The call we joined was cancelled by its own caller; retry
+                # unless this caller was cancelled too.
+                token = current_token()
+                if token is not None and token.cancelled:
+                    raise
+            except CircuitOpenError:
+                raise
+            except (BackendError, MissingKeyError) as ex:
+                if not silent:
+                    MessageBoxManager.show_error(ex.message)
+                raise
+    return _make_sized_request(method, endpoint, data, required_keys, silent)
+
+
 # Common functions to send and fetch data
-def fetch_data(endpoint, required_keys=None):
+def fetch_data(endpoint, required_keys=None, silent=False, use_cache=True):
     """
     Fetch data from the given endpoint.
+    Responses are cached for CACHE_TTLS[endpoint] seconds and must not be mutated.
     """
-    return make_request("GET", endpoint, required_keys=required_keys)
+    return _cached_request("GET", endpoint, None, required_keys, silent, use_cache)
 
 
-def send_data(endpoint, data, required_keys=None):
+def send_data(endpoint, data, required_keys=None, silent=False, use_cache=True):
     """
     Send data to the given endpoint.
+    Responses of read endpoints listed in CACHE_TTLS are cached and must not be mutated.
+    Task records (e.g. the selected task) are sent as plain dicts.
     """
-    return make_request("POST", endpoint, data=data, required_keys=required_keys)
+    return _cached_request("POST", endpoint, to_plain(data), required_keys, silent, use_cache)
 
 
 # Specific API functions
@@ -127,52 +541,166 @@ def get_tasks(project_name):
 
 
 # Work file-related operations
-def get_workFiles(data):
+def get_workFiles(data, silent=False):
     """
     Fetch work files related to a task.
     Args:
         data (dict): Should include required filters or task info.
+        silent (bool): Raise errors without showing a message box (e.g. for prefetching).
     """
     return send_data("workFiles", data, required_keys=[
         WORK_APP, WORK_VERSION, WORK_SIZE, WORK_DATE
-    ])
+    ], silent=silent)
 
 
-def get_workDetails(data):
+def get_workDetails(data, silent=False):
     """
     Fetch work file details.
     Args:
         data (dict): Includes task-related file metadata.
+        silent (bool): Raise errors without showing a message box.
     """
-    return send_data("workDetails", data, required_keys=[PREVIEW_PATH])
+    return send_data("workDetails", data, required_keys=[PREVIEW_PATH], silent=silent)
 
 
-def get_fileDetails(data):
+def get_fileDetails(data, silent=False):
     """
     Fetch specific file details.
     """
-    return send_data("fileDetails", data, required_keys=[PREVIEW_PATH])
+    return send_data("fileDetails", data, required_keys=[PREVIEW_PATH], silent=silent)
 
 
 # Task and log-related operations
-def get_taskDetail(task_data):
-    return send_data("TaskDetail", task_data, required_keys=[PREVIEW_PATH])
+def get_taskDetail(task_data, silent=False):
+    return send_data("TaskDetail", task_data, required_keys=[PREVIEW_PATH], silent=silent)
 
 
-def get_taskLog(task_name):
+def get_taskLog(task_name, silent=False):
     return send_data("TaskLog", task_name, required_keys=[
         TASK_STATUS, USERNAME, DATE, COMMENT, STATUS_COLOR
-    ])
+    ], silent=silent)
+
+
+def with_fields(data, fields):
+    """
+    Return a copy of a task request payload carrying a field mask.
+    Args:
+        data (dict): The payload, e.g. {'project_name': ...}.
+        fields (tuple): Field mask, or None for complete records.
+    """
+    return dict(data, fields=list(fields)) if fields else dict(data)
+
+
+def project_task_fields(tasks, fields):
+    """
+    Reduce task records to a field mask. Only copies when a record carries
+    fields outside the mask, i.e. when the backend ignored the mask.
+    Args:
+        tasks (list): Task records.
+        fields (tuple): Field mask, or None to keep records complete.
+    Returns:
+        list: The records, projected.
+    """
+    if not fields:
+        return tasks
+    mask = frozenset(fields)
+    if all(task.keys() <= mask for task in tasks):
+        return tasks
+    return [{field: task[field] for field in fields if field in task} for task in tasks]
 
 
-def get_taskData(data):
-    return send_data("taskData", data, required_keys=[TASK_NAME, TASK_STATUS])
+def get_taskData(data, fields=TASK_LIST_FIELDS):
+    tasks = send_data("taskData", with_fields(data, fields), required_keys=[TASK_NAME, TASK_STATUS])
+    return entity_store.upsert_tasks(data["project_name"], project_task_fields(tasks, fields), announce_new=False)
+
+
+def get_taskData_records(data, names, fields=TASK_DETAIL_FIELDS):
+    """
+    Fetch the records of specific tasks, complete unless a mask is given.
+    Args:
+        data (dict): Must include 'project_name'.
+        names (list): Names of the tasks.
+        fields (tuple, optional): Field mask; None for complete records.
+    Returns:
+        list: The canonical records of the tasks that exist, in any order.
+    Notes for backend:
+        Optional endpoint. Clients fall back to the complete 'taskData' list
+        when it responds with 404/405/501, so no message box is shown for failures.
+    """
+    records = send_data(
+        "taskData/records", dict(with_fields(data, fields), names=list(names)),
+        required_keys=[TASK_NAME], silent=True
+    )
+    return entity_store.upsert_tasks(data["project_name"], project_task_fields(records, fields), announce_new=False)
 
 
 def get_taskStatus(data):
     return send_data("taskStatus", data)
 
 
+def get_taskData_page(data, cursor=None, limit=None, fields=TASK_LIST_FIELDS):
+    """
+    Fetch one page of a project's tasks.
+    Args:
+        data (dict): Must include 'project_name'.
+        cursor (str, optional): 'next_cursor' of the previous page; None for the first page.
+        limit (int, optional): Page size, defaults to TASK_PAGE_SIZE.
+        fields (tuple, optional): Field mask; None for complete records.
+    Returns:
+        dict: {'items': [...], 'next_cursor': str or None, 'total': int}.
+    Notes for backend:
+        Optional endpoint. Clients fall back to 'taskData' when it responds
+        with 404/405/501, so no message box is shown for failures.
+    """
+    payload = dict(with_fields(data, fields), cursor=cursor, limit=limit or TASK_PAGE_SIZE)
+    page = send_data("taskData/page", payload, required_keys=["items", "total"], silent=True)
+    validate_json_keys(page["items"], [TASK_NAME, TASK_STATUS], "taskData/page", sample_size=VALIDATION_SAMPLE_SIZE)
+    items = project_task_fields(page["items"], fields)
+    return dict(page, items=entity_store.upsert_tasks(data["project_name"], items, announce_new=False))
+
+
+def get_taskData_delta(data, since=None, fields=TASK_LIST_FIELDS):
+    """
+    Fetch the tasks of a project created, changed or deleted since a cursor.
+    Args:
+        data (dict): Must include 'project_name'.
+        since (str, optional): 'cursor' of the previous delta. With None only
+            the current cursor is returned.
+        fields (tuple, optional): Field mask of the changed tasks; None for complete records.
+    Returns:
+        dict: {'changed': [tasks], 'deleted': [task names], 'cursor': str}.
+        The delta is applied to the entity store, which notifies subscribers.
+    Notes for backend:
+        Optional endpoint. Clients stop syncing when it responds with
+        404/405/501, so no message box is shown for failures.
+    """
+    delta = send_data(
+        "taskData/delta", dict(with_fields(data, fields), since=since),
+        required_keys=["changed", "deleted", "cursor"], silent=True
+    )
+    validate_json_keys(
+        delta["changed"], [TASK_NAME, TASK_STATUS], "taskData/delta", sample_size=VALIDATION_SAMPLE_SIZE
+    )
+    project_name = data["project_name"]
+    changed = entity_store.upsert_tasks(project_name, project_task_fields(delta["changed"], fields))
+    entity_store.remove_tasks(project_name, delta["deleted"])
+    return dict(delta, changed=changed)
+
+
+def get_batch(requests_list):
+    """
+    Run several read requests in one round trip.
+    Args:
+        requests_list (list): Items of the form {'id', 'endpoint', 'data'}.
+    Returns:
+        dict: {'responses': {id: response}}.
+    Notes for backend:
+        Optional endpoint. Clients fall back to individual requests when it
+        responds with 404/405/501, so no message box is shown for failures.
+    """
+    return send_data("batch", {"requests": requests_list}, required_keys=["responses"], silent=True)
+
+
 def create_file(data):
     print(data)
     return 'file created and updated database'
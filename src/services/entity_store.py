@@ -0,0 +1,449 @@
+"""
+entity_store.py
+
+Provides the EntityStore class, a normalised in-memory store of the tasks of
+open projects and the entities they refer to (employees, sequences and
+episodes).
+
+Task payloads repeat the same employee, sequence and episode objects for
+every task. The store keeps one canonical instance of each entity, keyed by
+its id or name (an identity map), and tasks point to those shared instances
+instead of carrying their own copies. Every task also has exactly one
+canonical record per project, a compact TaskRecord, so the task lists of
+both areas, the current snapshot and the hydrated record cache all hold the
+same object.
+
+Records and entities are never changed once handed out: an update builds a
+new instance and swaps it into the store under its lock, so they can be
+read on the GUI thread while a worker thread updates the store. Holders
+pick the new instance up with task() when the change signal reaches them.
+
+The data service populates the store with every task list, page, delta and
+record it fetches. Lookups by task name, sequence, shot and assignee are
+served from indexes (work files are looked up through their task, as no two
+tasks share one), and widgets subscribe to the change signals to patch
+the rows of the tasks that changed.
+"""
+
+import logging
+import sys
+import threading
+from collections import defaultdict
+
+from PySide6.QtCore import QObject, Signal
+
+from services.compact_records import TaskRecord
+from services.constants import TASK_NAME
+from services.naming_convention import naming_convention
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+def _employee_key(employee):
+    """Identity of an employee: its id, or its name if it has none."""
+    employee_id = employee.get("employee_id")
+    if employee_id is not None:
+        return "id", employee_id
+    name = employee.get("employee_name")
+    return ("name", name) if name is not None else None
+
+
+def _with_interned_strings(mapping):
+    """
+    Copy a dict with its string values interned. Used for the small,
+    repetitive values of per-task objects (shot names and statuses, work
+    file apps, versions, sizes and dates).
+    """
+    return {key: sys.intern(value) if type(value) is str else value for key, value in mapping.items()}
+
+
+def _lower(name):
+    """Lower-case a name, as the naming convention does; None stays None."""
+    return name.lower() if isinstance(name, str) else name
+
+
+def _index_keys(project_name, task):
+    """
+    Return the (sequence, shot, assignee) index keys of a task; None for the
+    parts it does not carry.
+
+    The episode, sequence and shot come from the task name (every record
+    has one, including list records loaded with a field mask), or from the
+    sequence and shot details of a complete record whose name does not
+    follow the naming convention. Sequences are keyed by episode, as in
+    the identity map. The assignee is only known from complete records.
+    """
+    shot_detail = task.get("shot_detail")
+    if not isinstance(shot_detail, dict):
+        shot_detail = {}
+    fields = naming_convention.parse(task[TASK_NAME])
+    if fields is not None:
+        episode_name, sequence_name, shot_name = fields.get("episode"), fields.get("scene"), fields.get("shot")
+    else:
+        sequence = task.get("sequence_details")
+        if not isinstance(sequence, dict):
+            sequence = {}
+        episode_name, sequence_name = _lower(sequence.get("episode")), _lower(sequence.get("name"))
+        shot_name = _lower(shot_detail.get("shot"))
+    assignee = None
+    employee = (shot_detail.get("artist_assigned") or {}).get("employee")
+    if isinstance(employee, dict):
+        assignee = employee.get("employee_name")
+    return (
+        (project_name, episode_name, sequence_name) if sequence_name is not None else None,
+        (project_name, episode_name, sequence_name, shot_name)
+        if sequence_name is not None and shot_name is not None else None,
+        (project_name, assignee) if assignee is not None else None,
+    )
+
+
+class EntityStore(QObject):
+    """
+    Identity map of tasks and their shared sub-objects. Thread-safe.
+
+    Records returned by the store are the canonical instances and are
+    shared by every holder; they are read-only and replaced by upsert_tasks().
+    Partial records (loaded with a field mask) are merged into a copy of
+    the canonical record, so a later partial update keeps the fields a full
+    record brought in.
+
+    Signals are emitted from the thread that changed the store and carry
+    task names; receivers look the records up with task().
+
+    Signals:
+        tasks_added (str, list): Project name and names of new tasks.
+        tasks_changed (str, list): Project name and names of tasks whose fields changed.
+        tasks_removed (str, list): Project name and names of removed tasks.
+    """
+    tasks_added = Signal(str, list)
+    tasks_changed = Signal(str, list)
+    tasks_removed = Signal(str, list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.RLock()
+        # (project, task name) -> canonical task record
+        self._tasks = {}
+        # Shared sub-objects
+        self._employees = {}   # _employee_key() -> employee
+        self._episodes = {}    # (project, episode) -> episode details
+        self._sequences = {}   # (project, episode, sequence) -> sequence details
+        # Indexes: key -> task names
+        self._by_sequence = defaultdict(set)
+        self._by_shot = defaultdict(set)
+        self._by_assignee = defaultdict(set)
+        self._stats = {"upserts": 0, "added": 0, "changed": 0, "removed": 0, "shared": 0}
+
+    # ------------------------------
+    # Population
+    # ------------------------------
+
+    def upsert_tasks(self, project_name, records, announce_new=True):
+        """
+        Add or update tasks of a project.
+
+        The given records are not modified (they may be shared with the
+        response cache); the store keeps normalised copies.
+
+        Args:
+            project_name (str): Project the tasks belong to.
+            records (list): Task records, complete or partial.
+            announce_new (bool): Emit tasks_added for tasks the store did not
+                hold. Bulk loads pass False, as their caller displays the
+                tasks itself; changes to known tasks are always announced.
+
+        Returns:
+            list: The canonical records, in the order of records.
+        """
+        added, changed, canonical = [], [], []
+        with self._lock:
+            for record in records:
+                key = (project_name, record[TASK_NAME])
+                existing = self._tasks.get(key)
+                if existing is record:
+                    canonical.append(record)
+                    continue
+                task = self._normalise(project_name, record)
+                if existing is None:
+                    task = self._tasks[key] = TaskRecord(task)
+                    added.append(key[1])
+                    self._index(key, task)
+                else:
+                    if any(field in existing and existing[field] != value for field, value in task.items()):
+                        changed.append(key[1])
+                    elif all(field in existing for field in task):
+                        # Nothing new: keep the record
+                        canonical.append(existing)
+                        continue
+                    old_index_keys = _index_keys(project_name, existing)
+                    task = self._tasks[key] = existing.merged(task)
+                    if _index_keys(project_name, task) != old_index_keys:
+                        self._unindex(key, old_index_keys)
+                        self._index(key, task)
+                canonical.append(task)
+            self._stats["upserts"] += len(canonical)
+            self._stats["added"] += len(added)
+            self._stats["changed"] += len(changed)
+
+        if added and announce_new:
+            self.tasks_added.emit(project_name, added)
+        if changed:
+            self.tasks_changed.emit(project_name, changed)
+        return canonical
+
+    def remove_tasks(self, project_name, task_names, notify=True):
+        """
+        Remove tasks of a project.
+
+        Args:
+            project_name (str): Project the tasks belong to.
+            task_names (iterable): Names of the tasks.
+            notify (bool): Emit tasks_removed for the tasks that were held.
+
+        Returns:
+            list: Names of the tasks that were removed.
+        """
+        removed = []
+        with self._lock:
+            for task_name in task_names:
+                key = (project_name, task_name)
+                task = self._tasks.pop(key, None)
+                if task is None:
+                    continue
+                self._unindex(key, _index_keys(project_name, task))
+                removed.append(task_name)
+            self._stats["removed"] += len(removed)
+
+        if removed and notify:
+            self.tasks_removed.emit(project_name, removed)
+        return removed
+
+    def retain_tasks(self, project_name, task_names):
+        """
+        Silently drop the tasks of a project that are not in task_names,
+        e.g. after a complete reload of the project.
+        """
+        keep = set(task_names)
+        with self._lock:
+            stale = [name for project, name in self._tasks if project == project_name and name not in keep]
+        if stale:
+            logger.debug(f"Dropping {len(stale)} tasks no longer in '{project_name}' from the entity store.")
+            self.remove_tasks(project_name, stale, notify=False)
+
+    def clear(self, project_name=None):
+        """Forget every entity, or the tasks of one project."""
+        with self._lock:
+            if project_name is None:
+                for table in (self._tasks, self._employees, self._episodes, self._sequences,
+                              self._by_sequence, self._by_shot, self._by_assignee):
+                    table.clear()
+                return
+            names = [name for project, name in self._tasks if project == project_name]
+        self.remove_tasks(project_name, names, notify=False)
+
+    # ------------------------------
+    # Normalisation & Indexing
+    # ------------------------------
+
+    def _normalise(self, project_name, record):
+        """
+        Copy a task record into a dict, replacing its sub-objects with the
+        canonical instances. Only the containers along the way are copied.
+        """
+        task = dict(record)
+
+        shot_detail = task.get("shot_detail")
+        if isinstance(shot_detail, dict):
+            shot_detail = task["shot_detail"] = _with_interned_strings(shot_detail)
+            assigned = shot_detail.get("artist_assigned")
+            if isinstance(assigned, dict) and isinstance(assigned.get("employee"), dict):
+                employee_key = _employee_key(assigned["employee"])
+                if employee_key is not None:
+                    shot_detail["artist_assigned"] = dict(
+                        assigned, employee=self._intern(self._employees, employee_key, assigned["employee"])
+                    )
+
+        episode = task.get("episode_details")
+        if isinstance(episode, dict) and episode.get("name") is not None:
+            task["episode_details"] = self._intern(
+                self._episodes, (project_name, episode["name"]), episode
+            )
+
+        sequence = task.get("sequence_details")
+        if isinstance(sequence, dict) and sequence.get("name") is not None:
+            task["sequence_details"] = self._intern(
+                self._sequences, (project_name, sequence.get("episode"), sequence["name"]), sequence
+            )
+
+        work_files = task.get("work_files")
+        if isinstance(work_files, list):
+            task["work_files"] = [
+                _with_interned_strings(work_file) if isinstance(work_file, dict) else work_file
+                for work_file in work_files
+            ]
+        return task
+
+    def _intern(self, table, key, value):
+        """
+        Return the canonical instance of an entity, creating it from value or
+        replacing it with an updated copy when value carries newer fields.
+        """
+        canonical = table.get(key)
+        if canonical is None:
+            canonical = table[key] = dict(value)
+        elif canonical != value:
+            canonical = table[key] = {**canonical, **value}
+        else:
+            self._stats["shared"] += 1
+        return canonical
+
+    def _index(self, key, task):
+        index_keys = _index_keys(key[0], task)
+        for index, index_key in zip((self._by_sequence, self._by_shot, self._by_assignee), index_keys):
+            if index_key is not None:
+                index[index_key].add(key[1])
+
+    def _unindex(self, key, index_keys):
+        for index, index_key in zip((self._by_sequence, self._by_shot, self._by_assignee), index_keys):
+            names = index.get(index_key) if index_key is not None else None
+            if names is not None:
+                names.discard(key[1])
+                if not names:
+                    del index[index_key]
+
+    # ------------------------------
+    # Lookups
+    # ------------------------------
+
+    def task(self, project_name, task_name):
+        """Return the canonical record of a task, or None."""
+        with self._lock:
+            return self._tasks.get((project_name, task_name))
+
+    def tasks(self, project_name, task_names=None):
+        """
+        Return the canonical records of a project's tasks.
+
+        Args:
+            project_name (str): The project.
+            task_names (iterable, optional): Only these tasks (unknown names
+                are skipped), in this order. Every task of the project if omitted.
+        """
+        with self._lock:
+            if task_names is None:
+                return [task for (project, _), task in self._tasks.items() if project == project_name]
+            return [task for task in (self._tasks.get((project_name, name)) for name in task_names)
+                    if task is not None]
+
+    def _lookup(self, index, index_key):
+        with self._lock:
+            names = sorted(index.get(index_key, ()))
+            return [self._tasks[(index_key[0], name)] for name in names]
+
+    def tasks_by_sequence(self, project_name, episode_name, sequence_name):
+        """
+        Return the tasks of a sequence of an episode (e.g. 'e001', 'sc001'),
+        sorted by name. Names are case-insensitive; pass episode_name=None
+        for sequences of names without an episode.
+        """
+        return self._lookup(self._by_sequence, (project_name, _lower(episode_name), _lower(sequence_name)))
+
+    def tasks_by_shot(self, project_name, episode_name, sequence_name, shot_name):
+        """Return the tasks of a shot of a sequence of an episode, sorted by name."""
+        return self._lookup(self._by_shot, (project_name, _lower(episode_name), _lower(sequence_name),
+                                            _lower(shot_name)))
+
+    def tasks_by_assignee(self, project_name, employee_name):
+        """Return the tasks assigned to an employee, sorted by name."""
+        return self._lookup(self._by_assignee, (project_name, employee_name))
+
+    def employee(self, employee_id=None, employee_name=None):
+        """Return the canonical employee with an id (or, failing that, a name), or None."""
+        with self._lock:
+            if employee_id is not None:
+                return self._employees.get(("id", employee_id))
+            return self._employees.get(("name", employee_name))
+
+    def episode(self, project_name, episode_name):
+        """Return the canonical details of an episode, or None."""
+        with self._lock:
+            return self._episodes.get((project_name, episode_name))
+
+    def sequence(self, project_name, episode_name, sequence_name):
+        """Return the canonical details of a sequence of an episode, or None."""
+        with self._lock:
+            return self._sequences.get((project_name, episode_name, sequence_name))
+
+    def work_files_of(self, project_name, task_name):
+        """Return the work files of a task, or an empty list if its record has none."""
+        with self._lock:
+            task = self._tasks.get((project_name, task_name))
+            return list(task.get("work_files") or ()) if task is not None else []
+
+    # ------------------------------
+    # Statistics
+    # ------------------------------
+
+    def stats(self):
+        """Return entity counts and update counters."""
+        with self._lock:
+            return {
+                **self._stats,
+                "tasks": len(self._tasks),
+                "employees": len(self._employees),
+                "episodes": len(self._episodes),
+                "sequences": len(self._sequences),
+            }
+
+
+entity_store = EntityStore()
+
+
+if __name__ == "__main__":
+    import json
+    import time
+    import tracemalloc
+
+    from services.mock_backend import generate_tasks
+
+    # Resident size of 50k complete task records, as decoded vs normalised.
+    payload = json.dumps(generate_tasks("DemoProject", 50_000))
+
+    tracemalloc.start()
+    raw = json.loads(payload)
+    raw_size = tracemalloc.get_traced_memory()[0]
+    del raw
+
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    store = EntityStore()
+    store.upsert_tasks("DemoProject", json.loads(payload), announce_new=False)
+    store_size = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    records = json.loads(payload)
+    start = time.perf_counter()
+    EntityStore().upsert_tasks("DemoProject", records, announce_new=False)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"decoded:    ~{raw_size / 1e6:.1f} MB")
+    print(f"normalised: ~{store_size / 1e6:.1f} MB (indexes included), upsert {elapsed:.0f} ms")
+    print(f"stats: {store.stats()}")
+
+    start = time.perf_counter()
+    by_sequence = store.tasks_by_sequence("DemoProject", "e001", "sc001")
+    by_shot = store.tasks_by_shot("DemoProject", "e001", "sc001", "sh0010")
+    by_assignee = store.tasks_by_assignee("DemoProject", by_shot[0]["shot_detail"]["artist_assigned"]["employee"]["employee_name"])
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"lookups: {len(by_sequence)} in e001/sc001, {len(by_shot)} in e001/sc001/sh0010, "
+          f"{len(by_assignee)} for one assignee ({elapsed:.1f} ms)")
+    assert all(task["sequence_details"]["episode"] == "e001" for task in by_shot)
+
+    # List records loaded with a field mask are indexed by their name
+    masked = EntityStore()
+    masked.upsert_tasks("DemoProject", [{TASK_NAME: task[TASK_NAME], "status": task["status"]}
+                                        for task in json.loads(payload)], announce_new=False)
+    assert [task[TASK_NAME] for task in masked.tasks_by_shot("DemoProject", "E001", "SC001", "SH0010")] == \
+           [task[TASK_NAME] for task in by_shot]
+    print(f"masked records: {len(masked.tasks_by_sequence('DemoProject', 'e001', 'sc001'))} in e001/sc001")
@@ -0,0 +1,124 @@
+"""
+json_codec.py
+
+Pluggable JSON decoding for backend responses and stored snapshots. Uses
+orjson when it is installed, which decodes large task lists faster than the
+standard library, and falls back to the json module otherwise. Other decoders can be registered under a name and selected at
+runtime.
+
+Decoding a large document with the json module allocates hundreds of
+thousands of containers, which repeatedly triggers the cyclic garbage
+collector although none of them can be garbage yet; the collector is paused
+while such documents are decoded. orjson gains nothing from the pause and
+decodes with the collector running.
+"""
+
+import gc
+import json
+import logging
+import threading
+from contextlib import contextmanager
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# name -> loads(bytes-like or str) callable
+_decoders = {"json": json.loads}
+if orjson is not None:
+    _decoders["orjson"] = orjson.loads
+
+_lock = threading.Lock()
+_current = "orjson" if orjson is not None else "json"
+_loads = _decoders[_current]
+
+# Documents at least this large (bytes) are decoded with the garbage collector
+# paused when the json module decodes them. The pause is process-wide: while
+# any such decode runs, no thread (the GUI thread included) collects cycles.
+GC_PAUSE_MIN_SIZE = 1024 * 1024
+
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+def register_decoder(name, loads):
+    """
+    Register a decoder.
+
+    Args:
+        name (str): Name to select the decoder by.
+        loads (callable): Takes bytes, bytearray or str and returns the
+            decoded value; must raise ValueError on malformed input.
+    """
+    with _lock:
+        _decoders[name] = loads
+
+
+def available_decoders():
+    """Return the names of the registered decoders."""
+    with _lock:
+        return list(_decoders)
+
+
+def set_decoder(name):
+    """
+    Select the decoder used by loads().
+
+    Raises:
+        ValueError: If no decoder is registered under name.
+    """
+    global _current, _loads
+    with _lock:
+        if name not in _decoders:
+            raise ValueError(f"Unknown JSON decoder '{name}'; available: {', '.join(_decoders)}")
+        _current, _loads = name, _decoders[name]
+    logger.info(f"JSON decoder set to '{name}'.")
+
+
+def decoder_name():
+    """Return the name of the decoder in use."""
+    return _current
+
+
+def loads(data):
+    """
+    Decode a JSON document with the selected decoder.
+
+    Args:
+        data (bytes | bytearray | str): UTF-8 encoded document or text.
+
+    Raises:
+        ValueError: If the document is malformed.
+    """
+    decode = _loads
+    if decode is not json.loads or len(data) < GC_PAUSE_MIN_SIZE:
+        return decode(data)
+    with _gc_paused():
+        return decode(data)
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Disable the cyclic garbage collector, for the whole process, for the
+    block. Pauses from several threads nest; the collector is re-enabled
+    when the last one ends.
+    """
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
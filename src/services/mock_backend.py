@@ -0,0 +1,712 @@
+"""
+mock_backend.py
+
+A local stand-in for the pipeline backend, serving synthetic project data on
+the same API as the real server. Used for development and for measuring the
+data layer (bytes on the wire, conditional requests, ...).
+
+Besides the JSON endpoints it serves a Server-Sent Events stream at
+GET /api/events?project_name=<name>, publishing task changes, deletions and
+new task log entries as they happen.
+
+Usage:
+    python -m services.mock_backend [--port 5000] [--tasks 2000]
+    python -m services.mock_backend --measure
+    python -m services.mock_backend --measure-transport --tasks 50000
+    python -m services.mock_backend --churn 2   # change a random task every 2 seconds
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import queue
+import random
+import threading
+import time
+import zlib
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+
+from services.constants import (
+    TASK_NAME, TASK_STATUS, USERNAME, DATE, COMMENT, STATUS_COLOR,
+    WORK_APP, WORK_VERSION, WORK_SIZE, WORK_DATE, PREVIEW_PATH,
+    TYPE, LABEL, ID, OPTIONS
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_TASK_COUNT = 2000
+
+# Bodies smaller than this are sent uncompressed.
+COMPRESSION_MIN_SIZE = 1024
+# Content codings the server can produce, most preferred first.
+_ENCODERS = {}
+if zstandard is not None:
+    _ENCODERS["zstd"] = lambda body: zstandard.ZstdCompressor(level=3).compress(body)
+if brotli is not None:
+    _ENCODERS["br"] = lambda body: brotli.compress(body, quality=4)
+_ENCODERS["gzip"] = lambda body: gzip.compress(body, compresslevel=6, mtime=0)
+_ENCODERS["deflate"] = lambda body: zlib.compress(body, 6)
+
+TASK_STATUS_COLORS = {
+    "NYS": "#2b4463",
+    "WIP": "#c58b00",
+    "WFA": "#d9822b",
+    "RTK": "#b3261e",
+    "APP": "#2e7d32",
+}
+DEPARTMENTS = ["lay", "anm", "lgt", "fx", "cmp"]
+ARTISTS = ["John Doe", "Jane Smith", "Michael Brown", "Emily White", "Alice Green"]
+SCENES_PER_EPISODE = 10
+SHOTS_PER_SCENE = 10
+# Seconds between keep-alive comments on idle event streams.
+EVENT_KEEPALIVE_INTERVAL = 15
+
+
+def generate_tasks(project_name, num_tasks):
+    """
+    Generate synthetic tasks named after the studio convention
+    '<prj>_e<episode>_sc<scene>_sh<shot>_<department>'.
+
+    Args:
+        project_name (str): Project the tasks belong to.
+        num_tasks (int): Number of tasks to generate.
+
+    Returns:
+        list: Task dictionaries shaped like the backend's taskData response.
+    """
+    prefix = "".join(ch for ch in project_name.lower() if ch.isalnum())[:3] or "prj"
+    statuses = list(TASK_STATUS_COLORS)
+    tasks = []
+    for index in range(num_tasks):
+        department = DEPARTMENTS[index % len(DEPARTMENTS)]
+        shot_index = index // len(DEPARTMENTS)
+        shot = shot_index % SHOTS_PER_SCENE
+        scene = (shot_index // SHOTS_PER_SCENE) % SCENES_PER_EPISODE
+        episode = shot_index // (SHOTS_PER_SCENE * SCENES_PER_EPISODE)
+        episode_name, scene_name = f"e{episode + 1:03d}", f"sc{scene + 1:03d}"
+        shot_name = f"sh{(shot + 1) * 10:04d}"
+        artist = ARTISTS[index % len(ARTISTS)]
+        status = statuses[(index * 7) % len(statuses)]
+        tasks.append({
+            TASK_NAME: f"{prefix}_{episode_name}_{scene_name}_{shot_name}_{department}",
+            TASK_STATUS: status,
+            "department": department,
+            "shot_detail": {
+                "shot": shot_name,
+                "frame_in": 1001,
+                "frame_out": 1001 + 24 * (1 + index % 8),
+                "artist_assigned": {
+                    "employee": {
+                        "employee_id": ARTISTS.index(artist) + 1,
+                        "employee_name": artist,
+                        "email": f"{artist.split()[0].lower()}@studio.local",
+                    }
+                },
+                "status": status,
+            },
+            "sequence_details": {"name": scene_name, "episode": episode_name, "fps": 24},
+            "episode_details": {"name": episode_name, "project": project_name},
+            "references": [
+                f"//server/{project_name}/{episode_name}/{scene_name}/{shot_name}/ref_{n:02d}.jpg"
+                for n in range(1, 3)
+            ],
+            "work_files": [
+                {WORK_APP: "Maya", WORK_VERSION: f"v{v:03d}", WORK_SIZE: f"{40 + v} MB",
+                 WORK_DATE: "01-02-2024 10:30"}
+                for v in range(1, 3)
+            ],
+        })
+    return tasks
+
+
+class MockBackend:
+    """
+    In-memory backend state and request routing, independent of HTTP.
+    """
+
+    def __init__(self, num_tasks=DEFAULT_TASK_COUNT, latency=0.0, failure_rate=0.0, compression=True):
+        """
+        Args:
+            num_tasks (int): Tasks generated per project.
+            latency (float): Seconds every request is delayed, to simulate a remote server.
+            failure_rate (float): Fraction of requests answered with 503, to simulate overload.
+            compression (bool): Compress responses with the client's preferred coding.
+        """
+        self.num_tasks = num_tasks
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._projects = {}
+        self._task_logs = {}
+        self._subscribers = {}
+        self.stats = {"requests": 0, "bytes_sent": 0, "not_modified": 0, "events_published": 0, "failed": 0}
+
+    # ------------------------------
+    # Project state
+    # ------------------------------
+
+    def project(self, project_name):
+        """
+        Return the state of a project, generating it on first access.
+        """
+        with self._lock:
+            if project_name not in self._projects:
+                self._projects[project_name] = {
+                    "tasks": generate_tasks(project_name, self.num_tasks),
+                    "modified": time.time(),
+                    # Change tracking for delta sync: every change bumps the
+                    # revision and records it against the task name.
+                    "revision": 0,
+                    "changed": {},
+                    "deleted": {},
+                }
+            return self._projects[project_name]
+
+    def _record_change(self, project, task_name, deleted=False):
+        project["revision"] += 1
+        project["modified"] = time.time()
+        if deleted:
+            project["changed"].pop(task_name, None)
+            project["deleted"][task_name] = project["revision"]
+        else:
+            project["deleted"].pop(task_name, None)
+            project["changed"][task_name] = project["revision"]
+
+    def update_task(self, project_name, task_name, **fields):
+        """
+        Change fields of a task, marking the project as modified.
+
+        Returns:
+            dict or None: The updated task, or None if it does not exist.
+        """
+        project = self.project(project_name)
+        with self._lock:
+            for task in project["tasks"]:
+                if task[TASK_NAME] == task_name:
+                    task.update(fields)
+                    self._record_change(project, task_name)
+                    break
+            else:
+                return None
+        self.publish(project_name, "task", {"task": task})
+        return task
+
+    def add_task(self, project_name, task):
+        """
+        Add a task to a project.
+        """
+        project = self.project(project_name)
+        with self._lock:
+            project["tasks"].append(task)
+            self._record_change(project, task[TASK_NAME])
+        self.publish(project_name, "task", {"task": task})
+
+    def delete_task(self, project_name, task_name):
+        """
+        Remove a task from a project.
+
+        Returns:
+            bool: True if the task existed.
+        """
+        project = self.project(project_name)
+        with self._lock:
+            for index, task in enumerate(project["tasks"]):
+                if task[TASK_NAME] == task_name:
+                    del project["tasks"][index]
+                    self._record_change(project, task_name, deleted=True)
+                    break
+            else:
+                return False
+        self.publish(project_name, "task_deleted", {"task_name": task_name})
+        return True
+
+    def task_logs(self, task_name):
+        """
+        Return the log entries of a task, newest first.
+        """
+        with self._lock:
+            return list(self._task_logs.get(task_name, [
+                {TASK_STATUS: "WIP", USERNAME: ARTISTS[0], DATE: "01-12 14:00",
+                 COMMENT: "Work in progress.", STATUS_COLOR: TASK_STATUS_COLORS["WIP"]},
+            ]))
+
+    def add_task_log(self, project_name, task_name, entry):
+        """
+        Add a log entry to a task and publish it to subscribers.
+        """
+        logs = self.task_logs(task_name)
+        logs.insert(0, entry)
+        with self._lock:
+            self._task_logs[task_name] = logs
+        self.publish(project_name, "task_log", {"task_name": task_name, "entry": entry})
+
+    def set_task_status(self, project_name, task_name, status, username=ARTISTS[0], comment=""):
+        """
+        Change the status of a task the way a supervisor would: update the
+        task and add a matching log entry.
+        """
+        task = self.update_task(project_name, task_name, **{TASK_STATUS: status})
+        if task is None:
+            return None
+        self.add_task_log(project_name, task_name, {
+            TASK_STATUS: status, USERNAME: username, DATE: time.strftime("%m-%d %H:%M"),
+            COMMENT: comment or f"Status set to {status}.",
+            STATUS_COLOR: TASK_STATUS_COLORS.get(status),
+        })
+        return task
+
+    # ------------------------------
+    # Event stream
+    # ------------------------------
+
+    def subscribe(self, project_name):
+        """
+        Register a subscriber to a project's events.
+
+        Returns:
+            queue.Queue: Receives (event id, event type, data) tuples.
+        """
+        subscriber = queue.Queue()
+        with self._lock:
+            self._subscribers.setdefault(project_name, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, project_name, subscriber):
+        """Remove a subscriber registered with subscribe()."""
+        with self._lock:
+            self._subscribers.get(project_name, set()).discard(subscriber)
+
+    def publish(self, project_name, event_type, data):
+        """
+        Send an event to every subscriber of a project.
+        """
+        data = dict(data, project_name=project_name)
+        with self._lock:
+            project = self._projects.get(project_name)
+            event_id = str(project["revision"]) if project else None
+            subscribers = list(self._subscribers.get(project_name, ()))
+            self.stats["events_published"] += 1
+        for subscriber in subscribers:
+            subscriber.put((event_id, event_type, data))
+
+    # ------------------------------
+    # Routing
+    # ------------------------------
+
+    @staticmethod
+    def _project_name(payload):
+        if isinstance(payload, dict):
+            return payload.get("project_name", "DemoProject")
+        return payload or "DemoProject"
+
+    @staticmethod
+    def _project_fields(payload, tasks):
+        """Apply the request's 'fields' mask, if any, to task records."""
+        fields = payload.get("fields") if isinstance(payload, dict) else None
+        if not fields:
+            return tasks
+        return [{field: task[field] for field in fields if field in task} for task in tasks]
+
+    def handle(self, endpoint, payload):
+        """
+        Resolve a request.
+
+        Returns:
+            tuple: (status code, response body, last modified timestamp or None).
+        """
+        handler = getattr(self, f"_handle_{endpoint.replace('/', '_')}", None)
+        if handler is None:
+            return 404, {"error": f"Unknown endpoint '{endpoint}'"}, None
+        return handler(payload)
+
+    def _handle_auth_login(self, payload):
+        return 200, {"status": "success"}, None
+
+    def _handle_formUiData(self, payload):
+        return 200, [
+            {ID: "location", LABEL: "Select Office Location", OPTIONS: ["Pune", "Thrissur"],
+             TYPE: "combobox"},
+            {ID: "work_mode", LABEL: "Select Work Mode", OPTIONS: ["Office", "Work from Home"],
+             TYPE: "combobox"},
+        ], None
+
+    def _handle_projects(self, payload):
+        return 200, [
+            {"name": "DemoProject", "type": "Series"},
+            {"name": "Testing Project", "type": "Feature"},
+        ], None
+
+    def _handle_taskData(self, payload):
+        project = self.project(self._project_name(payload))
+        return 200, self._project_fields(payload, project["tasks"]), project["modified"]
+
+    def _handle_taskData_records(self, payload):
+        project = self.project(self._project_name(payload))
+        names = set(payload.get("names") or ())
+        records = [task for task in project["tasks"] if task[TASK_NAME] in names]
+        return 200, self._project_fields(payload, records), None
+
+    def _handle_taskData_page(self, payload):
+        project = self.project(self._project_name(payload))
+        start = int(payload.get("cursor") or 0)
+        limit = max(int(payload.get("limit") or 500), 1)
+        tasks = project["tasks"]
+        end = min(start + limit, len(tasks))
+        return 200, {
+            "items": self._project_fields(payload, tasks[start:end]),
+            "next_cursor": str(end) if end < len(tasks) else None,
+            "total": len(tasks),
+        }, None
+
+    def _handle_taskData_delta(self, payload):
+        project = self.project(self._project_name(payload))
+        with self._lock:
+            cursor = str(project["revision"])
+            if payload.get("since") is None:
+                return 200, {"changed": [], "deleted": [], "cursor": cursor}, None
+            since = int(payload["since"])
+            changed_names = {name for name, rev in project["changed"].items() if rev > since}
+            return 200, {
+                "changed": self._project_fields(
+                    payload, [task for task in project["tasks"] if task[TASK_NAME] in changed_names]
+                ),
+                "deleted": [name for name, rev in project["deleted"].items() if rev > since],
+                "cursor": cursor,
+            }, None
+
+    def _handle_taskStatus(self, payload):
+        return 200, TASK_STATUS_COLORS, None
+
+    def _handle_episodes(self, payload):
+        project = self.project(self._project_name(payload))
+        episodes = sorted({task["episode_details"]["name"] for task in project["tasks"]})
+        return 200, episodes, project["modified"]
+
+    def _handle_scenes(self, payload):
+        project = self.project(self._project_name(payload))
+        scenes = sorted({task["sequence_details"]["name"] for task in project["tasks"]})
+        return 200, scenes, project["modified"]
+
+    def _handle_tasks(self, payload):
+        return 200, DEPARTMENTS, None
+
+    def _handle_workFiles(self, payload):
+        work_files = payload.get("work_files") if isinstance(payload, dict) else None
+        return 200, work_files or [
+            {WORK_APP: "Maya", WORK_VERSION: "v001", WORK_SIZE: "41 MB", WORK_DATE: "01-02-2024 10:30"}
+        ], None
+
+    def _handle_workDetails(self, payload):
+        return 200, {
+            "File Name": payload.get(WORK_VERSION, "") if isinstance(payload, dict) else "",
+            "File Type": payload.get(WORK_APP, "") if isinstance(payload, dict) else "",
+            PREVIEW_PATH: "",
+        }, None
+
+    def _handle_fileDetails(self, payload):
+        return 200, {PREVIEW_PATH: ""}, None
+
+    def _handle_TaskDetail(self, payload):
+        return 200, {"Task Name": payload, "Frame Range": "1001-1100", PREVIEW_PATH: ""}, None
+
+    def _handle_TaskLog(self, payload):
+        return 200, self.task_logs(payload), None
+
+    def _handle_batch(self, payload):
+        responses = {}
+        for request in payload.get("requests", []):
+            status, body, _ = self.handle(request["endpoint"], request.get("data"))
+            if status != 200:
+                return status, body, None
+            responses[request["id"]] = body
+        return 200, {"responses": responses}, None
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    backend = None  # Set by MockBackendServer
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        payload = json.loads(raw_body) if raw_body else None
+
+        path, _, query = self.path.partition("?")
+        endpoint = path.split("/api/", 1)[-1]
+        if endpoint == "events":
+            self._stream_events(parse_qs(query).get("project_name", ["DemoProject"])[0])
+            return
+        if self.backend.latency:
+            time.sleep(self.backend.latency)
+        if self.backend.failure_rate and random.random() < self.backend.failure_rate:
+            self.backend.stats["failed"] += 1
+            self._send(503, b'{"error":"overloaded"}', {"Content-Type": "application/json", "Retry-After": "1"})
+            return
+        status, body, modified = self.backend.handle(endpoint, payload)
+        encoded = json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+        headers = {"Content-Type": "application/json"}
+        if status == 200:
+            headers["ETag"] = f'"{hashlib.sha1(encoded).hexdigest()}"'
+            if modified is not None:
+                headers["Last-Modified"] = formatdate(modified, usegmt=True)
+            if self._not_modified(headers, modified):
+                self.backend.stats["not_modified"] += 1
+                self._send(304, b"", headers)
+                return
+        encoded = self._compress(encoded, headers)
+        self._send(status, encoded, headers)
+
+    def _compress(self, body, headers):
+        """
+        Compress a body with the first coding the client accepts, adding
+        the matching Content-Encoding header.
+        """
+        headers["Vary"] = "Accept-Encoding"
+        if not self.backend.compression or len(body) < COMPRESSION_MIN_SIZE:
+            return body
+        accepted = {
+            coding.split(";")[0].strip().lower()
+            for coding in self.headers.get("Accept-Encoding", "").split(",")
+        }
+        for coding, compress in _ENCODERS.items():
+            if coding in accepted:
+                headers["Content-Encoding"] = coding
+                return compress(body)
+        return body
+
+    def _not_modified(self, headers, modified):
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return if_none_match == headers["ETag"]
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since and modified is not None:
+            try:
+                return int(modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _stream_events(self, project_name):
+        """
+        Serve a project's events as text/event-stream until the client leaves.
+        """
+        subscriber = self.backend.subscribe(project_name)
+        self.close_connection = True
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(b": connected\n\n")
+            self.wfile.flush()
+            while True:
+                try:
+                    event_id, event_type, data = subscriber.get(timeout=EVENT_KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+                    continue
+                message = f"event: {event_type}\n"
+                if event_id is not None:
+                    message += f"id: {event_id}\n"
+                message += f"data: {json.dumps(data, separators=(',', ':'))}\n\n"
+                self.wfile.write(message.encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            logger.debug(f"Event stream client for '{project_name}' disconnected.")
+        finally:
+            self.backend.unsubscribe(project_name, subscriber)
+
+    def _send(self, status, body, headers):
+        self.backend.stats["requests"] += 1
+        self.backend.stats["bytes_sent"] += len(body)
+        try:
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up on the request (e.g. it was cancelled).
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class MockBackendServer:
+    """
+    Runs a MockBackend over HTTP on a background thread.
+    """
+
+    def __init__(self, backend=None, host="127.0.0.1", port=0):
+        """
+        Args:
+            backend (MockBackend, optional): Backend state; a default one is created if omitted.
+            host (str): Interface to bind.
+            port (int): Port to bind; 0 picks a free port.
+        """
+        self.backend = backend or MockBackend()
+        handler = type("MockRequestHandler", (_RequestHandler,), {"backend": self.backend})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """API base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self):
+        """Start serving on a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _measure_conditional_requests(num_tasks):
+    """
+    Fetch a project's taskData twice, bypassing the response cache, and
+    report what conditional requests saved.
+    """
+    from services import data_service
+
+    server = MockBackendServer(MockBackend(num_tasks)).start()
+    data_service.BASE_URL = server.base_url
+    payload = {"project_name": "DemoProject"}
+    try:
+        for attempt in ("cold", "revalidated"):
+            before = server.backend.stats["bytes_sent"]
+            start = time.perf_counter()
+            data_service.make_request("POST", "taskData", data=payload)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{attempt:>12}: {server.backend.stats['bytes_sent'] - before:>10} bytes sent "
+                  f"in {elapsed:.1f} ms")
+        print(f"conditional stats: {data_service.get_conditional_stats()}")
+    finally:
+        server.stop()
+
+
+def _measure_transport(num_tasks):
+    """
+    Fetch a project's taskData once per content coding and JSON decoder,
+    bypassing both caches, and report bytes on the wire, request time on
+    the loopback interface, the transfer time those bytes would take on a
+    100 Mbit/s link, and pure decode time (best of three).
+    """
+    from services import data_service, json_codec
+    from services.session_pool import SUPPORTED_ENCODINGS
+
+    server = MockBackendServer(MockBackend(num_tasks)).start()
+    data_service.BASE_URL = server.base_url
+    data_service.CONDITIONAL_REQUESTS = False
+    payload = {"project_name": "DemoProject"}
+    codings = ["identity"] + [coding for coding in SUPPORTED_ENCODINGS.split(",") if coding in _ENCODERS]
+    print(f"{num_tasks} tasks; decoders: {', '.join(json_codec.available_decoders())}")
+    try:
+        server.backend.project("DemoProject")
+        raw_body = json.dumps(server.backend.handle("taskData", payload)[1], separators=(",", ":")).encode()
+        for decoder in json_codec.available_decoders():
+            json_codec.set_decoder(decoder)
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                json_codec.loads(raw_body)
+                timings.append(time.perf_counter() - start)
+            print(f"{decoder:>8} decode of {len(raw_body)} bytes: {min(timings) * 1000:.1f} ms")
+
+        print(f"{'coding':>8} {'decoder':>8} {'wire bytes':>12} {'ratio':>6} {'request ms':>11} {'100Mbit ms':>11}")
+        for coding in codings:
+            data_service.configure_session(accept_encoding=coding)
+            for decoder in json_codec.available_decoders():
+                json_codec.set_decoder(decoder)
+                data_service.make_request("POST", "taskData", data=payload)  # Warm the connection
+                before = data_service.get_connection_stats()
+                start = time.perf_counter()
+                data_service.make_request("POST", "taskData", data=payload)
+                elapsed = (time.perf_counter() - start) * 1000
+                after = data_service.get_connection_stats()
+                wire = after["wire_bytes"] - before["wire_bytes"]
+                decoded = after["decoded_bytes"] - before["decoded_bytes"]
+                link_ms = wire * 8 / 100e6 * 1000
+                print(f"{coding:>8} {decoder:>8} {wire:>12} {wire / decoded:>6.2f} {elapsed:>11.1f} {link_ms:>11.1f}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the pipeline backend.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASK_COUNT, help="Tasks per project.")
+    parser.add_argument("--measure", action="store_true",
+                        help="Measure conditional request savings instead of serving.")
+    parser.add_argument("--measure-transport", action="store_true",
+                        help="Measure bytes on the wire and decode time per coding and decoder.")
+    parser.add_argument("--no-compression", action="store_true",
+                        help="Always send uncompressed responses.")
+    parser.add_argument("--latency", type=float, default=0,
+                        help="Seconds to delay every response.")
+    parser.add_argument("--failure-rate", type=float, default=0,
+                        help="Fraction of requests to fail with 503 Service Unavailable.")
+    parser.add_argument("--churn", type=float, default=0,
+                        help="Change the status of a random DemoProject task every N seconds.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.measure:
+        _measure_conditional_requests(args.tasks)
+    elif args.measure_transport:
+        _measure_transport(args.tasks)
+    else:
+        mock_server = MockBackendServer(
+            MockBackend(args.tasks, args.latency, args.failure_rate, compression=not args.no_compression),
+            args.host, args.port
+        ).start()
+        print(f"Mock backend serving on {mock_server.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                if args.churn:
+                    time.sleep(args.churn)
+                    demo_tasks = mock_server.backend.project("DemoProject")["tasks"]
+                    mock_server.backend.set_task_status(
+                        "DemoProject", random.choice(demo_tasks)[TASK_NAME],
+                        random.choice(list(TASK_STATUS_COLORS)), username="Supervisor"
+                    )
+                else:
+                    time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"Stats: {mock_server.backend.stats}")
+            mock_server.stop()
@@ -0,0 +1,113 @@
+"""
+naming_convention.py
+
+Provides NamingConvention, which parses task names following the studio
+naming convention into their fields, e.g.
+
+    prj_e014_sc001_sh0010_lay -> project prj, episode e014, scene sc001, shot sh0010, task lay
+    HL_BGL_Sc0910_Sh0010      -> project hl, task bgl, scene sc0910, shot sh0010
+
+A convention is compiled once from name templates such as
+"{project}_{episode}_{scene}_{shot}_{task}" and a regular expression per
+field; the first template matching a name wins. Names and fields are
+lower-cased, so fields compare exactly with selection values (e.g. scene
+"sc0010" does not match "sc00100").
+"""
+
+import logging
+import re
+from typing import Dict, Mapping, Optional, Sequence
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Pattern of each field (lower-case).
+FIELD_PATTERNS = {
+    "project": r"[a-z0-9]+",
+    "episode": r"e\d+",
+    "scene": r"(?:sc|sq|seq)\d+",
+    "shot": r"sh\d+",
+    "task": r"[a-z][a-z0-9]*",
+}
+
+# Name templates, tried in order.
+NAME_TEMPLATES = (
+    "{project}_{episode}_{scene}_{shot}_{task}",   # prj_e014_sc001_sh0010_lay
+    "{project}_{episode}_{scene}_{shot}",          # prj_e014_sc001_sh0010
+    "{project}_{scene}_{shot}_{task}",             # prj_sq0910_sh0562_abc
+    "{project}_{task}_{scene}_{shot}",             # HL_BGL_Sc0910_Sh0010
+)
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+class NamingConvention:
+    """
+    Compiled naming convention.
+
+    Attributes:
+        templates (tuple): The name templates, in the order they are tried.
+        fields (tuple): Every field the templates can extract.
+    """
+
+    def __init__(self, templates: Sequence[str] = NAME_TEMPLATES,
+                 field_patterns: Mapping[str, str] = FIELD_PATTERNS):
+        """
+        Compile a naming convention.
+
+        Args:
+            templates (Sequence[str]): Name templates; '{field}' placeholders
+                are replaced with the field's pattern, the rest is literal.
+            field_patterns (Mapping[str, str]): Regular expression of each field.
+
+        Raises:
+            ValueError: If a template uses a field without a pattern.
+        """
+        self.templates = tuple(templates)
+        self._patterns = [self._compile(template, field_patterns) for template in self.templates]
+        self.fields = tuple(dict.fromkeys(
+            field for pattern in self._patterns for field in pattern.groupindex
+        ))
+
+    @staticmethod
+    def _compile(template, field_patterns):
+        parts = []
+        position = 0
+        for placeholder in _PLACEHOLDER.finditer(template):
+            field = placeholder.group(1)
+            if field not in field_patterns:
+                raise ValueError(f"Naming template '{template}' uses unknown field '{field}'.")
+            parts.append(re.escape(template[position:placeholder.start()]))
+            parts.append(f"(?P<{field}>{field_patterns[field]})")
+            position = placeholder.end()
+        parts.append(re.escape(template[position:]))
+        return re.compile("".join(parts))
+
+    def parse(self, name: str) -> Optional[Dict[str, str]]:
+        """
+        Return the fields of a task name (lower-cased), or None if the name
+        does not follow the convention.
+        """
+        name = name.lower()
+        for pattern in self._patterns:
+            match = pattern.fullmatch(name)
+            if match:
+                return match.groupdict()
+        return None
+
+
+naming_convention = NamingConvention()
+
+
+if __name__ == "__main__":
+    import timeit
+
+    from services.mock_backend import generate_tasks
+
+    for name in ("prj_e014_sc001_sh0010_lay", "HL_BGL_Sc0910_Sh0010", "prj_e410_SC010_sh0145_bgl",
+                 "prj_sq0910_sh0562_abc", "prj_SEQ0450_SH1480_cmp", "Animate Scene 1"):
+        print(f"{name:>28}: {naming_convention.parse(name)}")
+
+    names = [task["name"] for task in generate_tasks("DemoProject", 100_000)]
+    seconds = min(timeit.repeat(lambda: [naming_convention.parse(name) for name in names], number=1, repeat=3))
+    print(f"Parsed {len(names)} names in {seconds * 1000:.0f} ms")
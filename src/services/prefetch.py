@@ -0,0 +1,226 @@
+"""
+prefetch.py
+
+Provides the Prefetcher class, which warms the response cache with data the
+user is likely to open next: the complete records, work files, details and
+logs of the tasks around the selected one, and the details of the newest
+work file of the selected task. Prefetches run on a small low-priority thread pool in the
+scheduler's prefetch class and are dropped, or aborted mid-request, as soon
+as the selection moves on.
+"""
+
+import logging
+import threading
+
+from PySide6.QtCore import QRunnable, QThread, QThreadPool
+
+from services import data_service
+from services.task_records import task_records
+from services.request_scheduler import CancellationToken, Priority, request_context
+from services.constants import TASK_NAME, WORK_VERSION
+from handlers.error_handler import BackendError, MissingKeyError, RequestCancelledError
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Tasks warmed on each side of the selected one.
+PREFETCH_NEIGHBOURS = 3
+# Threads used for prefetching; kept small so prefetches never crowd out
+# requests made for what the user is looking at.
+PREFETCH_THREADS = 2
+
+
+def newest_work_file(work_files):
+    """
+    Return the work file with the highest version, or None.
+
+    Args:
+        work_files (list): Work file dictionaries as returned by get_workFiles.
+    """
+    if not work_files:
+        return None
+    return max(work_files, key=lambda work_file: work_file.get(WORK_VERSION, ""))
+
+
+class _PrefetchRunnable(QRunnable):
+    """Runs one prefetch job unless its group has moved on."""
+
+    def __init__(self, prefetcher, group, generation, token, func, args):
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.group = group
+        self.generation = generation
+        self.token = token
+        self.func = func
+        self.args = args
+
+    def run(self):
+        self.prefetcher._run_job(self.group, self.generation, self.token, self.func, self.args)
+
+
+class Prefetcher:
+    """
+    Schedules cache-warming requests in cancellable groups.
+
+    Each group (e.g. one per task list) has a generation number and a
+    cancellation token; scheduling new jobs for a group bumps the generation
+    and cancels the token, so queued jobs of an older generation are skipped
+    and running ones abort their requests.
+    """
+
+    def __init__(self, max_threads=PREFETCH_THREADS, neighbours=PREFETCH_NEIGHBOURS):
+        """
+        Initialize the Prefetcher.
+
+        Args:
+            max_threads (int): Threads of the prefetch pool.
+            neighbours (int): Tasks warmed on each side of the selected task.
+        """
+        self.neighbours = neighbours
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._generations = {}
+        self._tokens = {}
+        self._stats = {"scheduled": 0, "completed": 0, "skipped": 0, "cancelled": 0, "failed": 0}
+
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_threads)
+        if hasattr(self._pool, "setThreadPriority"):
+            self._pool.setThreadPriority(QThread.LowPriority)
+
+    # ------------------------------
+    # Scheduling
+    # ------------------------------
+
+    def schedule(self, group, jobs):
+        """
+        Replace the pending jobs of a group.
+
+        Args:
+            group (str): Group to schedule in; older jobs of the group are cancelled.
+            jobs (list): (func, args) tuples, in the order they should run.
+        """
+        generation = self.cancel(group)
+        if not self.enabled:
+            return
+        with self._lock:
+            self._stats["scheduled"] += len(jobs)
+            token = self._tokens[group]
+        for func, args in jobs:
+            self._pool.start(_PrefetchRunnable(self, group, generation, token, func, args))
+
+    def cancel(self, group=None):
+        """
+        Cancel the pending and running jobs of a group, or of every group.
+
+        Returns:
+            int: The group's new generation.
+        """
+        with self._lock:
+            groups = list(self._generations) if group is None else [group]
+            cancelled = [self._tokens.get(name) for name in groups]
+            for name in groups:
+                self._generations[name] = self._generations.get(name, 0) + 1
+                self._tokens[name] = CancellationToken()
+            generation = self._generations.get(group, 0)
+        for token in cancelled:
+            if token is not None:
+                token.cancel()
+        return generation
+
+    def _is_current(self, group, generation):
+        with self._lock:
+            return self._generations.get(group) == generation
+
+    def _run_job(self, group, generation, token, func, args):
+        if not self._is_current(group, generation):
+            with self._lock:
+                self._stats["skipped"] += 1
+            return
+        try:
+            with request_context(Priority.PREFETCH, token):
+                func(*args)
+            outcome = "completed"
+        except RequestCancelledError:
+            outcome = "cancelled"
+        except (BackendError, MissingKeyError) as ex:
+            logger.debug(f"Prefetch {func.__name__}{args!r:.80} failed: {ex}")
+            outcome = "failed"
+        except Exception as ex:
+            logger.warning(f"Unexpected prefetch error in {func.__name__}: {ex}", exc_info=True)
+            outcome = "failed"
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def wait(self, timeout_ms=-1):
+        """Block until the pool is idle (for tests and benchmarks)."""
+        return self._pool.waitForDone(timeout_ms)
+
+    def stats(self):
+        """Return the number of jobs scheduled, completed, skipped, cancelled and failed."""
+        with self._lock:
+            return dict(self._stats)
+
+    # ------------------------------
+    # Task prefetching
+    # ------------------------------
+
+    def prefetch_work_area(self, project_name, task_data, neighbours):
+        """
+        Warm the Work Area data of a selected task and its neighbours: the
+        newest work file's details for the selected task, and the complete
+        records and work file lists of the neighbouring tasks.
+
+        Args:
+            project_name (str): Project of the tasks.
+            task_data (dict): The selected task.
+            neighbours (list): Neighbouring tasks, nearest first.
+        """
+        jobs = [(self._warm_newest_work_file, (project_name, task_data))]
+        if neighbours:
+            # One request hydrates every neighbour before their work files are warmed.
+            jobs.append((self._warm_task_records, (project_name, neighbours)))
+        jobs += [(self._warm_work_files, (project_name, task)) for task in neighbours]
+        self.schedule("work", jobs)
+
+    def prefetch_review_area(self, task_name, neighbours):
+        """
+        Warm the Review Area details and logs of a focused task and its
+        neighbours.
+
+        Args:
+            task_name (str): The focused task.
+            neighbours (list): Neighbouring tasks, nearest first.
+        """
+        jobs = []
+        for name in [task_name] + [task[TASK_NAME] for task in neighbours]:
+            jobs.append((self._warm_task_detail, (name,)))
+            jobs.append((self._warm_task_log, (name,)))
+        self.schedule("review", jobs)
+
+    @staticmethod
+    def _warm_task_records(project_name, tasks):
+        task_records.hydrate_many(project_name, tasks)
+
+    @staticmethod
+    def _warm_work_files(project_name, task_data):
+        data_service.get_workFiles(task_records.hydrate(project_name, task_data), silent=True)
+
+    @staticmethod
+    def _warm_newest_work_file(project_name, task_data):
+        record = task_records.hydrate(project_name, task_data)
+        work_file = newest_work_file(data_service.get_workFiles(record, silent=True))
+        if work_file:
+            data_service.get_workDetails(work_file, silent=True)
+            data_service.get_fileDetails(work_file, silent=True)
+
+    @staticmethod
+    def _warm_task_detail(task_name):
+        data_service.get_taskDetail(task_name, silent=True)
+
+    @staticmethod
+    def _warm_task_log(task_name):
+        data_service.get_taskLog(task_name, silent=True)
+
+
+prefetcher = Prefetcher()
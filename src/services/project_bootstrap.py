@@ -0,0 +1,252 @@
+"""
+project_bootstrap.py
+
+Loads everything needed to open a project (tasks, task statuses, episodes,
+scenes and task types) in a single step. The requests are sent as one
+batched call when the backend supports it, otherwise in parallel, and the
+result is returned as an immutable ProjectSnapshot shared by all areas.
+
+Callers that can display tasks incrementally may stream them page by page
+instead; the project metadata is then reported before the first page.
+"""
+
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+from services import data_service
+from services.entity_store import entity_store
+from services.constants import TASK_NAME, TASK_STATUS
+from handlers.error_handler import BackendError, MissingKeyError, validate_json_keys
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Set to False to always use parallel individual requests.
+USE_BATCH_ENDPOINT = True
+
+# Status codes meaning the backend has no batch endpoint.
+_BATCH_UNSUPPORTED_CODES = (404, 405, 501)
+
+# None until the first attempt tells us whether batching works.
+_batch_supported = None
+
+# None until the first attempt tells us whether taskData can be paged.
+_paging_supported = None
+
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """
+    Immutable view of the data needed to open a project.
+    """
+    project_name: str
+    tasks: Tuple[dict, ...]
+    task_status: Mapping[str, str]
+    episodes: Tuple[str, ...]
+    scenes: Tuple[str, ...]
+    task_types: Tuple[str, ...]
+
+
+def _bootstrap_requests(project_name, include_tasks=True):
+    """
+    Return (id, endpoint, payload, fetch function) for every bootstrap request.
+    """
+    project_data = {"project_name": project_name}
+    # The batch path sends the payload itself, so it carries the list mask too.
+    task_data = data_service.with_fields(project_data, data_service.TASK_LIST_FIELDS)
+    task_requests = [
+        ("taskData", "taskData", task_data, lambda: data_service.get_taskData(project_data)),
+    ] if include_tasks else []
+    return task_requests + [
+        ("taskStatus", "taskStatus", project_data, lambda: data_service.get_taskStatus(project_data)),
+        ("episodes", "episodes", project_data, lambda: data_service.get_episodes(project_name)),
+        ("scenes", "scenes", project_data, lambda: data_service.get_scenes(project_name)),
+        ("tasks", "tasks", project_data, lambda: data_service.get_tasks(project_name)),
+    ]
+
+
+def _fetch_batched(requests_list):
+    """
+    Fetch all bootstrap data with one batch request.
+
+    Returns:
+        dict or None: Responses keyed by request id, or None if the backend
+        does not support batching.
+    """
+    global _batch_supported
+    try:
+        response = data_service.get_batch([
+            {"id": request_id, "endpoint": endpoint, "data": payload}
+            for request_id, endpoint, payload, _ in requests_list
+        ])
+    except BackendError as be:
+        if be.status_code in _BATCH_UNSUPPORTED_CODES:
+            logger.info("Backend does not support batch requests; using parallel requests.")
+            _batch_supported = False
+        else:
+            logger.warning(f"Batch bootstrap request failed, retrying in parallel: {be.message}")
+        return None
+    except MissingKeyError:
+        logger.info("Backend returned an unexpected batch response; using parallel requests.")
+        _batch_supported = False
+        return None
+
+    responses = dict(response["responses"])
+    missing = [request_id for request_id, *_ in requests_list if request_id not in responses]
+    if missing:
+        logger.warning(f"Batch response is missing {missing}; retrying in parallel.")
+        return None
+
+    if "taskData" in responses:
+        validate_json_keys(
+            responses["taskData"], [TASK_NAME, TASK_STATUS], "taskData",
+            sample_size=data_service.VALIDATION_SAMPLE_SIZE
+        )
+        responses["taskData"] = data_service.project_task_fields(
+            responses["taskData"], data_service.TASK_LIST_FIELDS
+        )
+    _batch_supported = True
+    return responses
+
+
+def _fetch_parallel(requests_list):
+    """
+    Fetch all bootstrap data with concurrent individual requests.
+
+    Returns:
+        dict: Responses keyed by request id.
+    """
+    with ThreadPoolExecutor(max_workers=len(requests_list), thread_name_prefix="bootstrap") as executor:
+        futures = {
+            # Each request runs in a copy of the caller's context, keeping
+            # its request priority and cancellation token.
+            request_id: executor.submit(contextvars.copy_context().run, fetch)
+            for request_id, _, _, fetch in requests_list
+        }
+        return {request_id: future.result() for request_id, future in futures.items()}
+
+
+def _fetch_responses(requests_list):
+    responses = None
+    if USE_BATCH_ENDPOINT and _batch_supported is not False:
+        responses = _fetch_batched(requests_list)
+    if responses is None:
+        responses = _fetch_parallel(requests_list)
+    return responses
+
+
+def _snapshot_from_responses(project_name, responses, tasks=()):
+    if not responses["taskStatus"]:
+        raise ValueError("Failed to fetch task status.")
+
+    return ProjectSnapshot(
+        project_name=project_name,
+        tasks=tuple(tasks),
+        task_status=MappingProxyType(dict(responses["taskStatus"])),
+        episodes=tuple(responses["episodes"] or ()),
+        scenes=tuple(responses["scenes"] or ()),
+        task_types=tuple(responses["tasks"] or ()),
+    )
+
+
+def _fetch_task_page(project_name, cursor):
+    """
+    Fetch one page of tasks.
+
+    Returns:
+        dict or None: The page, or None if the backend cannot page taskData.
+    """
+    global _paging_supported
+    try:
+        page = data_service.get_taskData_page({"project_name": project_name}, cursor=cursor)
+    except BackendError as be:
+        if cursor is None and be.status_code in _BATCH_UNSUPPORTED_CODES:
+            logger.info("Backend does not support paged taskData; fetching all tasks at once.")
+            _paging_supported = False
+            return None
+        raise
+    _paging_supported = True
+    return page
+
+
+def fetch_project_snapshot(project_name, on_metadata=None, on_page=None):
+    """
+    Fetch all data needed to open a project.
+
+    When on_page is given and the backend supports paging, tasks are streamed
+    page by page: on_metadata receives a snapshot without tasks as soon as the
+    statuses and selection options are known, then on_page is called for every
+    page. Both callbacks run on the calling thread.
+
+    Args:
+        project_name (str): The name of the project.
+        on_metadata (callable, optional): on_metadata(snapshot_without_tasks).
+        on_page (callable, optional): on_page(tasks, loaded_count, total_count).
+
+    Returns:
+        ProjectSnapshot: The project's tasks, statuses and selection options.
+
+    Raises:
+        BackendError: If any request fails.
+        ValueError: If the backend returned no tasks or no statuses.
+    """
+    if on_page is not None and _paging_supported is not False:
+        snapshot = _fetch_streamed(project_name, on_metadata, on_page)
+        if snapshot is not None:
+            return _retain_snapshot_tasks(snapshot)
+
+    responses = _fetch_responses(_bootstrap_requests(project_name))
+    if not responses["taskData"]:
+        raise ValueError("Failed to fetch task data.")
+    # Batched responses bypass get_taskData, so make sure the tasks are the canonical records.
+    tasks = entity_store.upsert_tasks(project_name, responses["taskData"], announce_new=False)
+    snapshot = _snapshot_from_responses(project_name, responses, tasks)
+
+    if on_metadata:
+        on_metadata(replace(snapshot, tasks=()))
+    if on_page:
+        on_page(list(snapshot.tasks), len(snapshot.tasks), len(snapshot.tasks))
+    return _retain_snapshot_tasks(snapshot)
+
+
+def _retain_snapshot_tasks(snapshot):
+    """Drop tasks deleted since the project was last loaded from the entity store."""
+    entity_store.retain_tasks(snapshot.project_name, [task[TASK_NAME] for task in snapshot.tasks])
+    return snapshot
+
+
+def _fetch_streamed(project_name, on_metadata, on_page):
+    """
+    Fetch the metadata and the first task page concurrently, then the
+    remaining pages in order.
+
+    Returns:
+        ProjectSnapshot or None: None if the backend cannot page taskData.
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="bootstrap-page") as executor:
+        first_page = executor.submit(contextvars.copy_context().run, _fetch_task_page, project_name, None)
+        responses = _fetch_responses(_bootstrap_requests(project_name, include_tasks=False))
+        page = first_page.result()
+
+    if page is None:
+        return None
+    if not page["total"]:
+        raise ValueError("Failed to fetch task data.")
+
+    metadata = _snapshot_from_responses(project_name, responses)
+    if on_metadata:
+        on_metadata(metadata)
+
+    tasks = []
+    while True:
+        tasks.extend(page["items"])
+        on_page(page["items"], len(tasks), page["total"])
+        if not page.get("next_cursor") or not page["items"]:
+            break
+        page = _fetch_task_page(project_name, page["next_cursor"])
+
+    return replace(metadata, tasks=tuple(tasks))
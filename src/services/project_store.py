@@ -0,0 +1,189 @@
+"""
+project_store.py
+
+Provides the ProjectStore class, a local SQLite store of the last-known
+ProjectSnapshot per user and project. TaskMancerPage renders the stored
+snapshot immediately on open while a background fetch revalidates it.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from types import MappingProxyType
+
+from services import data_service, json_codec
+from services.project_bootstrap import ProjectSnapshot
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+PROJECT_STORE_PATH = os.path.join(os.path.expanduser("~"), ".pipeline_app", "project_cache.sqlite3")
+
+# Snapshots older than this are ignored on open (seconds).
+MAX_SNAPSHOT_AGE = 7 * 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS project_snapshots (
+    username     TEXT NOT NULL,
+    project_name TEXT NOT NULL,
+    payload      TEXT NOT NULL,
+    saved_at     REAL NOT NULL,
+    PRIMARY KEY (username, project_name)
+)
+"""
+
+
+def snapshot_to_json(snapshot: ProjectSnapshot) -> str:
+    """
+    Serialise a ProjectSnapshot to a JSON string. Only the list fields of the
+    tasks are stored; the records are copied first, as the canonical records
+    of the entity store may be updated by other threads meanwhile.
+    """
+    fields = data_service.TASK_LIST_FIELDS
+    return json.dumps({
+        "project_name": snapshot.project_name,
+        "tasks": [{field: task[field] for field in fields if field in task} for task in snapshot.tasks],
+        "task_status": dict(snapshot.task_status),
+        "episodes": list(snapshot.episodes),
+        "scenes": list(snapshot.scenes),
+        "task_types": list(snapshot.task_types),
+    }, separators=(",", ":"))
+
+
+def snapshot_from_json(payload: str) -> ProjectSnapshot:
+    """Rebuild a ProjectSnapshot from snapshot_to_json output."""
+    data = json_codec.loads(payload)
+    return ProjectSnapshot(
+        project_name=data["project_name"],
+        tasks=tuple(data["tasks"]),
+        task_status=MappingProxyType(data["task_status"]),
+        episodes=tuple(data["episodes"]),
+        scenes=tuple(data["scenes"]),
+        task_types=tuple(data["task_types"]),
+    )
+
+
+class ProjectStore:
+    """
+    SQLite-backed store of project snapshots keyed by (username, project name).
+
+    A connection is opened per operation, so the store can be used from the
+    GUI thread and from data fetch threads alike. The store is only a cache:
+    if it cannot be opened (e.g. a read-only profile directory), loads
+    return None and saves are skipped, rather than failing the caller.
+    """
+
+    def __init__(self, db_path=PROJECT_STORE_PATH, max_age=MAX_SNAPSHOT_AGE):
+        """
+        Initialize the ProjectStore.
+
+        Args:
+            db_path (str): Path of the SQLite database file.
+            max_age (float): Seconds after which stored snapshots are ignored.
+        """
+        self.db_path = db_path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    directory = os.path.dirname(self.db_path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    with sqlite3.connect(self.db_path) as connection:
+                        connection.execute("PRAGMA journal_mode=WAL")
+                        connection.execute(_SCHEMA)
+                    self._initialized = True
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def load(self, username, project_name):
+        """
+        Return the stored snapshot for a user and project.
+
+        Returns:
+            ProjectSnapshot or None: None if nothing usable is stored.
+        """
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT payload, saved_at FROM project_snapshots WHERE username = ? AND project_name = ?",
+                    (username or "", project_name)
+                ).fetchone()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as ex:
+            logger.error(f"Could not read project store '{self.db_path}': {ex}")
+            return None
+
+        if not row:
+            return None
+        payload, saved_at = row
+        if time.time() - saved_at > self.max_age:
+            logger.debug(f"Stored snapshot of '{project_name}' is too old; ignoring it.")
+            return None
+        try:
+            return snapshot_from_json(payload)
+        except (ValueError, KeyError) as ex:
+            logger.warning(f"Discarding unreadable snapshot of '{project_name}': {ex}")
+            self.delete(username, project_name)
+            return None
+
+    def save(self, username, snapshot: ProjectSnapshot):
+        """
+        Store (or replace) the snapshot of a user's project.
+        """
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO project_snapshots (username, project_name, payload, saved_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (username or "", snapshot.project_name, snapshot_to_json(snapshot), time.time())
+                    )
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as ex:
+            logger.error(f"Could not write project store '{self.db_path}': {ex}")
+
+    def delete(self, username, project_name=None):
+        """
+        Delete a user's stored snapshot, or all of them if project_name is omitted.
+        """
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    if project_name is None:
+                        connection.execute(
+                            "DELETE FROM project_snapshots WHERE username = ?", (username or "",)
+                        )
+                    else:
+                        connection.execute(
+                            "DELETE FROM project_snapshots WHERE username = ? AND project_name = ?",
+                            (username or "", project_name)
+                        )
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as ex:
+            logger.error(f"Could not delete from project store '{self.db_path}': {ex}")
+
+
+_project_store = ProjectStore()
+
+
+def load_project_snapshot(username, project_name):
+    """Return the stored snapshot of a user's project, or None."""
+    return _project_store.load(username, project_name)
+
+
+def save_project_snapshot(username, snapshot: ProjectSnapshot):
+    """Store the snapshot of a user's project."""
+    _project_store.save(username, snapshot)
@@ -0,0 +1,279 @@
+"""
+push_channel.py
+
+Provides the PushChannel class, a client for the backend's Server-Sent Events
+stream. It subscribes to the current project and re-emits task changes,
+task deletions and new task log entries as Qt signals, so the UI can patch
+individual rows instead of reloading the project.
+
+The stream is read on a daemon thread. Signals are emitted from that thread
+and delivered to receivers on the GUI thread through queued connections.
+"""
+
+import json
+import logging
+import random
+import socket
+import threading
+
+import requests
+from PySide6.QtCore import QObject, Signal
+
+from services import data_service
+from services.constants import TASK_NAME
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Seconds without any data (events or keep-alive comments) before the
+# connection is considered dead and re-established.
+PUSH_READ_TIMEOUT = 45
+# Reconnect delay bounds (seconds); the delay doubles after each failure.
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+# Status codes meaning the backend has no event stream.
+_PUSH_UNSUPPORTED_CODES = (404, 405, 501)
+
+# Fields each event type must carry, with their types.
+_EVENT_FIELDS = {
+    "task": (("task", dict),),
+    "task_deleted": (("task_name", str),),
+    "task_log": (("task_name", str), ("entry", dict)),
+}
+
+
+def iter_sse_events(lines):
+    """
+    Parse Server-Sent Events from an iterable of decoded lines.
+
+    Args:
+        lines (iterable): Lines of the stream without line terminators.
+
+    Yields:
+        tuple: (event id, event type, data string) for every dispatched event.
+    """
+    event_id, event_type, data = None, "message", []
+    for line in lines:
+        if not line:
+            if data:
+                yield event_id, event_type, "\n".join(data)
+            event_type, data = "message", []
+            continue
+        if line.startswith(":"):
+            continue  # Comment / keep-alive
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            data.append(value)
+        elif field == "event":
+            event_type = value
+        elif field == "id":
+            event_id = value
+
+
+def _iter_stream_lines(response):
+    """
+    Yield the decoded lines of a streamed response as soon as each line is
+    complete. Unlike Response.iter_lines, this does not wait for a full
+    chunk, so small events are not held back.
+    """
+    read = getattr(response.raw, "read1", None) or (lambda amt: response.raw.read(1))
+    pending = b""
+    while True:
+        chunk = read(64 * 1024)
+        if not chunk:
+            return
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def _abort_response(response):
+    """
+    Unblock a thread reading a streamed response. Response.close() would
+    wait for the reader's buffer lock, so the socket is shut down instead.
+    """
+    try:
+        response.raw._fp.fp.raw._sock.shutdown(socket.SHUT_RDWR)
+    except (AttributeError, OSError):
+        logger.debug("Could not shut down the event stream socket; it ends with the next event.")
+
+
+class PushChannel(QObject):
+    """
+    Subscription to the live event stream of one project at a time.
+
+    Signals:
+        task_changed (str, dict): Project name and the new state of a task.
+        task_deleted (str, str): Project name and the name of a removed task.
+        task_log_added (str, str, dict): Project name, task name and the new log entry.
+        connection_changed (bool): True when the stream is (re)connected, False when lost.
+    """
+    task_changed = Signal(str, dict)
+    task_deleted = Signal(str, str)
+    task_log_added = Signal(str, str, dict)
+    connection_changed = Signal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._project_name = None
+        self._stop_event = None
+        self._response = None
+        self._thread = None
+        self._supported = None
+
+    @property
+    def supported(self):
+        """False once the backend has reported it has no event stream."""
+        return self._supported
+
+    @property
+    def project_name(self):
+        """The project currently subscribed to, or None."""
+        return self._project_name
+
+    def subscribe(self, project_name):
+        """
+        Subscribe to the events of a project, replacing any previous subscription.
+
+        Args:
+            project_name (str): The project to follow.
+        """
+        if self._supported is False:
+            return
+        if project_name == self._project_name and self._thread and self._thread.is_alive():
+            return
+        self.unsubscribe()
+
+        logger.info(f"Subscribing to live updates of '{project_name}'.")
+        stop_event = threading.Event()
+        with self._lock:
+            self._project_name = project_name
+            self._stop_event = stop_event
+        self._thread = threading.Thread(
+            target=self._run, args=(project_name, stop_event),
+            name=f"PushChannel-{project_name}", daemon=True
+        )
+        self._thread.start()
+
+    def unsubscribe(self):
+        """
+        Stop following the current project. The connection is aborted so the
+        reader thread ends immediately instead of waiting for the next event.
+        """
+        with self._lock:
+            stop_event, response = self._stop_event, self._response
+            self._project_name = None
+            self._stop_event = None
+            self._response = None
+        if stop_event is None:
+            return
+        logger.debug("Unsubscribing from live updates.")
+        stop_event.set()
+        if response is not None:
+            _abort_response(response)
+
+    # ------------------------------
+    # Reader thread
+    # ------------------------------
+
+    def _run(self, project_name, stop_event):
+        delay = RECONNECT_MIN_DELAY
+        session = requests.Session()
+        try:
+            while not stop_event.is_set():
+                try:
+                    if self._listen(session, project_name, stop_event):
+                        delay = RECONNECT_MIN_DELAY
+                except (requests.RequestException, OSError, ValueError, AttributeError) as ex:
+                    if not stop_event.is_set():
+                        logger.warning(f"Live update stream of '{project_name}' lost: {ex}")
+                if stop_event.is_set() or self._supported is False:
+                    break
+                self.connection_changed.emit(False)
+                # Full jitter, so clients do not reconnect in lockstep after an outage.
+                stop_event.wait(random.uniform(0, delay))
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+        finally:
+            session.close()
+
+    def _listen(self, session, project_name, stop_event):
+        """
+        Read one connection of the stream until it ends.
+
+        Returns:
+            bool: True if the connection was established.
+        """
+        response = session.get(
+            f"{data_service.BASE_URL}/events",
+            params={"project_name": project_name},
+            headers={"Accept": "text/event-stream", "Cache-Control": "no-cache"},
+            stream=True,
+            timeout=(data_service.CONNECT_TIMEOUT, PUSH_READ_TIMEOUT)
+        )
+        if response.status_code in _PUSH_UNSUPPORTED_CODES:
+            logger.info("Backend has no live update stream; push updates disabled.")
+            self._supported = False
+            response.close()
+            return False
+        if response.status_code != 200:
+            response.close()
+            raise requests.HTTPError(f"{response.status_code} {response.reason}", response=response)
+
+        with self._lock:
+            if stop_event.is_set():
+                response.close()
+                return False
+            self._response = response
+        self._supported = True
+        self.connection_changed.emit(True)
+        try:
+            for _, event_type, data in iter_sse_events(_iter_stream_lines(response)):
+                if stop_event.is_set():
+                    break
+                self._dispatch(project_name, event_type, data)
+        except (AttributeError, ValueError, OSError):
+            # Raised by urllib3 when the connection is aborted by unsubscribe().
+            if not stop_event.is_set():
+                raise
+        finally:
+            with self._lock:
+                if self._response is response:
+                    self._response = None
+            response.close()
+        return True
+
+    def _dispatch(self, project_name, event_type, data):
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            logger.warning(f"Ignoring malformed '{event_type}' event: {data[:200]}")
+            return
+        # A bad event must not end the reader thread, or live updates would
+        # stop without connection_changed(False) restarting the delta poll.
+        if not isinstance(payload, dict) or not self._has_fields(event_type, payload):
+            logger.warning(f"Ignoring '{event_type}' event with missing fields: {data[:200]}")
+            return
+        if payload.get("project_name", project_name) != project_name:
+            return
+
+        if event_type == "task":
+            self.task_changed.emit(project_name, payload["task"])
+        elif event_type == "task_deleted":
+            self.task_deleted.emit(project_name, payload["task_name"])
+        elif event_type == "task_log":
+            self.task_log_added.emit(project_name, payload["task_name"], payload["entry"])
+        else:
+            logger.debug(f"Ignoring unknown event '{event_type}'.")
+
+    @staticmethod
+    def _has_fields(event_type, payload):
+        """Check that an event payload carries the fields of its type (pushed tasks need a name)."""
+        for field, field_type in _EVENT_FIELDS.get(event_type, ()):
+            if not isinstance(payload.get(field), field_type):
+                return False
+        return event_type != "task" or isinstance(payload["task"].get(TASK_NAME), str)
@@ -0,0 +1,343 @@
+"""
+request_scheduler.py
+
+Provides the RequestScheduler class, which admits backend requests by
+priority class (interactive, visible, prefetch, bulk) with bounded
+concurrency per class, and the CancellationToken used to abandon requests
+cooperatively: a cancelled request stops waiting for a slot, and a request
+already on the wire has its socket shut down so the worker returns at once.
+
+The priority and token of a request are taken from the calling context (see
+request_context), so data service functions need no extra arguments.
+"""
+
+import heapq
+import itertools
+import logging
+import socket
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+from handlers.error_handler import RequestCancelledError
+from services.session_pool import connection_observer
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Request priority classes, most urgent first."""
+    INTERACTIVE = 0  # Direct response to a click or key press
+    VISIBLE = 1      # Data for what is on screen (e.g. streaming the task list)
+    PREFETCH = 2     # Speculative cache warming
+    BULK = 3         # Background refreshes and syncs
+
+
+# Maximum concurrent requests per class.
+CLASS_CONCURRENCY = {
+    Priority.INTERACTIVE: 6,
+    Priority.VISIBLE: 4,
+    Priority.PREFETCH: 2,
+    Priority.BULK: 2,
+}
+# Slots only interactive requests may use, so clicks never queue behind background work.
+INTERACTIVE_RESERVE = 2
+
+_current_priority = ContextVar("request_priority", default=Priority.INTERACTIVE)
+_current_token = ContextVar("request_token", default=None)
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag with callbacks run on cancellation.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """Cancel the token and run its callbacks (once)."""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as ex:
+                logger.error(f"Cancellation callback failed: {ex}", exc_info=True)
+
+    def add_callback(self, callback):
+        """
+        Register a callable run when the token is cancelled. Runs it right
+        away if the token already is.
+
+        Returns:
+            callable: Unregisters the callback.
+        """
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self):
+        """
+        Raises:
+            RequestCancelledError: If the token is cancelled.
+        """
+        if self._cancelled:
+            raise RequestCancelledError("Request cancelled.")
+
+
+@contextmanager
+def request_context(priority=None, token=None):
+    """
+    Set the priority and cancellation token of the requests made inside
+    the block (on the current thread).
+
+    Args:
+        priority (Priority, optional): Priority class; unchanged if omitted.
+        token (CancellationToken, optional): Token; unchanged if omitted.
+    """
+    priority_reset = _current_priority.set(priority) if priority is not None else None
+    token_reset = _current_token.set(token) if token is not None else None
+    try:
+        yield
+    finally:
+        if token_reset is not None:
+            _current_token.reset(token_reset)
+        if priority_reset is not None:
+            _current_priority.reset(priority_reset)
+
+
+def current_priority():
+    """Return the priority of requests made in the current context."""
+    return _current_priority.get()
+
+
+def current_token():
+    """Return the cancellation token of the current context, or None."""
+    return _current_token.get()
+
+
+class _ConnectionWatch:
+    """
+    Tracks the connections a request holds, so cancellation can shut down
+    their sockets and unblock the thread reading from them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connections = set()
+
+    def acquired(self, connection):
+        with self._lock:
+            self._connections.add(connection)
+
+    def released(self, connection):
+        with self._lock:
+            self._connections.discard(connection)
+
+    def abort(self):
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            sock = getattr(connection, "sock", None)
+            if sock is None:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class RequestScheduler:
+    """
+    Priority-aware admission control for backend requests.
+
+    A request takes a slot from its class; classes are bounded individually
+    and together by max_concurrency. Waiting requests are admitted most
+    urgent first, but a request whose class is full never blocks requests of
+    other classes behind it.
+    """
+
+    def __init__(self, max_concurrency=10, class_concurrency=None, interactive_reserve=INTERACTIVE_RESERVE):
+        """
+        Initialize the RequestScheduler.
+
+        Args:
+            max_concurrency (int): Total concurrent requests (usually the HTTP pool size).
+            class_concurrency (dict, optional): Priority -> limit; defaults to CLASS_CONCURRENCY.
+            interactive_reserve (int): Slots held back for interactive requests.
+        """
+        self.max_concurrency = max_concurrency
+        self.class_concurrency = dict(class_concurrency or CLASS_CONCURRENCY)
+        self.interactive_reserve = interactive_reserve
+        self._cond = threading.Condition()
+        self._active = {priority: 0 for priority in Priority}
+        self._total = 0
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._latest_lock = threading.Lock()
+        self._latest = {}
+        self._stats = {
+            priority.name.lower(): {"admitted": 0, "queued": 0, "cancelled": 0}
+            for priority in Priority
+        }
+
+    # ------------------------------
+    # Slots
+    # ------------------------------
+
+    @contextmanager
+    def slot(self, priority=None, token=None):
+        """
+        Hold a request slot for the duration of the block. While it is held,
+        cancelling the token shuts down the sockets used in the block.
+
+        Args:
+            priority (Priority, optional): Defaults to the context's priority.
+            token (CancellationToken, optional): Defaults to the context's token.
+
+        Raises:
+            RequestCancelledError: If the token is cancelled before a slot is free.
+        """
+        priority = Priority(current_priority() if priority is None else priority)
+        token = current_token() if token is None else token
+        self._acquire(priority, token)
+        try:
+            if token is None:
+                yield
+                return
+            watch = _ConnectionWatch()
+            unregister = token.add_callback(watch.abort)
+            observer_reset = connection_observer.set(watch)
+            try:
+                yield
+            finally:
+                connection_observer.reset(observer_reset)
+                unregister()
+        finally:
+            self._release(priority)
+
+    def _has_capacity(self, priority):
+        if self._active[priority] >= self.class_concurrency[priority]:
+            return False
+        reserve = 0 if priority == Priority.INTERACTIVE else self.interactive_reserve
+        return self._total < self.max_concurrency - reserve
+
+    def _next_admissible(self):
+        for entry in sorted(self._waiting):
+            if self._has_capacity(entry[0]):
+                return entry
+        return None
+
+    def _admit(self, priority):
+        self._active[priority] += 1
+        self._total += 1
+        self._stats[priority.name.lower()]["admitted"] += 1
+
+    def _acquire(self, priority, token):
+        stats = self._stats[priority.name.lower()]
+        with self._cond:
+            if token is not None and token.cancelled:
+                stats["cancelled"] += 1
+                raise RequestCancelledError("Request cancelled before it was sent.")
+            if not self._waiting and self._has_capacity(priority):
+                self._admit(priority)
+                return
+
+            entry = (int(priority), next(self._sequence))
+            heapq.heappush(self._waiting, entry)
+            stats["queued"] += 1
+            unregister = token.add_callback(self._wake) if token is not None else (lambda: None)
+            try:
+                while True:
+                    if token is not None and token.cancelled:
+                        stats["cancelled"] += 1
+                        raise RequestCancelledError("Request cancelled while queued.")
+                    if self._next_admissible() == entry:
+                        self._admit(priority)
+                        return
+                    self._cond.wait()
+            finally:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                unregister()
+                self._cond.notify_all()
+
+    def _release(self, priority):
+        with self._cond:
+            self._active[priority] -= 1
+            self._total -= 1
+            self._cond.notify_all()
+
+    def _wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    # ------------------------------
+    # Latest-wins
+    # ------------------------------
+
+    def latest(self, key):
+        """
+        Return a fresh token for key, cancelling the one previously issued
+        for it. Used where only the newest request matters, e.g. a detail
+        pane showing the selected task.
+
+        Args:
+            key (hashable): Identifies the consumer, e.g. "review.task_detail".
+
+        Returns:
+            CancellationToken: The new token.
+        """
+        token = CancellationToken()
+        with self._latest_lock:
+            previous = self._latest.get(key)
+            self._latest[key] = token
+        if previous is not None:
+            previous.cancel()
+        return token
+
+    def cancel_latest(self, key=None):
+        """Cancel the latest token of key, or of every key."""
+        with self._latest_lock:
+            if key is None:
+                tokens = list(self._latest.values())
+                self._latest.clear()
+            else:
+                tokens = [token for token in [self._latest.pop(key, None)] if token]
+        for token in tokens:
+            token.cancel()
+
+    # ------------------------------
+    # Statistics
+    # ------------------------------
+
+    def stats(self):
+        """
+        Return per-class counters and the requests currently active or queued.
+        """
+        with self._cond:
+            return {
+                "classes": {name: dict(counters) for name, counters in self._stats.items()},
+                "active": {priority.name.lower(): count for priority, count in self._active.items()},
+                "queued": len(self._waiting),
+            }
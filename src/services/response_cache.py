@@ -0,0 +1,212 @@
+"""
+response_cache.py
+
+Provides the ResponseCache class, a thread-safe in-memory cache for backend
+responses keyed by endpoint and canonicalised JSON payload. Entries expire
+after a per-endpoint TTL and the least recently used entries are evicted
+once the cache grows beyond its byte budget.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    TTL + byte-bounded LRU cache of decoded JSON responses.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, keep_expired=False):
+        """
+        Initialize the ResponseCache.
+
+        Args:
+            max_bytes (int): Upper bound for the summed size of cached responses.
+            keep_expired (bool): Keep expired entries (until evicted or replaced)
+                so get_stale can still return them.
+        """
+        self.max_bytes = max_bytes
+        self.keep_expired = keep_expired
+        self._lock = threading.Lock()
+        # key -> (endpoint, value, size, expires_at)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._listeners = []
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    # ------------------------------
+    # Keys & Sizes
+    # ------------------------------
+
+    @staticmethod
+    def make_key(endpoint, payload=None):
+        """
+        Build a cache key from an endpoint and its payload. Payloads that are
+        equal as JSON produce the same key regardless of key order.
+        """
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{endpoint}|{canonical}"
+
+    @staticmethod
+    def estimate_size(value):
+        """Return the approximate size of a JSON value in bytes."""
+        return len(json.dumps(value, separators=(",", ":"), default=str))
+
+    # ------------------------------
+    # Lookup & Storage
+    # ------------------------------
+
+    def get(self, endpoint, payload=None):
+        """
+        Look up a cached response.
+
+        Returns:
+            tuple: (hit, value). value is None on a miss.
+        """
+        key = self.make_key(endpoint, payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return False, None
+
+            _, value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                if not self.keep_expired:
+                    self._remove(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True, value
+
+    def get_stale(self, endpoint, payload=None):
+        """
+        Look up a response whether or not it has expired. Used to serve the
+        last known data while the backend is unavailable; not counted in the
+        hit/miss statistics.
+
+        Returns:
+            tuple: (hit, value). value is None on a miss.
+        """
+        key = self.make_key(endpoint, payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            return True, entry[1]
+
+    def put(self, endpoint, payload, value, ttl, size=None):
+        """
+        Store a response.
+
+        Args:
+            endpoint (str): The API endpoint.
+            payload: The request payload (any JSON-serialisable value).
+            value: The decoded response.
+            ttl (float): Seconds the entry stays valid.
+            size (int, optional): Size in bytes; estimated if omitted.
+        """
+        if ttl <= 0:
+            return
+        size = self.estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            logger.debug(f"Response from '{endpoint}' ({size} bytes) exceeds the cache budget.")
+            return
+
+        key = self.make_key(endpoint, payload)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (endpoint, value, size, time.monotonic() + ttl)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._stats["evictions"] += 1
+
+    def _remove(self, key):
+        _, _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    # ------------------------------
+    # Invalidation
+    # ------------------------------
+
+    def add_invalidation_listener(self, callback):
+        """
+        Register a callable invoked as callback(endpoint, payload) whenever
+        entries are invalidated. endpoint is None when the cache is cleared.
+        """
+        self._listeners.append(callback)
+
+    def invalidate(self, endpoint, payload=None, all_payloads=False):
+        """
+        Drop cached responses of an endpoint.
+
+        Args:
+            endpoint (str): The API endpoint.
+            payload: Drop only the entry for this payload.
+            all_payloads (bool): Drop every entry of the endpoint.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        with self._lock:
+            if all_payloads:
+                keys = [key for key, entry in self._entries.items() if entry[0] == endpoint]
+            else:
+                key = self.make_key(endpoint, payload)
+                keys = [key] if key in self._entries else []
+            for key in keys:
+                self._remove(key)
+        self._notify(endpoint, None if all_payloads else payload)
+        return len(keys)
+
+    def clear(self):
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        self._notify(None, None)
+
+    def _notify(self, endpoint, payload):
+        for callback in list(self._listeners):
+            try:
+                callback(endpoint, payload)
+            except Exception as ex:
+                logger.error(f"Cache invalidation listener failed: {ex}", exc_info=True)
+
+    # ------------------------------
+    # Statistics
+    # ------------------------------
+
+    def stats(self):
+        """
+        Return hit/miss statistics and the current size of the cache.
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_ratio": self._stats["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
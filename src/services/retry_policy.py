@@ -0,0 +1,103 @@
+"""
+retry_policy.py
+
+Provides the RetryPolicy class, which decides whether a failed idempotent
+request is worth another attempt and how long to wait before it: exponential
+backoff with full jitter, honouring the backend's Retry-After header. Waits
+end early when the request's cancellation token is cancelled.
+"""
+
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from handlers.error_handler import BackendError
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Status codes meaning the backend is overloaded or briefly unavailable.
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: the wait before attempt n + 1 is
+    uniform in [0, min(max_delay, base_delay * 2 ** n)], so clients that
+    failed together spread their retries out instead of returning in waves.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=0.25, max_delay=4.0):
+        """
+        Initialize the RetryPolicy.
+
+        Args:
+            max_attempts (int): Attempts in total, including the first one.
+            base_delay (float): Backoff ceiling (seconds) after the first failure.
+            max_delay (float): Upper bound of any single wait, Retry-After included.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @staticmethod
+    def is_retryable(error) -> bool:
+        """
+        Return True for failures a later attempt may not hit: connection
+        errors, timeouts and overload status codes.
+        """
+        if isinstance(error, BackendError):
+            return error.status_code in RETRYABLE_STATUS_CODES
+        return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+    def backoff(self, attempt, retry_after=None) -> float:
+        """
+        Return the seconds to wait after the given failed attempt (1-based).
+
+        Args:
+            attempt (int): Number of the attempt that failed.
+            retry_after (float, optional): Delay requested by the backend.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, self.max_delay)
+
+    @staticmethod
+    def wait(delay, token=None):
+        """
+        Sleep for delay seconds, or until the token is cancelled.
+
+        Returns:
+            bool: False if the wait was cut short by cancellation.
+        """
+        if token is None:
+            time.sleep(delay)
+            return True
+        woken = threading.Event()
+        unregister = token.add_callback(woken.set)
+        try:
+            return not woken.wait(delay)
+        finally:
+            unregister()
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header (seconds or an HTTP date) into seconds, or None.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring unparsable Retry-After header: {value!r}")
+        return None
@@ -0,0 +1,323 @@
+"""
+session_pool.py
+
+Provides the SessionPool class, a shared and thread-safe HTTP session layer
+used by the data service. Connections are kept alive and pooled per host,
+every request gets connect/read timeouts and negotiates a compressed
+response encoding, and the pool keeps counters of new versus reused
+connections and of compressed versus decoded bytes received.
+"""
+
+import logging
+import threading
+from contextvars import ContextVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Every content coding urllib3 can decode here: gzip and deflate always, plus
+# br and zstd when the brotli / zstandard packages are installed.
+SUPPORTED_ENCODINGS = ACCEPT_ENCODING
+
+# Chunk size used when reading (and decompressing) a streamed response body.
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+class ConnectionStats:
+    """
+    Thread-safe counters describing how requests were served by the pool.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._new_connections = 0
+        self._wire_bytes = 0
+        self._decoded_bytes = 0
+
+    def record_request(self):
+        """Count one request sent through the pool."""
+        with self._lock:
+            self._requests += 1
+
+    def record_new_connection(self):
+        """Count one freshly opened TCP connection."""
+        with self._lock:
+            self._new_connections += 1
+
+    def record_transfer(self, wire_bytes, decoded_bytes):
+        """Count the bytes of one body as received and after decompression."""
+        with self._lock:
+            self._wire_bytes += wire_bytes
+            self._decoded_bytes += decoded_bytes
+
+    def reset(self):
+        """Reset all counters to zero."""
+        with self._lock:
+            self._requests = 0
+            self._new_connections = 0
+            self._wire_bytes = 0
+            self._decoded_bytes = 0
+
+    def snapshot(self):
+        """
+        Return the current counters.
+
+        Returns:
+            dict: 'requests', 'new_connections', 'reused_connections',
+            'wire_bytes' and 'decoded_bytes'.
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "new_connections": self._new_connections,
+                "reused_connections": max(self._requests - self._new_connections, 0),
+                "wire_bytes": self._wire_bytes,
+                "decoded_bytes": self._decoded_bytes,
+            }
+
+
+# Shared by all pools; urllib3 instantiates pool classes itself, so the
+# counting pools below cannot receive the stats object as an argument.
+_connection_stats = ConnectionStats()
+
+
+# Optional observer of the connections taken from the pools by the current
+# context, with acquired(connection) and released(connection) methods. The
+# request scheduler uses it to shut down the sockets of cancelled requests.
+connection_observer = ContextVar("connection_observer", default=None)
+
+
+class _ObservedConnectionsMixin:
+    def _get_conn(self, timeout=None):
+        connection = super()._get_conn(timeout)
+        observer = connection_observer.get()
+        if observer is not None:
+            observer.acquired(connection)
+        return connection
+
+    def _put_conn(self, connection):
+        observer = connection_observer.get()
+        if observer is not None and connection is not None:
+            observer.released(connection)
+        super()._put_conn(connection)
+
+
+class _CountingHTTPConnectionPool(_ObservedConnectionsMixin, HTTPConnectionPool):
+    def _new_conn(self):
+        _connection_stats.record_new_connection()
+        logger.debug(f"Opening new connection to {self.host}:{self.port}.")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(_ObservedConnectionsMixin, HTTPSConnectionPool):
+    def _new_conn(self):
+        _connection_stats.record_new_connection()
+        logger.debug(f"Opening new TLS connection to {self.host}:{self.port}.")
+        return super()._new_conn()
+
+
+class _HostSizedPoolManager(PoolManager):
+    """
+    PoolManager that sizes each host's connection pool individually.
+    """
+
+    def __init__(self, host_pool_sizes, **kwargs):
+        super().__init__(**kwargs)
+        self._host_pool_sizes = host_pool_sizes
+        self.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        request_context = dict(request_context or self.connection_pool_kw)
+        if host in self._host_pool_sizes:
+            request_context["maxsize"] = self._host_pool_sizes[host]
+        return super()._new_pool(scheme, host, port, request_context)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter using per-host pool sizes and counting new connections.
+    """
+
+    def __init__(self, host_pool_sizes=None, **kwargs):
+        # Must be set before HTTPAdapter.__init__ builds the pool manager.
+        self._host_pool_sizes = dict(host_pool_sizes or {})
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _HostSizedPoolManager(
+            self._host_pool_sizes,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs
+        )
+
+
+class SessionPool:
+    """
+    Shared keep-alive HTTP session layer.
+
+    Each thread gets its own requests.Session (sessions are not thread-safe),
+    but all of them mount the same adapter, so TCP connections are pooled and
+    reused across the whole application.
+    """
+
+    def __init__(
+            self,
+            pool_connections=4,
+            pool_maxsize=10,
+            host_pool_sizes=None,
+            connect_timeout=3.05,
+            read_timeout=60,
+            pool_block=False,
+            accept_encoding=SUPPORTED_ENCODINGS
+    ):
+        """
+        Initialize the SessionPool.
+
+        Args:
+            pool_connections (int): Number of per-host pools to keep.
+            pool_maxsize (int): Default number of keep-alive connections per host.
+            host_pool_sizes (dict, optional): Per-host overrides of pool_maxsize.
+            connect_timeout (float): Seconds to wait for a connection.
+            read_timeout (float): Seconds to wait for the server to respond.
+            pool_block (bool): Block instead of opening extra connections
+                when a host's pool is exhausted.
+            accept_encoding (str): Accept-Encoding header sent with every
+                request; "identity" disables compression.
+        """
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._generation = 0
+        self._settings = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "host_pool_sizes": dict(host_pool_sizes or {}),
+            "connect_timeout": connect_timeout,
+            "read_timeout": read_timeout,
+            "pool_block": pool_block,
+            "accept_encoding": accept_encoding,
+        }
+        self._adapter = self._create_adapter()
+
+    def _create_adapter(self):
+        return PooledHTTPAdapter(
+            host_pool_sizes=self._settings["host_pool_sizes"],
+            pool_connections=self._settings["pool_connections"],
+            pool_maxsize=self._settings["pool_maxsize"],
+            pool_block=self._settings["pool_block"],
+        )
+
+    @property
+    def timeout(self):
+        """(connect, read) timeout tuple applied to every request."""
+        return self._settings["connect_timeout"], self._settings["read_timeout"]
+
+    def configure(self, **settings):
+        """
+        Update pool settings. Pools are rebuilt, so existing keep-alive
+        connections are dropped and threads pick up a new session lazily.
+
+        Args:
+            **settings: Any of the keyword arguments accepted by __init__.
+
+        Raises:
+            ValueError: If an unknown setting is given.
+        """
+        unknown = set(settings) - set(self._settings)
+        if unknown:
+            raise ValueError(f"Unknown session pool settings: {', '.join(sorted(unknown))}")
+
+        with self._lock:
+            self._settings.update(settings)
+            old_adapter = self._adapter
+            self._adapter = self._create_adapter()
+            self._generation += 1
+        old_adapter.close()
+        logger.info(f"Session pool reconfigured: {self._settings}")
+
+    def session(self):
+        """
+        Return the calling thread's session, creating it on first use.
+
+        Returns:
+            requests.Session: Session mounted on the shared adapter.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None or self._local.generation != self._generation:
+            with self._lock:
+                session = requests.Session()
+                session.headers.update({
+                    "Connection": "keep-alive",
+                    "Accept-Encoding": self._settings["accept_encoding"],
+                })
+                session.mount("http://", self._adapter)
+                session.mount("https://", self._adapter)
+                self._local.session = session
+                self._local.generation = self._generation
+        return session
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request through the pooled session.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Absolute URL.
+            **kwargs: Passed to requests.Session.request. A default
+                (connect, read) timeout is applied if none is given.
+
+        Returns:
+            requests.Response: The server response.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        _connection_stats.record_request()
+        return self.session().request(method, url, **kwargs)
+
+    @staticmethod
+    def read_body(response):
+        """
+        Read the body of a response requested with stream=True, decompressing
+        it chunk by chunk as it arrives, and release the connection.
+
+        Args:
+            response (requests.Response): A streamed response.
+
+        Returns:
+            bytearray: The decoded body.
+        """
+        body = bytearray()
+        try:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                body += chunk
+        finally:
+            response.close()
+        _connection_stats.record_transfer(response.raw.tell(), len(body))
+        return body
+
+    def stats(self):
+        """Return the connection counters as a dict."""
+        return _connection_stats.snapshot()
+
+    def reset_stats(self):
+        """Reset the connection counters."""
+        _connection_stats.reset()
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._lock:
+            self._adapter.close()
+            self._generation += 1
@@ -0,0 +1,128 @@
+"""
+single_flight.py
+
+Provides the SingleFlight class, which merges concurrent identical calls:
+while a call for a key is in flight, other callers with the same key wait
+for it and receive its result (or exception) instead of repeating it.
+
+Callers wait with the request context of their own thread (see
+services/request_scheduler.py): a waiting caller whose cancellation token
+is cancelled stops waiting, and a caller more urgent than the call in
+flight runs its own call rather than waiting behind the in-flight call's
+priority class.
+"""
+
+import logging
+import threading
+
+from handlers.error_handler import RequestCancelledError
+from services.request_scheduler import current_priority, current_token
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Interval at which waiting callers check their cancellation token (seconds).
+WAIT_SLICE = 0.05
+
+
+class _Call:
+    """Outcome of a call in flight, shared with the callers waiting for it."""
+
+    def __init__(self, priority):
+        self.priority = priority
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Thread-safe request coalescing keyed by an arbitrary hashable key.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {"calls": 0, "executions": 0, "collapsed": 0, "overtaken": 0}
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) unless an identical call is already running,
+        in which case wait for it and share its outcome. A caller more urgent
+        than the running call runs func itself, and later callers join it.
+
+        Args:
+            key: Hashable identity of the call.
+            func (callable): The function to run.
+
+        Returns:
+            The result of the (possibly shared) call.
+
+        Raises:
+            RequestCancelledError: If the caller's cancellation token is
+                cancelled while it waits for a shared call.
+            Exception: Whatever the shared call raised.
+        """
+        priority = current_priority()
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            if call is not None and priority >= call.priority:
+                self._stats["collapsed"] += 1
+                leader = False
+            else:
+                if call is not None:
+                    self._stats["overtaken"] += 1
+                call = self._calls[key] = _Call(priority)
+                self._stats["executions"] += 1
+                leader = True
+
+        if not leader:
+            logger.debug(f"Joining in-flight call for {key}.")
+            self._wait(call)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except Exception as ex:
+            call.error = ex
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    @staticmethod
+    def _wait(call):
+        """Wait for a shared call, unless the caller's own token is cancelled first."""
+        token = current_token()
+        if token is None:
+            call.done.wait()
+            return
+        while not call.done.wait(WAIT_SLICE):
+            if token.cancelled:
+                raise RequestCancelledError("Request cancelled while waiting for an identical one.")
+
+    def in_flight(self):
+        """Return the number of calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self):
+        """
+        Return counters: 'calls' made, 'executions' actually run,
+        'collapsed' calls that shared another call's result and 'overtaken'
+        calls that a more urgent caller did not wait for.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self):
+        """Reset the counters."""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
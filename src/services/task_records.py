@@ -0,0 +1,219 @@
+"""
+task_records.py
+
+Provides the TaskRecordCache class. Task lists are loaded with a field mask
+(see data_service.TASK_LIST_FIELDS) and hold partial records only; the
+complete record of a task, needed by the Work Area and for creating files,
+is hydrated on demand when the task is selected and kept in a bounded LRU
+cache keyed by project and task name.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+
+from services import data_service
+from services.entity_store import entity_store
+from services.constants import TASK_NAME
+from handlers.error_handler import BackendError
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Complete task records kept in memory.
+TASK_RECORD_CACHE_SIZE = 2000
+
+# Status codes meaning the backend has no records endpoint.
+_RECORDS_UNSUPPORTED_CODES = (404, 405, 501)
+
+
+class TaskRecordCache:
+    """
+    LRU cache of complete task records, filled on demand. Thread-safe.
+    """
+
+    def __init__(self, max_records=TASK_RECORD_CACHE_SIZE):
+        """
+        Initialize the TaskRecordCache.
+
+        Args:
+            max_records (int): Records kept before the least recently used are dropped.
+        """
+        self.max_records = max_records
+        self._lock = threading.Lock()
+        self._records = OrderedDict()
+        self._records_supported = None
+        self._stats = {"hits": 0, "misses": 0, "fetched": 0}
+        data_service.add_cache_invalidation_listener(self._on_cache_invalidated)
+        # Records are the entity store's canonical ones; a partial update
+        # leaves their detail fields behind, so they are fetched again.
+        entity_store.tasks_changed.connect(self.invalidate)
+        entity_store.tasks_removed.connect(self.invalidate)
+
+    # ------------------------------
+    # Lookup & Storage
+    # ------------------------------
+
+    def get(self, project_name, task_name):
+        """Return the cached complete record of a task, or None."""
+        key = (project_name, task_name)
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None:
+                self._records.move_to_end(key)
+            return record
+
+    def put(self, project_name, record):
+        """Store the complete record of a task (e.g. one pushed by the backend)."""
+        key = (project_name, record[TASK_NAME])
+        with self._lock:
+            self._records[key] = record
+            self._records.move_to_end(key)
+            while len(self._records) > self.max_records:
+                self._records.popitem(last=False)
+
+    def invalidate(self, project_name=None, task_names=None):
+        """
+        Drop cached records.
+
+        Args:
+            project_name (str, optional): Project to drop; every project if omitted.
+            task_names (iterable, optional): Only drop these tasks of the project.
+        """
+        with self._lock:
+            if project_name is None:
+                self._records.clear()
+            elif task_names is None:
+                for key in [key for key in self._records if key[0] == project_name]:
+                    del self._records[key]
+            else:
+                for task_name in task_names:
+                    self._records.pop((project_name, task_name), None)
+
+    def _on_cache_invalidated(self, endpoint, payload):
+        # Hydrated records go stale together with the task lists they came from.
+        if endpoint is None:
+            self.invalidate()
+        elif endpoint.startswith("taskData"):
+            project_name = payload.get("project_name") if isinstance(payload, dict) else None
+            self.invalidate(project_name)
+
+    # ------------------------------
+    # Hydration
+    # ------------------------------
+
+    def hydrate(self, project_name, task):
+        """
+        Return the complete record of a task, fetching it if it is not cached.
+
+        Args:
+            project_name (str): Project the task belongs to.
+            task (dict): The task's (partial) list record.
+
+        Returns:
+            dict: The complete record; the list record itself if the backend
+            could not provide one.
+        """
+        return self.hydrate_many(project_name, [task])[0]
+
+    def hydrate_many(self, project_name, tasks):
+        """
+        Return the complete records of several tasks, fetching the missing
+        ones in a single request.
+
+        Args:
+            project_name (str): Project the tasks belong to.
+            tasks (list): The tasks' (partial) list records.
+
+        Returns:
+            list: Complete records, in the order of tasks.
+
+        Raises:
+            BackendError: If the records could not be fetched.
+        """
+        records = {}
+        missing = []
+        for task in tasks:
+            record = self.get(project_name, task[TASK_NAME])
+            if record is None:
+                missing.append(task[TASK_NAME])
+            else:
+                records[task[TASK_NAME]] = record
+        with self._lock:
+            self._stats["hits"] += len(records)
+            self._stats["misses"] += len(missing)
+
+        if missing:
+            for record in self._fetch(project_name, missing):
+                self.put(project_name, record)
+                records[record[TASK_NAME]] = record
+            with self._lock:
+                self._stats["fetched"] += len(missing)
+        return [records.get(task[TASK_NAME], task) for task in tasks]
+
+    def _fetch(self, project_name, task_names):
+        project_data = {"project_name": project_name}
+        if self._records_supported is not False:
+            try:
+                records = data_service.get_taskData_records(project_data, task_names)
+                self._records_supported = True
+                return records
+            except BackendError as be:
+                if be.status_code not in _RECORDS_UNSUPPORTED_CODES:
+                    raise
+                logger.info("Backend has no task records endpoint; hydrating from the complete task list.")
+                self._records_supported = False
+
+        # Fallback: the complete list (shared with other callers through the response cache).
+        wanted = set(task_names)
+        tasks = data_service.get_taskData(project_data, fields=data_service.TASK_DETAIL_FIELDS)
+        return [task for task in tasks if task[TASK_NAME] in wanted]
+
+    # ------------------------------
+    # Statistics
+    # ------------------------------
+
+    def stats(self):
+        """Return hit/miss counters and the number of cached records."""
+        with self._lock:
+            return {**self._stats, "records": len(self._records)}
+
+
+task_records = TaskRecordCache()
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    from services.mock_backend import MockBackend, MockBackendServer
+
+    # Compare the bootstrap payload and resident size of list records with complete ones.
+    server = MockBackendServer(MockBackend(50_000)).start()
+    data_service.BASE_URL = server.base_url
+    data_service.CONDITIONAL_REQUESTS = False
+    try:
+        for label, fields in (("complete", data_service.TASK_DETAIL_FIELDS),
+                              ("list mask", data_service.TASK_LIST_FIELDS)):
+            payload = data_service.with_fields({"project_name": "DemoProject"}, fields)
+            before = data_service.get_connection_stats()
+            start = time.perf_counter()
+            data_service.make_request("POST", "taskData", data=payload)
+            elapsed = (time.perf_counter() - start) * 1000
+            after = data_service.get_connection_stats()
+            tracemalloc.start()
+            tasks = data_service.make_request("POST", "taskData", data=payload)
+            resident = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            print(f"{label:>10}: {len(tasks)} tasks, "
+                  f"{after['decoded_bytes'] - before['decoded_bytes']:>10} bytes decoded, "
+                  f"{after['wire_bytes'] - before['wire_bytes']:>9} on the wire, "
+                  f"~{resident / 1e6:.1f} MB resident, {elapsed:.0f} ms")
+            del tasks
+
+        task = {TASK_NAME: data_service.get_taskData({"project_name": "DemoProject"})[0][TASK_NAME]}
+        record = task_records.hydrate("DemoProject", task)
+        print(f"hydrated '{task[TASK_NAME]}': {sorted(record)}")
+        print(f"stats: {task_records.stats()}")
+    finally:
+        server.stop()
@@ -0,0 +1,140 @@
+"""
+task_sync.py
+
+Provides the TaskSyncEngine class, which keeps a per-project high-water mark
+(the backend's delta cursor) and fetches only the tasks created, changed or
+deleted since then, so a refresh costs in proportion to what changed rather
+than to the size of the project.
+"""
+
+import logging
+import threading
+from typing import Dict, List, NamedTuple, Optional
+
+from services import data_service
+from services.constants import TASK_NAME
+from handlers.error_handler import BackendError
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Status codes meaning the backend has no delta endpoint.
+_DELTA_UNSUPPORTED_CODES = (404, 405, 501)
+
+
+class TaskDelta(NamedTuple):
+    """Tasks changed and task names deleted since the previous sync."""
+    project_name: str
+    changed: List[Dict]
+    deleted: List[str]
+
+    def is_empty(self) -> bool:
+        return not self.changed and not self.deleted
+
+
+def merge_task_delta(tasks: List[Dict], changed: List[Dict], deleted: List[str]) -> List[Dict]:
+    """
+    Return a new task list with a delta applied. Changed tasks replace the
+    task of the same name in place; new tasks are appended.
+
+    Args:
+        tasks (List[Dict]): Current tasks.
+        changed (List[Dict]): New or modified tasks.
+        deleted (List[str]): Names of removed tasks.
+
+    Returns:
+        List[Dict]: The merged task list.
+    """
+    deleted = set(deleted)
+    remaining = {task[TASK_NAME]: task for task in changed}
+    merged = []
+    for task in tasks:
+        name = task[TASK_NAME]
+        if name in deleted:
+            continue
+        merged.append(remaining.pop(name, task))
+    merged.extend(remaining.values())
+    return merged
+
+
+class TaskSyncEngine:
+    """
+    Tracks the delta cursor of each project and fetches task deltas.
+    Safe to use from worker threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cursors = {}
+        self._supported = None
+
+    @property
+    def supported(self) -> Optional[bool]:
+        """False once the backend has reported it cannot serve deltas."""
+        return self._supported
+
+    def _request(self, project_name, since):
+        try:
+            delta = data_service.get_taskData_delta({"project_name": project_name}, since=since)
+        except BackendError as be:
+            if be.status_code in _DELTA_UNSUPPORTED_CODES:
+                logger.info("Backend does not support task deltas; delta sync disabled.")
+                self._supported = False
+                return None
+            raise
+        self._supported = True
+        return delta
+
+    def mark(self, project_name):
+        """
+        Record the backend's current cursor as the project's high-water mark.
+        Call this before loading the full task list, so that changes made
+        during the load are picked up by the next sync.
+        """
+        if self._supported is False:
+            return
+        delta = self._request(project_name, None)
+        if delta is not None:
+            with self._lock:
+                self._cursors[project_name] = delta["cursor"]
+
+    def cursor(self, project_name):
+        """Return the project's high-water mark, or None."""
+        with self._lock:
+            return self._cursors.get(project_name)
+
+    def fetch_delta(self, project_name) -> Optional[TaskDelta]:
+        """
+        Fetch the changes since the project's high-water mark and advance it.
+
+        Returns:
+            TaskDelta or None: None if the project has no high-water mark yet
+            or the backend cannot serve deltas.
+        """
+        since = self.cursor(project_name)
+        if since is None or self._supported is False:
+            return None
+
+        delta = self._request(project_name, since)
+        if delta is None:
+            return None
+        with self._lock:
+            # Only advance if no one reset the project meanwhile.
+            if self._cursors.get(project_name) == since:
+                self._cursors[project_name] = delta["cursor"]
+        logger.debug(
+            f"Delta for '{project_name}' since {since}: "
+            f"{len(delta['changed'])} changed, {len(delta['deleted'])} deleted."
+        )
+        return TaskDelta(project_name, delta["changed"], delta["deleted"])
+
+    def reset(self, project_name=None):
+        """Forget the high-water mark of a project, or of every project."""
+        with self._lock:
+            if project_name is None:
+                self._cursors.clear()
+            else:
+                self._cursors.pop(project_name, None)
+
+
+task_sync_engine = TaskSyncEngine()
@@ -15,6 +15,7 @@ from ui.components.forms.details_form import Ui_DetailsForm  # Generated UI
 from ui.components.extensions.message_box import MessageBox
 from ui.components.extensions.video_widget import VideoPlayer
 from ui.utils.common import set_layout_visibility
+from ui.utils.update_generation import UpdateGeneration, UpdateGuard
 from services.constants import VIDEO_PATH
 
 # Initialize logger
@@ -46,6 +47,8 @@ class FileDetailsWidget(QWidget):
 
         self.message_box = MessageBox()
         self._details_data = details_data if details_data else {}
+        # Guards against responses for superseded selections
+        self._update_guard = UpdateGuard()
 
         # Set up the UI labels/fields
         self._ui.header_label.setText(title)
@@ -126,19 +129,49 @@ class FileDetailsWidget(QWidget):
         # Clear any existing preview widgets
         self._clear_preview_frame()
 
-        # If there's a video path, initialize the video player (slightly delayed)
+        # If there's a video path, initialize the video player (slightly delayed),
+        # unless another file has been selected in the meantime
         if data.get(VIDEO_PATH):
-            QTimer.singleShot(50, lambda: self._initialize_video_player(data[VIDEO_PATH]))
+            generation = self._update_guard.current
+            QTimer.singleShot(50, lambda: self._initialize_video_player(data[VIDEO_PATH], generation))
         else:
             logger.debug(f"No video path ({VIDEO_PATH}) provided.")
 
-    def _initialize_video_player(self, video_path: str):
+    def begin_update(self) -> UpdateGeneration:
+        """
+        Start updating the widget for a newly selected file. Responses for
+        earlier selections are discarded and their requests cancelled.
+
+        Returns:
+            UpdateGeneration: Its token goes with the requests, the
+            generation itself back to apply_update with their responses.
+        """
+        return self._update_guard.begin()
+
+    def apply_update(self, generation: UpdateGeneration, details_data: dict) -> bool:
+        """
+        Set details_data fetched for a generation, unless it was superseded.
+
+        Returns:
+            bool: False if the data was discarded as stale.
+        """
+        if not self._update_guard.is_current(generation):
+            logger.debug(f"Discarding stale file details response of {generation}.")
+            return False
+        self.details_data = details_data
+        return True
+
+    def _initialize_video_player(self, video_path: str, generation: UpdateGeneration = None):
         """
         Initialize the video player if a video path is provided.
 
         Args:
             video_path (str): Path to the video file.
+            generation (UpdateGeneration, optional): Skip if this generation was superseded.
         """
+        if generation is not None and not self._update_guard.is_current(generation):
+            logger.debug(f"Skipping video player of superseded {generation}.")
+            return
         logger.debug(f"Initializing video player for path: {video_path}")
         self._video_player = VideoPlayer(video_path, self._ui.preview_frame)
 
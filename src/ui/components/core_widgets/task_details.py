@@ -16,6 +16,7 @@ from ui.components.forms.task_details_form import Ui_TaskDetailsForm
 from ui.components.core_widgets.task_log import TaskLogWidget
 from ui.components.extensions.message_box import MessageBox
 from ui.utils.common import set_layout_visibility
+from ui.utils.update_generation import UpdateGeneration, UpdateGuard
 
 from services.constants import PREVIEW_PATH
 
@@ -50,6 +51,8 @@ class TaskDetailsWidget(QWidget):
         # Internal state
         self._task_logs_data = task_logs_data if task_logs_data else []
         self._task_details_data = task_details_data if task_details_data else {}
+        # Guards against responses for superseded selections
+        self._update_guard = UpdateGuard()
 
         self.header_label = self._ui.header_label
         self.task_details_textEdit = self._ui.task_details_textEdit
@@ -177,6 +180,35 @@ class TaskDetailsWidget(QWidget):
         if "task_logs" in data:
             self.task_logs = data["task_logs"]
 
+    # ---------------------------
+    # Asynchronous Updates
+    # ---------------------------
+
+    def begin_update(self) -> UpdateGeneration:
+        """
+        Start updating the widget for a new selection. From now on responses
+        requested for earlier selections are discarded, and their requests
+        are cancelled.
+
+        Returns:
+            UpdateGeneration: Its token goes with the requests, the
+            generation itself back to apply_update with their responses.
+        """
+        return self._update_guard.begin()
+
+    def apply_update(self, generation: UpdateGeneration, **data) -> bool:
+        """
+        Apply 'details_data' and/or 'task_logs' fetched for a generation.
+
+        Returns:
+            bool: False if the generation was superseded and the data discarded.
+        """
+        if not self._update_guard.is_current(generation):
+            logger.debug(f"Discarding stale task details response of {generation}.")
+            return False
+        self._on_trigger_update(data)
+        return True
+
     # ---------------------------
     # Public Properties & Setters
     # ---------------------------
@@ -223,6 +255,21 @@ class TaskDetailsWidget(QWidget):
         self._task_logs_data = logs
         self._task_log_widget.set_tasks_data(logs)
 
+    def add_task_log(self, log: dict):
+        """
+        Add a single new task log at the top of the log list without
+        rebuilding the existing entries.
+
+        Args:
+            log (dict): The task log dictionary.
+        """
+        logger.debug(f"Adding task log: {log}")
+        if not isinstance(log, dict):
+            raise ValueError("task log must be a dictionary", log)
+
+        self._task_log_widget.add_task_data(log)
+        self._task_logs_data = self._task_log_widget.get_tasks_data()
+
 
 if __name__ == "__main__":
     import sys
@@ -3,20 +3,26 @@ task_list_widget.py
 
 Provides the TaskListWidget class, which displays a searchable list of tasks
 with color-coded statuses. Includes context menus for various actions.
+
+Tasks are held by a single TaskListModel, filtered by a TaskFilterProxyModel
+and painted by a TaskItemDelegate, so the list creates no widget per task,
+only paints the rows in view, and a filter change only changes which rows
+are visible.
 """
 
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 from PySide6.QtWidgets import (
-    QWidget, QApplication, QHBoxLayout, QLabel, QSpacerItem,
-    QSizePolicy, QListWidgetItem, QMenu, QLineEdit
+    QWidget, QApplication, QAbstractItemView, QMenu, QLineEdit, QProgressBar
 )
-from PySide6.QtCore import Signal, Qt, QPoint
+from PySide6.QtCore import Signal, Qt, QPoint, QModelIndex, QPersistentModelIndex
 from PySide6.QtGui import  QIcon, QAction, QPixmap
 
 from ui.components.forms.task_list_form import Ui_TaskListForm
+from ui.components.core_widgets.task_list_model import (
+    TaskListModel, TaskFilterProxyModel, TaskItemDelegate, TaskRole
+)
 from ui.utils.stylesheet_loader import load_stylesheet
-from ui.utils.task_filter import TaskFilter
 from services.constants import TASK_NAME, TASK_STATUS
 logger = logging.getLogger(__name__)
 
@@ -27,7 +33,10 @@ class TaskListWidget(QWidget):
     Users can search, filter, and select tasks.
     """
 
-    taskSelected = Signal(str, dict)
+    # Task data is a dict or a compact TaskRecord (a read-only mapping)
+    taskSelected = Signal(str, object)
+    # Emitted whenever the current row changes, including keyboard navigation
+    taskFocused = Signal(str, object)
 
     def __init__(
             self,
@@ -58,15 +67,22 @@ class TaskListWidget(QWidget):
         self.search_lineEdit = self._ui.search_lineEdit
 
         # Internal state
-        self._tasks = tasks if tasks else []
         self._task_status_colors = task_status_colors if task_status_colors else {}
+        self._entity_store = None
+        self._project_name = None
+        # Every task lives in the model; the proxy shows the filtered rows
+        self._model = TaskListModel(tasks, self._task_status_colors, parent=self)
+        self._tasks = self._model.tasks()
+        self._proxy = TaskFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._delegate = TaskItemDelegate(self)
+        # Source row of the last current task, restored when a filter shows it again
+        self._current_task = QPersistentModelIndex()
+        self._restoring_current = False
 
         self._setup_ui()
         self._setup_connections()
 
-        # Populate the tasks initially
-        self._populate_tasks()
-
     # ------------------------------
     # Public Properties & Get/Set
     # ------------------------------
@@ -84,9 +100,35 @@ class TaskListWidget(QWidget):
         Args:
             tasks (List[Dict]): New list of tasks to display.
         """
-        logger.debug(f"Setting tasks: {tasks}")
-        self._tasks = tasks
-        self._populate_tasks()
+        logger.debug(f"Setting {len(tasks)} tasks.")
+        self._model.set_tasks(tasks)
+        self._tasks = self._model.tasks()
+
+    def append_tasks(self, tasks: List[Dict]):
+        """
+        Appends tasks (e.g. the next page of a streamed project) without
+        rebuilding the existing rows. Rows are only added for tasks that
+        match the current filter.
+
+        Args:
+            tasks (List[Dict]): Tasks to add to the end of the list.
+        """
+        logger.debug(f"Appending {len(tasks)} tasks.")
+        self._model.append_tasks(tasks)
+
+    def set_loading_progress(self, loaded: int, total: int):
+        """
+        Shows how many tasks have been loaded while a project streams in.
+        The progress bar hides itself once loaded reaches total.
+
+        Args:
+            loaded (int): Number of tasks received so far.
+            total (int): Total number of tasks in the project.
+        """
+        self.loading_progressBar.setRange(0, max(total, 1))
+        self.loading_progressBar.setValue(loaded)
+        self.loading_progressBar.setFormat(f"Loading tasks... {loaded} / {total}")
+        self.loading_progressBar.setVisible(loaded < total)
 
     def get_task_status_colors(self) -> Dict[str, str]:
         """
@@ -103,7 +145,7 @@ class TaskListWidget(QWidget):
         """
         logger.debug(f"Setting task status colors: {task_status_colors}")
         self._task_status_colors = task_status_colors
-        self._populate_tasks()  # Re-populate to reflect updated colors
+        self._model.set_task_status_colors(task_status_colors)  # Repaint to reflect updated colors
 
     # ------------------------------
     # Private Setup & Connections
@@ -128,19 +170,37 @@ class TaskListWidget(QWidget):
             self.search_lineEdit.addAction(action, QLineEdit.LeadingPosition)
 
         # Configure the task_listWidget
+        self.task_listWidget.setModel(self._proxy)
+        self.task_listWidget.setItemDelegate(self._delegate)
+        # Every row has the same height, so the view never measures rows
+        self.task_listWidget.setUniformItemSizes(True)
+        self.task_listWidget.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.task_listWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Pixel scrolling lets a filter change keep rows where they were
+        self.task_listWidget.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.task_listWidget.setMinimumWidth(400)
         self.task_listWidget.setSpacing(5)
         self.task_listWidget.setViewportMargins(0, 0, 10, 0)
         self.task_listWidget.setContextMenuPolicy(Qt.CustomContextMenu)
 
+        # Progress bar shown while tasks are streamed in page by page
+        self.loading_progressBar = QProgressBar(self)
+        self.loading_progressBar.setObjectName("loading_progressBar")
+        self.loading_progressBar.setTextVisible(True)
+        self.loading_progressBar.setMaximumHeight(16)
+        self.loading_progressBar.setVisible(False)
+        self._ui.verticalLayout.insertWidget(
+            self._ui.verticalLayout.indexOf(self.task_listWidget), self.loading_progressBar
+        )
+
     def _setup_connections(self):
         """
         Connect various signals to their respective slots.
         """
         logger.debug("Setting up signal connections for TaskListWidget.")
         self.task_listWidget.customContextMenuRequested.connect(self._show_context_menu)
-        self.task_listWidget.itemClicked.connect(self._emit_task_selected)
-        self.task_listWidget.currentItemChanged.connect(self._highlight_selected_item)
+        self.task_listWidget.clicked.connect(self._emit_task_selected)
+        self.task_listWidget.selectionModel().currentChanged.connect(self._emit_task_focused)
         self.search_lineEdit.textChanged.connect(self.filter_tasks)
 
     def set_icon(self):
@@ -156,85 +216,49 @@ class TaskListWidget(QWidget):
     # Private Helper Methods
     # ------------------------------
 
-    def _populate_tasks(self):
+    def _scroll_anchor(self):
         """
-        Clears the list widget and repopulates it with the tasks.
+        Return the source row to keep in place across a filter change (the
+        current row if it is in view, else the top row) and its offset in
+        the viewport, or (None, 0).
         """
-        logger.debug("Populating task list widget with tasks.")
-        self.task_listWidget.clear()
-        if not self._tasks:
-            return
+        view = self.task_listWidget
+        viewport_rect = view.viewport().rect()
+        anchor = view.currentIndex()
+        if not anchor.isValid() or not view.visualRect(anchor).intersects(viewport_rect):
+            anchor = view.indexAt(QPoint(viewport_rect.width() // 2, view.spacing()))
+        if not anchor.isValid():
+            return None, 0
+        return self._proxy.mapToSource(anchor).row(), view.visualRect(anchor).top()
 
-        for task in self._tasks:
-            item_widget = self._create_task_widget(TASK_NAME, TASK_STATUS)
-            list_item = QListWidgetItem()
-            list_item.setSizeHint(item_widget.sizeHint())
-            list_item.setData(Qt.UserRole, task)
-            self.task_listWidget.addItem(list_item)
-            self.task_listWidget.setItemWidget(list_item, item_widget)
-
-    def _create_task_widget(self, task_name: str, task_status: str) -> QWidget:
+    def _restore_scroll_anchor(self, source_row: Optional[int], offset: int):
         """
-        Create a QWidget representing a single task item (name + status badge).
-
-        Args:
-            task_name (str): The name of the task.
-            task_status (str): The status of the task.
-
-        Returns:
-            QWidget: A widget containing the name label and status badge.
-        """
-        logger.debug(f"Creating task widget for '{task_name}' with status '{task_status}'.")
-        task_widget = QWidget()
-        task_widget.setFixedHeight(34)
-        task_widget.setStyleSheet(
-            """
-            background-color: #E1E1E8;
-            border-radius: 5px;
-            """
-        )
-        layout = QHBoxLayout(task_widget)
-        layout.setContentsMargins(10, 5, 10, 5)
-
-        # Task name label
-        name_label = QLabel(task_name)
-        name_label.setStyleSheet("font-size: 14px; border: 0px;")
-        layout.addWidget(name_label)
-
-        # Spacer to push the status label to the right
-        spacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
-        layout.addItem(spacer)
-
-        # Task status label
-        status_color = self._task_status_colors.get(task_status, "gray")
-        task_status_label = QLabel(task_status)
-        task_status_label.setAlignment(Qt.AlignCenter)
-        task_status_label.setStyleSheet(
-            f"""
-            background-color: {status_color};
-            color: #E1E1E8;
-            font-size: 12px;
-            padding: 4px 10px;
-            border-radius: 5px;
-            """
-        )
-        layout.addWidget(task_status_label)
-
-        return task_widget
+        Scroll so that a source row (or the next visible one) is back at the
+        given viewport offset.
+        """
+        if source_row is None:
+            return
+        index = self._proxy.nearest_index(source_row)
+        if index.isValid():
+            # Lay out now (instead of at the next paint) to know where the row went
+            self.task_listWidget.doItemsLayout()
+            scroll_bar = self.task_listWidget.verticalScrollBar()
+            scroll_bar.setValue(scroll_bar.value() + self.task_listWidget.visualRect(index).top() - offset)
 
-    def _update_task_list_widget(self, tasks: List[Dict]):
+    def _restore_current_task(self):
         """
-        Updates the list widget with a new subset of tasks, typically after filtering.
+        Make the last current task current again if the filter hid it and
+        now shows it, without emitting taskFocused a second time.
         """
-        logger.debug("Updating the task list widget with filtered tasks.")
-        self.task_listWidget.clear()
-        for task in tasks:
-            item_widget = self._create_task_widget(task[TASK_NAME], task[TASK_STATUS])
-            list_item = QListWidgetItem()
-            list_item.setSizeHint(item_widget.sizeHint())
-            list_item.setData(Qt.UserRole, task)
-            self.task_listWidget.addItem(list_item)
-            self.task_listWidget.setItemWidget(list_item, item_widget)
+        if self.task_listWidget.currentIndex().isValid() or not self._current_task.isValid():
+            return
+        index = self._proxy.mapFromSource(self._model.index(self._current_task.row()))
+        if index.isValid():
+            self._restoring_current = True
+            try:
+                self.task_listWidget.setCurrentIndex(index)
+            finally:
+                self._restoring_current = False
 
     # ------------------------------
     # Public Methods
@@ -249,9 +273,103 @@ class TaskListWidget(QWidget):
             selection (dict, optional): Additional filter criteria. Defaults to None.
         """
         logger.debug(f"Filtering tasks with search_text='{search_text}' and selection={selection}")
-        task_filter = TaskFilter(self._tasks)
-        filtered_tasks = task_filter.filter(search_text, selection)
-        self._update_task_list_widget(filtered_tasks)
+        anchor, offset = self._scroll_anchor()
+        if self._proxy.set_filter(search_text, selection):
+            self._restore_current_task()
+            self._restore_scroll_anchor(anchor, offset)
+
+    def apply_delta(self, changed: List[Dict], deleted: List[str]):
+        """
+        Merges a task delta into the list, touching only the affected rows
+        instead of rebuilding the whole list. The filter decides which of
+        them are visible.
+
+        Args:
+            changed (List[Dict]): New or modified tasks.
+            deleted (List[str]): Names of removed tasks.
+        """
+        logger.debug(f"Applying task delta: {len(changed)} changed, {len(deleted)} deleted.")
+        # Patch existing rows, found by name rather than by a scan
+        new_tasks = []
+        for task in changed:
+            row = self._model.row_of(task[TASK_NAME])
+            if row < 0:
+                new_tasks.append(task)
+            else:
+                self._model.update_task(row, task)
+
+        removed_rows = [self._model.row_of(name) for name in deleted]
+        self._model.remove_rows([row for row in removed_rows if row >= 0])
+        self._model.append_tasks(new_tasks)
+
+    def bind_entity_store(self, entity_store, project_name: str):
+        """
+        Keeps the list in sync with an EntityStore: tasks of the project that
+        the store reports as added, changed or removed are patched into the list.
+
+        Args:
+            entity_store (EntityStore): The store to subscribe to.
+            project_name (str): The project the list displays.
+        """
+        self._entity_store = entity_store
+        self._project_name = project_name
+        entity_store.tasks_added.connect(self._on_store_tasks_added)
+        entity_store.tasks_changed.connect(self._on_store_tasks_changed)
+        entity_store.tasks_removed.connect(self._on_store_tasks_removed)
+
+    def unbind_entity_store(self):
+        """
+        Stops following the EntityStore the list was bound to, e.g. before
+        the list is discarded.
+        """
+        if self._entity_store is None:
+            return
+        self._entity_store.tasks_added.disconnect(self._on_store_tasks_added)
+        self._entity_store.tasks_changed.disconnect(self._on_store_tasks_changed)
+        self._entity_store.tasks_removed.disconnect(self._on_store_tasks_removed)
+        self._entity_store = None
+        self._project_name = None
+
+    def _on_store_tasks_added(self, project_name: str, task_names: List[str]):
+        if project_name == self._project_name:
+            self.apply_delta(self._entity_store.tasks(project_name, task_names), [])
+
+    def _on_store_tasks_changed(self, project_name: str, task_names: List[str]):
+        # Only patch tasks already listed; the rest arrive with their page.
+        if project_name != self._project_name:
+            return
+        listed = [name for name in task_names if self._model.row_of(name) >= 0]
+        changed = self._entity_store.tasks(project_name, listed)
+        if changed:
+            self.apply_delta(changed, [])
+
+    def _on_store_tasks_removed(self, project_name: str, task_names: List[str]):
+        if project_name == self._project_name:
+            self.apply_delta([], task_names)
+
+    def get_neighbour_tasks(self, task_name: str, count: int) -> List[Dict]:
+        """
+        Get the visible tasks around a task, nearest first, alternating
+        between the following and the preceding rows.
+
+        Args:
+            task_name (str): The task to look around.
+            count (int): Maximum number of tasks on each side.
+
+        Returns:
+            List[Dict]: Up to 2 * count task dictionaries.
+        """
+        index = self._proxy.mapFromSource(self._model.index(self._model.row_of(task_name)))
+        if not index.isValid():
+            return []
+
+        row = index.row()
+        neighbours = []
+        for offset in range(1, count + 1):
+            for neighbour_row in (row + offset, row - offset):
+                if 0 <= neighbour_row < self._proxy.rowCount():
+                    neighbours.append(self._proxy.index(neighbour_row).data(TaskRole))
+        return neighbours
 
     def set_selected_task(self, task_name: str, emit_signal: bool = False):
         """
@@ -263,19 +381,12 @@ class TaskListWidget(QWidget):
                 after selection. Defaults to False.
         """
         logger.debug(f"Setting selected task to '{task_name}', emit_signal={emit_signal}.")
-        found_item = None
-        task_data = None
-        for i in range(self.task_listWidget.count()):
-            item = self.task_listWidget.item(i)
-            task_data = item.data(Qt.UserRole)
-            if task_data and task_data.get(TASK_NAME) == task_name:
-                found_item = item
-                break
-
-        if found_item:
-            self.task_listWidget.setCurrentItem(found_item)
+        index = self._proxy.mapFromSource(self._model.index(self._model.row_of(task_name)))
+        if index.isValid():
+            self.task_listWidget.setCurrentIndex(index)
+            self.task_listWidget.scrollTo(index)
             if emit_signal:
-                self.taskSelected.emit(task_name, task_data)
+                self.taskSelected.emit(task_name, index.data(TaskRole))
         else:
             self.task_listWidget.clearSelection()
             logger.info(f"Task '{task_name}' not found in the list.")
@@ -284,57 +395,33 @@ class TaskListWidget(QWidget):
     # Event Handlers & Slots
     # ------------------------------
 
-    def _emit_task_selected(self, item: QListWidgetItem):
+    def _emit_task_selected(self, index: QModelIndex):
         """
-        Emit taskSelected signal with the task name when an item is clicked.
+        Emit taskSelected signal with the task name when a row is clicked.
         """
         logger.debug("Task item clicked.")
-        if not item:
-            return
+        task_data = index.data(TaskRole) if index.isValid() else None
+        if task_data:
+            self.taskSelected.emit(task_data[TASK_NAME], task_data)
 
-        task_data = item.data(Qt.UserRole)
-        item_widget = self.task_listWidget.itemWidget(item)
-        if item_widget:
-            name_label = item_widget.findChild(QLabel)
-
-            if name_label:
-                task_name = name_label.text()
-                self.taskSelected.emit(task_name, task_data)
-
-    def _highlight_selected_item(self, current: QListWidgetItem, previous: QListWidgetItem):
-        """
-        Update style to highlight the newly selected item and unhighlight the previous one.
-        """
-        logger.debug("Highlighting selected item and unhighlighting previous one.")
-        # Unhighlight previous
-        if previous:
-            prev_widget = self.task_listWidget.itemWidget(previous)
-            if prev_widget:
-                prev_widget.setStyleSheet(
-                    """
-                    background-color: #E1E1E8;
-                    border-radius: 5px;
-                    """
-                )
-
-        # Highlight current
-        if current:
-            curr_widget = self.task_listWidget.itemWidget(current)
-            if curr_widget:
-                curr_widget.setStyleSheet(
-                    """
-                    border-radius: 5px;
-                    background-color: rgba(0, 120, 215, 0.1); /* Light highlight */
-                    """
-                )
+    def _emit_task_focused(self, current: QModelIndex, previous: QModelIndex):
+        """
+        Emit taskFocused with the data of the new current row.
+        """
+        if not current.isValid():
+            return
+        self._current_task = QPersistentModelIndex(self._proxy.mapToSource(current))
+        task_data = current.data(TaskRole)
+        if task_data and not self._restoring_current:
+            self.taskFocused.emit(task_data[TASK_NAME], task_data)
 
     def _show_context_menu(self, position: QPoint):
         """
-        Display a context menu for the item at the given position.
+        Display a context menu for the row at the given position.
         """
         logger.debug("Showing context menu for a task item.")
-        item = self.task_listWidget.itemAt(position)
-        if item:
+        item = self.task_listWidget.indexAt(position)
+        if item.isValid():
             # Create the context menu
             context_menu = QMenu(self)
 
@@ -359,26 +446,26 @@ class TaskListWidget(QWidget):
     # Context Menu Action Handlers
     # ------------------------------
 
-    def open_task(self, item: QListWidgetItem):
+    def open_task(self, item: QModelIndex):
         """
         Handles the 'Open Task' action from the context menu.
         """
-        logger.debug(f"Open Task action triggered for item data: {item.data(Qt.UserRole)}")
-        print(f"Opening task: {item.data(Qt.UserRole)}")
+        logger.debug(f"Open Task action triggered for item data: {item.data(TaskRole)}")
+        print(f"Opening task: {item.data(TaskRole)}")
 
-    def delete_task(self, item: QListWidgetItem):
+    def delete_task(self, item: QModelIndex):
         """
         Handles the 'Delete Task' action from the context menu.
         """
-        logger.debug(f"Delete Task action triggered for item text: {item.text()}")
-        print(f"Deleting task: {item.text()}")
+        logger.debug(f"Delete Task action triggered for item text: {item.data()}")
+        print(f"Deleting task: {item.data()}")
 
-    def mark_task_done(self, item: QListWidgetItem):
+    def mark_task_done(self, item: QModelIndex):
         """
         Handles the 'Mark as Done' action from the context menu.
         """
-        logger.debug(f"Mark Task Done action triggered for item text: {item.text()}")
-        print(f"Marking task as done: {item.text()}")
+        logger.debug(f"Mark Task Done action triggered for item text: {item.data()}")
+        print(f"Marking task as done: {item.data()}")
 
 
 if __name__ == "__main__":
@@ -389,11 +476,11 @@ if __name__ == "__main__":
 
     # Example tasks
     tasks = [
-        {"task_name": "prj_e000_sc000_sh0000_task", "task_status": "NYS"},
-        {"task_name": "prj_e014_sc001_sh0010_lay", "task_status": "APP"},
-        {"task_name": "prj_e410_SC010_sh0145_bgl", "task_status": "EXT_RTK"},
-        {"task_name": "prj_sq0910_sh0562_abc", "task_status": "WFA"},
-        {"task_name": "prj_SEQ0450_SH1480_cmp", "task_status": "IN FARM"},
+        {TASK_NAME: "prj_e000_sc000_sh0000_task", TASK_STATUS: "NYS"},
+        {TASK_NAME: "prj_e014_sc001_sh0010_lay", TASK_STATUS: "APP"},
+        {TASK_NAME: "prj_e410_SC010_sh0145_bgl", TASK_STATUS: "EXT_RTK"},
+        {TASK_NAME: "prj_sq0910_sh0562_abc", TASK_STATUS: "WFA"},
+        {TASK_NAME: "prj_SEQ0450_SH1480_cmp", TASK_STATUS: "IN FARM"},
     ]
     task_status_colors = {
         "NYS": "blue",
@@ -0,0 +1,494 @@
+"""
+task_list_model.py
+
+Provides the TaskListModel, TaskFilterProxyModel and TaskItemDelegate
+classes behind TaskListWidget. The model holds every task of the list; the
+proxy shows the ones matching the current filter; the delegate paints each
+row (name and colour-coded status badge) directly, so no widget is created
+per task and only the rows in view are painted.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+from services.async_data_service import run_async
+from services.constants import TASK_NAME, TASK_STATUS
+from ui.utils.task_filter import TaskFilter
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Item data roles
+TaskRole = Qt.UserRole            # The task dictionary / TaskRecord
+StatusRole = Qt.UserRole + 1      # The task status
+StatusColorRole = Qt.UserRole + 2  # Badge colour of the status
+
+# Row look (matches the former per-row widgets)
+ROW_HEIGHT = 34
+ROW_RADIUS = 5
+ROW_PADDING = 10
+ROW_BACKGROUND = "#E1E1E8"
+ROW_SELECTED_BACKGROUND = "rgba(0, 120, 215, 0.1)"
+NAME_COLOR = "#010409"
+NAME_FONT_SIZE = 14
+BADGE_TEXT_COLOR = "#E1E1E8"
+BADGE_FONT_SIZE = 12
+BADGE_PADDING = (10, 4)  # horizontal, vertical
+DEFAULT_STATUS_COLOR = "gray"
+
+
+class TaskListModel(QAbstractListModel):
+    """
+    List model of tasks. Rows are looked up by task name through an index
+    that is rebuilt lazily after rows are removed or reset.
+    """
+
+    def __init__(self, tasks: List[Dict] = None, task_status_colors: Dict[str, str] = None, parent=None):
+        super().__init__(parent)
+        self._tasks = list(tasks) if tasks else []
+        self._task_status_colors = task_status_colors or {}
+        self._rows: Optional[Dict[str, int]] = None
+
+    # ------------------------------
+    # Qt Model Interface
+    # ------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._tasks):
+            return None
+        task = self._tasks[index.row()]
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return task[TASK_NAME]
+        if role == TaskRole:
+            return task
+        if role == StatusRole:
+            return task[TASK_STATUS]
+        if role == StatusColorRole:
+            return self._task_status_colors.get(task[TASK_STATUS], DEFAULT_STATUS_COLOR)
+        return None
+
+    # ------------------------------
+    # Tasks
+    # ------------------------------
+
+    def tasks(self) -> List[Dict]:
+        """Return the tasks of the model, in row order."""
+        return self._tasks
+
+    def task(self, row: int) -> Optional[Dict]:
+        """Return the task of a row, or None."""
+        return self._tasks[row] if 0 <= row < len(self._tasks) else None
+
+    def row_of(self, task_name: str) -> int:
+        """Return the row of a task, or -1."""
+        if self._rows is None:
+            self._rows = {task[TASK_NAME]: row for row, task in enumerate(self._tasks)}
+        return self._rows.get(task_name, -1)
+
+    def set_tasks(self, tasks: List[Dict]):
+        """Replace every row."""
+        self.beginResetModel()
+        self._tasks = list(tasks)
+        self._rows = None
+        self.endResetModel()
+
+    def append_tasks(self, tasks: List[Dict]):
+        """Add rows at the end."""
+        if not tasks:
+            return
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+        self._tasks.extend(tasks)
+        if self._rows is not None:
+            for row, task in enumerate(tasks, first):
+                self._rows[task[TASK_NAME]] = row
+        self.endInsertRows()
+
+    def update_task(self, row: int, task: Dict):
+        """Replace the task of a row and repaint it."""
+        self._tasks[row] = task
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_rows(self, rows: List[int]):
+        """Remove rows, given in any order."""
+        for row in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._tasks[row]
+            self.endRemoveRows()
+        self._rows = None
+
+    def set_task_status_colors(self, task_status_colors: Dict[str, str]):
+        """Set the badge colours and repaint every row."""
+        self._task_status_colors = task_status_colors or {}
+        if self._tasks:
+            self.dataChanged.emit(self.index(0), self.index(len(self._tasks) - 1), [StatusColorRole])
+
+
+class TaskFilterProxyModel(QAbstractListModel):
+    """
+    Shows the rows of a TaskListModel that match a search text and
+    selection, like a QSortFilterProxyModel, without one Python
+    filterAcceptsRow() call per row: the matching rows are computed in one
+    go by a TaskFilter kept across filter changes, and only rows added or
+    changed afterwards are matched one by one.
+
+    A filter change is a layout change: the source rows stay untouched and
+    persistent indexes (the current row, the selection) are carried over.
+
+    It is a list model with the mapping methods of QAbstractProxyModel
+    rather than a subclass of it: the view asks for an index of every row
+    each time it lays out the list, and QAbstractListModel answers in C++.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Visible source rows, in ascending order
+        self._rows: List[int] = []
+        self._search_text = ""
+        self._selection = None
+        self._task_filter: Optional[TaskFilter] = None
+        self._source_model = None
+
+    def sourceModel(self) -> TaskListModel:
+        return self._source_model
+
+    def setSourceModel(self, source_model: TaskListModel):
+        """Set the TaskListModel to filter (once per proxy)."""
+        self.beginResetModel()
+        self._source_model = source_model
+        self._task_filter = None
+        self._rows = self._matching_rows()
+        self.endResetModel()
+        self._index_tasks()
+
+        source_model.modelAboutToBeReset.connect(self._on_source_about_to_be_reset)
+        source_model.modelReset.connect(self._on_source_reset)
+        source_model.rowsInserted.connect(self._on_source_rows_inserted)
+        source_model.rowsAboutToBeRemoved.connect(self._on_source_rows_about_to_be_removed)
+        source_model.rowsRemoved.connect(self._on_source_rows_removed)
+        source_model.dataChanged.connect(self._on_source_data_changed)
+
+    # ------------------------------
+    # Filtering
+    # ------------------------------
+
+    def is_filtered(self) -> bool:
+        """True if a search text or selection filter is active."""
+        return bool(self._search_text.strip(", ")) or bool(self._selection)
+
+    def set_filter(self, search_text: str = "", selection: dict = None) -> bool:
+        """
+        Show only the tasks matching search_text and selection (see TaskFilter).
+
+        Returns:
+            bool: False if the visible rows are unchanged.
+        """
+        self._search_text = search_text or ""
+        self._selection = selection
+        rows = self._matching_rows()
+        if rows == self._rows:
+            return False
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        source_rows = [self._rows[index.row()] for index in persistent]
+        self._rows = rows
+        self.changePersistentIndexList(persistent, [self._index_of_source_row(row) for row in source_rows])
+        self.layoutChanged.emit()
+        return True
+
+    def nearest_index(self, source_row: int) -> QModelIndex:
+        """
+        Return the index of a source row or, if it is hidden, of the next
+        visible row (the last row if none follows).
+        """
+        if not self._rows:
+            return QModelIndex()
+        return self.index(min(bisect_left(self._rows, source_row), len(self._rows) - 1), 0)
+
+    def _filter(self) -> TaskFilter:
+        # Kept in step with the source rows: appended rows are picked up by
+        # the filter itself, removed and changed rows are reported to it.
+        if self._task_filter is None:
+            self._task_filter = TaskFilter(self.sourceModel().tasks())
+        return self._task_filter
+
+    def _index_tasks(self):
+        # Index the tasks as they are loaded rather than on the first
+        # keystroke; the first build of a long list runs on a worker thread.
+        if self.sourceModel() is not None:
+            self._filter().index_tasks(_run_in_background)
+
+    def _matching_rows(self) -> List[int]:
+        source_model = self.sourceModel()
+        if source_model is None:
+            return []
+        if not self.is_filtered():
+            return list(range(source_model.rowCount()))
+        return self._filter().filter_rows(self._search_text, self._selection)
+
+    def _accepts(self, task) -> bool:
+        return not self.is_filtered() or self._filter().matches(task, self._search_text, self._selection)
+
+    def _index_of_source_row(self, source_row: int) -> QModelIndex:
+        position = bisect_left(self._rows, source_row)
+        if position < len(self._rows) and self._rows[position] == source_row:
+            return self.index(position, 0)
+        return QModelIndex()
+
+    # ------------------------------
+    # Qt Model Interface & Mapping
+    # ------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or proxy_index.row() >= len(self._rows):
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        return self._index_of_source_row(source_index.row())
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        source_model = self.sourceModel()
+        return source_model.data(source_model.index(self._rows[index.row()], 0), role)
+
+    # ------------------------------
+    # Source Model Changes
+    # ------------------------------
+
+    def _on_source_about_to_be_reset(self):
+        self.beginResetModel()
+
+    def _on_source_reset(self):
+        self._task_filter = None
+        self._rows = self._matching_rows()
+        self.endResetModel()
+        self._index_tasks()
+
+    def _on_source_rows_inserted(self, parent, first, last):
+        count = last - first + 1
+        position = bisect_left(self._rows, first)
+        if position < len(self._rows):
+            # Inserted before existing rows: shift them, and re-index the tasks
+            # (the source model only appends, so this is not worth maintaining)
+            self._rows[position:] = [row + count for row in self._rows[position:]]
+            self._task_filter = None
+
+        source_model = self.sourceModel()
+        if self.is_filtered():
+            tasks = source_model.tasks()
+            accepted = [row for row in range(first, last + 1) if self._accepts(tasks[row])]
+        else:
+            accepted = list(range(first, last + 1))
+        if accepted:
+            self.beginInsertRows(QModelIndex(), position, position + len(accepted) - 1)
+            self._rows[position:position] = accepted
+            self.endInsertRows()
+        self._index_tasks()
+
+    def _on_source_rows_about_to_be_removed(self, parent, first, last):
+        start = bisect_left(self._rows, first)
+        end = bisect_right(self._rows, last)
+        if end > start:
+            self.beginRemoveRows(QModelIndex(), start, end - 1)
+            del self._rows[start:end]
+            self.endRemoveRows()
+
+    def _on_source_rows_removed(self, parent, first, last):
+        count = last - first + 1
+        position = bisect_left(self._rows, first)
+        self._rows[position:] = [row - count for row in self._rows[position:]]
+        if self._task_filter is not None:
+            self._task_filter.remove_rows(first, last)
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=()):
+        first, last = top_left.row(), bottom_right.row()
+        colors_only = bool(roles) and StatusColorRole in roles and len(roles) == 1
+        if self._task_filter is not None and not colors_only:
+            self._task_filter.update_rows(first, last)
+        if not self.is_filtered() or colors_only:
+            # Visibility cannot change: repaint the visible rows of the range
+            start, end = bisect_left(self._rows, first), bisect_right(self._rows, last)
+            if end > start:
+                self.dataChanged.emit(self.index(start, 0), self.index(end - 1, 0), list(roles))
+            return
+
+        # The tasks may have started or stopped matching the filter
+        tasks = self.sourceModel().tasks()
+        for source_row in range(first, last + 1):
+            position = bisect_left(self._rows, source_row)
+            shown = position < len(self._rows) and self._rows[position] == source_row
+            accepted = self._accepts(tasks[source_row])
+            if accepted and not shown:
+                self.beginInsertRows(QModelIndex(), position, position)
+                self._rows.insert(position, source_row)
+                self.endInsertRows()
+            elif shown and not accepted:
+                self.beginRemoveRows(QModelIndex(), position, position)
+                del self._rows[position]
+                self.endRemoveRows()
+            elif shown:
+                index = self.index(position, 0)
+                self.dataChanged.emit(index, index, list(roles))
+
+
+def _run_in_background(func, on_done):
+    """Run func on the data worker pool, then on_done with its result (None if it failed) on the GUI thread."""
+    def on_error(error):
+        logger.warning(f"Could not index the task list in the background: {error}")
+        on_done(None)
+
+    run_async(func).then(on_done, on_error)
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """
+    Paints a task row: a rounded card with the task name on the left and a
+    colour-coded status badge on the right.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._name_font = QFont()
+        self._name_font.setPixelSize(NAME_FONT_SIZE)
+        self._badge_font = QFont()
+        self._badge_font.setPixelSize(BADGE_FONT_SIZE)
+        self._badge_metrics = QFontMetrics(self._badge_font)
+        self._colors = {}
+
+    def _color(self, name):
+        color = self._colors.get(name)
+        if color is None:
+            color = self._colors[name] = _parse_color(name)
+        return color
+
+    def sizeHint(self, option, index):
+        # Rows take the width of the view
+        return QSize(0, ROW_HEIGHT)
+
+    def paint(self, painter: QPainter, option, index):
+        name = index.data(Qt.DisplayRole) or ""
+        status = index.data(StatusRole) or ""
+        selected = bool(option.state & QStyle.State_Selected)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        rect = QRectF(option.rect)
+        painter.setBrush(self._color(ROW_SELECTED_BACKGROUND if selected else ROW_BACKGROUND))
+        painter.drawRoundedRect(rect, ROW_RADIUS, ROW_RADIUS)
+
+        # Status badge, right-aligned
+        badge_width = self._badge_metrics.horizontalAdvance(status) + 2 * BADGE_PADDING[0]
+        badge_height = self._badge_metrics.height() + 2 * BADGE_PADDING[1]
+        badge = QRectF(
+            rect.right() - ROW_PADDING - badge_width,
+            rect.center().y() - badge_height / 2,
+            badge_width, badge_height
+        )
+        if status:
+            painter.setBrush(self._color(index.data(StatusColorRole) or DEFAULT_STATUS_COLOR))
+            painter.drawRoundedRect(badge, ROW_RADIUS, ROW_RADIUS)
+            painter.setFont(self._badge_font)
+            painter.setPen(self._color(BADGE_TEXT_COLOR))
+            painter.drawText(badge, Qt.AlignCenter, status)
+
+        # Task name, elided before the badge
+        name_rect = QRectF(rect.left() + ROW_PADDING, rect.top(),
+                           max(0.0, badge.left() - rect.left() - 2 * ROW_PADDING), rect.height())
+        painter.setFont(self._name_font)
+        painter.setPen(self._color(NAME_COLOR))
+        elided = QFontMetrics(self._name_font).elidedText(name, Qt.ElideRight, int(name_rect.width()))
+        painter.drawText(name_rect, Qt.AlignVCenter | Qt.AlignLeft, elided)
+        painter.restore()
+
+
+def _parse_color(name: str) -> QColor:
+    """
+    Parse a colour name, '#rrggbb' or CSS 'rgba(r, g, b, a)' (alpha 0-1).
+    """
+    if name.startswith("rgba("):
+        red, green, blue, alpha = (part.strip() for part in name[5:-1].split(","))
+        color = QColor(int(red), int(green), int(blue))
+        color.setAlphaF(float(alpha))
+        return color
+    color = QColor(name)
+    if not color.isValid():
+        logger.debug(f"Unknown status colour '{name}'; using {DEFAULT_STATUS_COLOR}.")
+        color = QColor(DEFAULT_STATUS_COLOR)
+    return color
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from PySide6.QtWidgets import QApplication, QListView
+
+    from services.compact_records import TaskRecord
+    from services.mock_backend import generate_tasks
+    from ui.components.core_widgets.task_list import TaskListWidget
+
+    app = QApplication(sys.argv)
+
+    # Keystroke-to-repaint latency while typing, then deleting, a search on 50k tasks.
+    NUM_TASKS = 50_000
+    tasks = [TaskRecord({TASK_NAME: task[TASK_NAME], TASK_STATUS: task[TASK_STATUS]})
+             for task in generate_tasks("DemoProject", NUM_TASKS)]
+    query = "sh0010"
+    keystrokes = [query[:length] for length in range(1, len(query) + 1)]
+    keystrokes += keystrokes[-2::-1] + [""]
+
+    def type_query(view, apply_filter):
+        latencies = []
+        for text in keystrokes:
+            start = time.perf_counter()
+            apply_filter(text)
+            view.viewport().repaint()
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    # Previous approach: filter, then reset the model with the filtered tasks
+    rebuild_model = TaskListModel(tasks)
+    rebuild_view = QListView()
+    rebuild_view.setUniformItemSizes(True)
+    rebuild_view.setModel(rebuild_model)
+    rebuild_view.setItemDelegate(TaskItemDelegate(rebuild_view))
+    rebuild_view.resize(500, 700)
+    rebuild_view.show()
+    rebuild_filter = TaskFilter(tasks)
+    rebuild_filter.filter("warm-up")
+    app.processEvents()
+    rebuild = type_query(rebuild_view, lambda text: rebuild_model.set_tasks(rebuild_filter.filter(text)))
+
+    widget = TaskListWidget(tasks)
+    widget.resize(500, 700)
+    widget.show()
+    # The indexes are built in the background when the tasks are loaded
+    while widget._proxy._filter().indexing:
+        app.processEvents()
+        time.sleep(0.01)
+    widget.set_selected_task(tasks[NUM_TASKS // 2][TASK_NAME])
+    proxy = type_query(widget.task_listWidget, widget.filter_tasks)
+
+    print(f"Keystroke to repaint, {NUM_TASKS} tasks (ms):")
+    for text, rebuild_seconds, proxy_seconds in zip(keystrokes, rebuild, proxy):
+        print(f"  {text!r:>10}: rebuild {rebuild_seconds * 1000:6.1f}, proxy {proxy_seconds * 1000:6.1f}")
+    print(f"  {'total':>10}: rebuild {sum(rebuild) * 1000:6.1f}, proxy {sum(proxy) * 1000:6.1f}")
+    print(f"  selection kept: {widget.task_listWidget.currentIndex().data() == tasks[NUM_TASKS // 2][TASK_NAME]}")
@@ -163,6 +163,20 @@ class TaskLogWidget(QWidget):
         self._tasks_data = tasks_data
         self._populate_tasks()
 
+    def add_task_data(self, task: dict, index: int = 0):
+        """
+        Insert a single task log without repopulating the list.
+
+        Args:
+            task (dict): The task log to add.
+            index (int): Position to insert at; 0 (the top) for the newest entry.
+        """
+        logger.debug(f"Adding task log at {index}: {task}")
+        index = max(0, min(index, len(self._tasks_data)))
+        # Copy rather than insert: the list may be shared with a cached response
+        self._tasks_data = self._tasks_data[:index] + [task] + self._tasks_data[index:]
+        self._insert_task_item(index, task)
+
     def _populate_tasks(self):
         """
         Clear and repopulate the list widget from self._tasks_data.
@@ -170,19 +184,25 @@ class TaskLogWidget(QWidget):
         logger.debug("Populating the task list widget with task data.")
         self._list_widget.clear()
 
-        for task in self._tasks_data:
-            task_widget = TaskContent(
-                task_status=task[TASK_STATUS],
-                username=task[USERNAME],
-                date=task[DATE],
-                comment=task[COMMENT],
-                task_status_color=task.get(STATUS_COLOR)
-            )
-
-            list_item = QListWidgetItem()
-            list_item.setSizeHint(task_widget.sizeHint())
-            self._list_widget.addItem(list_item)
-            self._list_widget.setItemWidget(list_item, task_widget)
+        for row, task in enumerate(self._tasks_data):
+            self._insert_task_item(row, task)
+
+    def _insert_task_item(self, row: int, task: dict):
+        """
+        Create the TaskContent widget of a task log and insert it at a row.
+        """
+        task_widget = TaskContent(
+            task_status=task[TASK_STATUS],
+            username=task[USERNAME],
+            date=task[DATE],
+            comment=task[COMMENT],
+            task_status_color=task.get(STATUS_COLOR)
+        )
+
+        list_item = QListWidgetItem()
+        list_item.setSizeHint(task_widget.sizeHint())
+        self._list_widget.insertItem(row, list_item)
+        self._list_widget.setItemWidget(list_item, task_widget)
 
 
 class MainWindow(QMainWindow):
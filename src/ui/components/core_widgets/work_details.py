@@ -5,6 +5,7 @@ from ui.components.forms.details_form import Ui_DetailsForm  # The auto-generate
 from ui.components.extensions.message_box import MessageBox
 
 from ui.utils.common import set_layout_visibility
+from ui.utils.update_generation import UpdateGeneration, UpdateGuard
 from services.constants import PREVIEW_PATH
 
 
@@ -23,6 +24,8 @@ class WorkDetailsWidget(QWidget, Ui_DetailsForm):
 
         self.message_box = MessageBox()
         self._details_data = details_data if details_data else {}
+        # Guards against responses for superseded selections
+        self._update_guard = UpdateGuard()
 
         self.header_label.setText(title)
         self.details_textEdit.setReadOnly(True)
@@ -118,6 +121,25 @@ class WorkDetailsWidget(QWidget, Ui_DetailsForm):
         else:
             raise ValueError("details_data must be a dictionary")
 
+    def begin_update(self) -> UpdateGeneration:
+        """
+        Start updating the widget for a newly selected work file. Responses
+        for earlier selections are discarded and their requests cancelled.
+        """
+        return self._update_guard.begin()
+
+    def apply_update(self, generation: UpdateGeneration, details_data) -> bool:
+        """
+        Set details_data fetched for a generation, unless it was superseded.
+
+        Returns:
+            bool: False if the data was discarded as stale.
+        """
+        if not self._update_guard.is_current(generation):
+            return False
+        self.details_data = details_data
+        return True
+
     def update_details(self, details):
         """
         Update the details text with the given dictionary.
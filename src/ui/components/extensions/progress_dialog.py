@@ -15,7 +15,8 @@ class ProgressDialog(QDialog):
         self.progress_bar = QProgressBar()
         self.progress_bar.setObjectName('progress_bar')
         self.progress_bar.setRange(0, 0)  # Indeterminate mode
-        self.layout().addWidget(QLabel(message))
+        self.message_label = QLabel(message)
+        self.layout().addWidget(self.message_label)
         self.layout().addWidget(self.progress_bar)
 
         # Cancel button
@@ -68,6 +69,13 @@ class ProgressDialog(QDialog):
             }
         """)
 
+    def set_progress(self, value, maximum, message=None):
+        """Switch to determinate mode and show value out of maximum."""
+        self.progress_bar.setRange(0, max(maximum, 1))
+        self.progress_bar.setValue(value)
+        if message is not None:
+            self.message_label.setText(message)
+
     def handle_cancel(self):
         """Emit the canceled signal and close the dialog."""
         self.canceled.emit()
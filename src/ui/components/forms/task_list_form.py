@@ -16,8 +16,7 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QFrame, QLineEdit, QListView,
-    QListWidget, QListWidgetItem, QSizePolicy, QVBoxLayout,
-    QWidget)
+    QSizePolicy, QVBoxLayout, QWidget)
 
 class Ui_TaskListForm(object):
     def setupUi(self, TaskListForm):
@@ -57,7 +56,7 @@ class Ui_TaskListForm(object):
 
         self.verticalLayout.addWidget(self.header_line)
 
-        self.task_listWidget = QListWidget(self.MainContainer)
+        self.task_listWidget = QListView(self.MainContainer)
         self.task_listWidget.setObjectName(u"task_listWidget")
         self.task_listWidget.setFrameShape(QFrame.NoFrame)
         self.task_listWidget.setFrameShadow(QFrame.Plain)
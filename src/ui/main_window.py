@@ -261,7 +261,7 @@ class MainWindow(QMainWindow):
         self.top_bar_manager.add_project_section()
 
         # Set project data on TaskMancerPage and switch
-        self.task_mancer_page.set_project(project_name)
+        self.task_mancer_page.set_project(project_name, username=username)
         self.stack.setCurrentWidget(self.task_mancer_page)
 
     # --------------------
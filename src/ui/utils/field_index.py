@@ -0,0 +1,90 @@
+"""
+field_index.py
+
+Provides FieldIndex, hash indexes from the naming-convention fields of
+lower-cased task names (episode, scene, shot, task, ...) to the rows
+holding them.
+
+Each name is parsed once when it is indexed, so a selection of episodes,
+scenes or tasks becomes a union of exact posting lists rather than a
+substring scan of every name (which would also match "sc00100" for
+"sc0010"). Names the convention does not parse are kept in their own
+posting list and matched by substring, as before.
+"""
+
+import logging
+from typing import Iterable, List, Optional
+
+from services.naming_convention import NamingConvention, naming_convention
+from ui.utils.posting_index import PostingIndex
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Key of the names the naming convention does not parse.
+UNPARSED = None
+
+
+class FieldIndex(PostingIndex):
+    """
+    Field index of a list of lower-cased names.
+
+    Attributes:
+        names (List[str]): The indexed names, by row.
+        convention (NamingConvention): Parser of the names.
+    """
+
+    def __init__(self, names: Iterable[str] = (), convention: Optional[NamingConvention] = None):
+        self.convention = convention or naming_convention
+        super().__init__(names)
+
+    @property
+    def names(self) -> List[str]:
+        return self.values
+
+    def _keys(self, name):
+        fields = self.convention.parse(name)
+        if fields is None:
+            return (UNPARSED,)
+        return [(field, value) for field, value in fields.items() if value is not None]
+
+    def lookup(self, field: str, values: Iterable[str]) -> List[int]:
+        """
+        Return the ascending rows whose field is one of values, plus the
+        unparsed rows whose name contains one of them.
+        """
+        values = {value.lower() for value in values}
+        ids = set()
+        for value in values:
+            ids.update(self._postings.get((field, value), ()))
+        rows = self._to_rows(ids)
+
+        unparsed = self._postings.get(UNPARSED)
+        if unparsed:
+            names = self.values
+            extra = self._to_rows(unparsed, lambda row: any(value in names[row] for value in values))
+            if extra:
+                rows = sorted(rows + extra)
+        return rows
+
+
+if __name__ == "__main__":
+    import timeit
+
+    from services.constants import TASK_NAME
+    from services.mock_backend import generate_tasks
+
+    names = [task[TASK_NAME].lower() for task in generate_tasks("DemoProject", 100_000)]
+    names[:3] = ["hl_bgl_sc0910_sh0010", "animate scene e003", "prj_e003_sc00100_sh0010_lay"]
+    build = timeit.default_timer()
+    index = FieldIndex(names)
+    build = timeit.default_timer() - build
+    print(f"Indexed {len(names)} names in {build * 1000:.0f} ms: {index.stats()}")
+
+    for field, values in (("episode", ["e003"]), ("scene", ["sc0010", "sc004"]), ("task", ["bgl", "lay"])):
+        rows = index.lookup(field, values)
+        lookup = min(timeit.repeat(lambda: index.lookup(field, values), number=1, repeat=3))
+        print(f"  {field:>8} {values}: {len(rows):>6} rows in {lookup * 1000:.2f} ms")
+    assert 1 in index.lookup("episode", ["e003"])
+    assert 2 not in index.lookup("scene", ["sc0010"])
+    assert 0 in index.lookup("task", ["BGL"])
@@ -0,0 +1,134 @@
+"""
+posting_index.py
+
+Provides PostingIndex, the base of the inverted indexes of a task list
+(TrigramIndex, FieldIndex): a hash map from keys derived from each row's
+value to the posting list of rows holding them, kept in step with the
+list by extend(), remove() and replace().
+
+Rows are identified internally by ids that never change, so rows can be
+removed or replaced without renumbering the posting lists; ids are mapped
+back to rows only when a lookup returns.
+"""
+
+import logging
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List, Optional
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class PostingIndex:
+    """
+    Inverted index of a list of values. Subclasses define _keys().
+
+    Attributes:
+        values (list): The indexed values, by row.
+    """
+
+    def __init__(self, values: Iterable = ()):
+        self.values = []
+        # Row -> id, and key -> ids in ascending order
+        self._ids = array("i")
+        self._postings = {}
+        self._next_id = 0
+        # Id -> row; None while ids and rows coincide
+        self._rows: Optional[dict] = None
+        self._rows_stale = False
+        self.extend(values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def _keys(self, value) -> Iterable:
+        """Return the distinct keys a value is indexed under."""
+        raise NotImplementedError
+
+    # ------------------------------
+    # Maintenance
+    # ------------------------------
+
+    def extend(self, values: Iterable):
+        """Index values appended to the end of the list."""
+        for value in values:
+            row_id = self._next_id
+            self._next_id += 1
+            if self._rows is not None:
+                self._rows[row_id] = len(self.values)
+            self.values.append(value)
+            self._ids.append(row_id)
+            self._index(value, row_id)
+
+    def remove(self, first: int, last: int):
+        """Unindex rows first to last (inclusive), removed from the list."""
+        for row in range(first, last + 1):
+            self._unindex(self.values[row], self._ids[row])
+        del self.values[first:last + 1]
+        del self._ids[first:last + 1]
+        # Rows after the removed ones moved up
+        self._rows_stale = True
+
+    def replace(self, row: int, value):
+        """Re-index a row whose value changed."""
+        if value == self.values[row]:
+            return
+        self._unindex(self.values[row], self._ids[row])
+        # A fresh id keeps every posting list in ascending order
+        row_id = self._next_id
+        self._next_id += 1
+        self.values[row] = value
+        self._ids[row] = row_id
+        self._index(value, row_id)
+        self._rows_stale = True
+
+    def _index(self, value, row_id):
+        postings = self._postings
+        for key in self._keys(value):
+            posting = postings.get(key)
+            if posting is None:
+                posting = postings[key] = array("i")
+            posting.append(row_id)
+
+    def _unindex(self, value, row_id):
+        for key in self._keys(value):
+            posting = self._postings[key]
+            del posting[bisect_left(posting, row_id)]
+            if not posting:
+                del self._postings[key]
+
+    # ------------------------------
+    # Lookup
+    # ------------------------------
+
+    def rows(self, key) -> List[int]:
+        """Return the ascending rows indexed under key."""
+        return self._to_rows(self._postings.get(key, ()))
+
+    def _to_rows(self, ids: Iterable[int], accept=None) -> List[int]:
+        """
+        Return the ascending rows of ids, optionally keeping only the rows
+        for which accept(row) is true. ids must be ascending or a set.
+        """
+        if self._rows is None and not self._rows_stale:
+            # Ids are still the rows
+            rows = ids if isinstance(ids, array) else sorted(ids)
+            return list(rows) if accept is None else [row for row in rows if accept(row)]
+        id_rows = self._id_rows()
+        rows = map(id_rows.__getitem__, ids)
+        return sorted(rows if accept is None else filter(accept, rows))
+
+    def _id_rows(self):
+        if self._rows is None or self._rows_stale:
+            self._rows = {row_id: row for row, row_id in enumerate(self._ids)}
+            self._rows_stale = False
+        return self._rows
+
+    def stats(self) -> dict:
+        """Return the number of values, distinct keys and postings."""
+        return {
+            "values": len(self.values),
+            "keys": len(self._postings),
+            "postings": sum(len(posting) for posting in self._postings.values()),
+        }
@@ -1,13 +1,55 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
 from services.constants import TASK_NAME, TASK_STATUS
+from services.compact_records import ABSENT, TaskRecord, task_statuses
+from services.naming_convention import naming_convention
+from ui.utils.field_index import FieldIndex
+from ui.utils.trigram_index import TrigramIndex
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Lists at least this long are filtered through indexes: a trigram index
+# for the search, field indexes for the name selection, and a status code
+# column (looked up with NumPy when available).
+INDEXED_MIN_TASKS = 2000
+
+# The search scans the rows left by the selection, rather than looking up
+# the whole list, when there are fewer than this.
+SCAN_MAX_ROWS = 2000
+
+# Selection keys matched against the fields of the task name.
+NAME_SELECTION_KEYS = ("task", "episode", "scene")
+
+# Number of recent results kept, to answer repeated queries (e.g. while
+# backspacing) and to narrow refined ones.
+RESULT_CACHE_SIZE = 16
 
 
 class TaskFilter:
-    def __init__(self, tasks):
+    def __init__(self, tasks, convention=None):
         """
         Initialize the TaskFilter with a list of tasks.
-        :param tasks: List of task dictionaries.
+        :param tasks: List of task dictionaries. Tasks appended to the list
+            later are picked up by the next filter() call; report other
+            changes with remove_rows() and update_rows().
+        :param convention: NamingConvention parsing the task names for the
+            task, episode and scene selection (the studio one by default).
         """
         self.original_tasks = tasks
+        self.convention = convention or naming_convention
+        self._indexes = None
+        # Bumped when rows are removed or changed, to spot stale background builds
+        self._version = 0
+        self._indexing = False
+        # (search criteria, selection) -> rows, least recently used first,
+        # covering the first _results_length tasks
+        self._results = OrderedDict()
+        self._results_length = 0
 
     def filter(self, search_text="", selection=None):
         """
@@ -16,13 +58,72 @@ class TaskFilter:
         :param selection: A dictionary of selection filters.
         :return: List of filtered tasks.
         """
+        tasks = self.original_tasks
+        return [tasks[row] for row in self.filter_rows(search_text, selection)]
+
+    def filter_rows(self, search_text="", selection=None):
+        """
+        Same as filter(), returning the indices of the matching tasks.
+        :param search_text: A comma-separated string for search criteria.
+        :param selection: A dictionary of selection filters.
+        :return: Ascending list of indices into the task list.
+        """
         search_criteria = self._parse_search_criteria(search_text)
+        query = (frozenset(search_criteria), self._selection_key(selection))
+        results = self._results
+        if self._results_length != len(self.original_tasks):
+            self._add_appended_rows()
+
+        rows = results.get(query)
+        if rows is not None:
+            results.move_to_end(query)
+            return list(rows)
+
+        base = self._refined_rows(query)
+        if base is not None:
+            rows = self._narrow(base, search_criteria, selection)
+        elif len(self.original_tasks) >= INDEXED_MIN_TASKS and not self._indexing:
+            rows = self._filter_indexed(search_criteria, selection)
+        else:
+            rows = self._narrow(range(len(self.original_tasks)), search_criteria, selection)
+
+        results[query] = tuple(rows)
+        if len(results) > RESULT_CACHE_SIZE:
+            results.popitem(last=False)
+        return rows
+
+    def _narrow(self, rows, search_criteria, selection):
+        """Rows among the given ones whose task matches the search and selection."""
+        tasks = self.original_tasks
+        status_codes = self._status_codes(selection)
         return [
-            task for task in self.original_tasks
-            if self._matches_search_criteria(task, search_criteria)
-               and self._matches_selection(task, selection)
+            row for row in rows
+            if self._matches_search_criteria(tasks[row], search_criteria)
+               and self._matches_selection(tasks[row], selection, status_codes)
         ]
 
+    def matches(self, task, search_text="", selection=None):
+        """
+        Checks a single task (e.g. one added or changed after filtering).
+        :param task: A task dictionary.
+        :param search_text: A comma-separated string for search criteria.
+        :param selection: A dictionary of selection filters.
+        :return: True if filter() would keep the task.
+        """
+        return (self._matches_search_criteria(task, self._parse_search_criteria(search_text))
+                and self._matches_selection(task, selection, self._status_codes(selection)))
+
+    def _status_codes(self, selection):
+        """
+        Codes of the statuses matching the status filter, or None. Compact
+        records are matched on their status code; the status table is only
+        a handful of strings.
+        """
+        status_filter = (selection or {}).get("status")
+        return task_statuses.codes_matching(
+            lambda status: self._matches_values(status, status_filter)
+        ) if status_filter else None
+
     def _parse_search_criteria(self, search_text):
         """Splits search text into a list of lowercase criteria."""
         return [criterion.strip().lower() for criterion in search_text.split(",") if criterion.strip()]
@@ -33,32 +134,340 @@ class TaskFilter:
             return True
         return any(criterion in task[TASK_NAME].lower() for criterion in search_criteria)
 
-    def _matches_selection(self, task, selection):
-        """Checks if a task matches all active selection filters."""
+    @staticmethod
+    def _matches_values(value, filter_values):
+        """Case-insensitive matching for a task value and filter values."""
+        if not filter_values:
+            return True
+        if not isinstance(filter_values, list):
+            filter_values = [filter_values]
+        return any(fv.lower() in value.lower() for fv in filter_values)
+
+    @staticmethod
+    def _matches_field(value, filter_values):
+        """Exact, case-insensitive matching for a name field and filter values."""
+        if not isinstance(filter_values, list):
+            filter_values = [filter_values]
+        return value is not None and any(fv.lower() == value for fv in filter_values)
+
+    def _matches_selection(self, task, selection, status_codes=None):
+        """
+        Checks if a task matches all active selection filters. Task, episode
+        and scene filters match the fields of names following the naming
+        convention exactly, and other names by substring.
+        """
         if not selection:  # No selection filters mean no filtering
             return True
 
-        def matches_filter(value, filter_values):
-            """Case-insensitive matching for a task value and filter values."""
-            if not filter_values:
-                return True
-            if not isinstance(filter_values, list):
-                filter_values = [filter_values]
-            return any(fv.lower() in value.lower() for fv in filter_values)
-
-        return (
-                matches_filter(task[TASK_NAME], selection.get("task")) and
-                matches_filter(task[TASK_NAME], selection.get("episode")) and
-                matches_filter(task[TASK_NAME], selection.get("scene")) and
-                matches_filter(task[TASK_STATUS], selection.get("status"))
+        if status_codes is not None and type(task) is TaskRecord and task.status_code != ABSENT:
+            if task.status_code not in status_codes:
+                return False
+        elif not self._matches_values(task[TASK_STATUS], selection.get("status")):
+            return False
+
+        name_filters = [(key, selection[key]) for key in NAME_SELECTION_KEYS if selection.get(key)]
+        if not name_filters:
+            return True
+        fields = self.convention.parse(task[TASK_NAME])
+        if fields is None:
+            return all(self._matches_values(task[TASK_NAME], filter_values) for _, filter_values in name_filters)
+        return all(self._matches_field(fields.get(key), filter_values) for key, filter_values in name_filters)
+
+    # ------------------------------
+    # Recent Results
+    # ------------------------------
+
+    @staticmethod
+    def _selection_key(selection):
+        """Hashable form of the active selection filters (case-insensitive, like the matching)."""
+        key = {}
+        for name in NAME_SELECTION_KEYS + ("status",):
+            filter_values = (selection or {}).get(name)
+            if filter_values:
+                if not isinstance(filter_values, list):
+                    filter_values = [filter_values]
+                key[name] = frozenset(fv.lower() for fv in filter_values)
+        return frozenset(key.items())
+
+    @staticmethod
+    def _query_filters(query):
+        """The search criteria and selection of a recent result's query."""
+        criteria, selection = query
+        return list(criteria), {key: list(values) for key, values in selection}
+
+    def _add_appended_rows(self):
+        """Adds the matching tasks appended since the recent results were computed."""
+        first, length = self._results_length, len(self.original_tasks)
+        if length < first:
+            # Tasks were removed without remove_rows(); nothing to fix up from
+            self._results.clear()
+        else:
+            self._replace_result_rows(first, length - 1)
+        self._results_length = length
+
+    def _replace_result_rows(self, first, last, removed=False):
+        """
+        Fixes up the recent results for rows first to last (inclusive):
+        drops them and the rows after move up if they were removed,
+        otherwise re-checks their tasks.
+        """
+        shift = last - first + 1 if removed else 0
+        for query, rows in self._results.items():
+            start, end = bisect_left(rows, first), bisect_right(rows, last)
+            if removed:
+                matching = ()
+            else:
+                matching = tuple(self._narrow(range(first, last + 1), *self._query_filters(query)))
+            tail = rows[end:] if not shift else tuple(row - shift for row in rows[end:])
+            self._results[query] = rows[:start] + matching + tail
+
+    @staticmethod
+    def _refines(query, previous):
+        """
+        Checks if every task matching query also matches previous: each
+        search criterion contains a previous one (e.g. "sc0910" after
+        "sc09"), and each previous selection filter is kept with the same
+        or fewer values.
+        """
+        criteria, selection = query
+        previous_criteria, previous_selection = previous
+        if previous_criteria and not (
+                criteria and all(any(old in new for old in previous_criteria) for new in criteria)):
+            return False
+        selection = dict(selection)
+        return all(key in selection and selection[key] <= values for key, values in previous_selection)
+
+    def _refined_rows(self, query):
+        """
+        The smallest recent result of a query refined by this one, if it is
+        worth narrowing: small lists always are; indexed ones only once
+        the result is small enough that checking its tasks beats the index.
+        """
+        base = None
+        for previous, rows in self._results.items():
+            if (base is None or len(rows) < len(base)) and self._refines(query, previous):
+                base = rows
+        if (base is not None and len(self.original_tasks) >= INDEXED_MIN_TASKS and not self._indexing
+                and len(base) >= SCAN_MAX_ROWS):
+            return None
+        return base
+
+    # ------------------------------
+    # Indexed Filtering
+    # ------------------------------
+
+    @property
+    def indexing(self):
+        """True while the indexes are being built in the background."""
+        return self._indexing
+
+    def index_tasks(self, run_in_background=None):
+        """
+        Indexes the tasks added since the last call (all of them the first
+        time), so that filtering a long list does not build its indexes on
+        the first keystroke. Call it whenever tasks are loaded.
+        :param run_in_background: Optional callable(func, on_done) running
+            func() on a worker thread and on_done(result) back on this one
+            (on_done(None) if func failed). The first build of a long list
+            then runs there; until it is done, filter() checks the tasks
+            one by one.
+        """
+        if len(self.original_tasks) < INDEXED_MIN_TASKS or self._indexing:
+            return
+        if self._indexes is not None or run_in_background is None:
+            self._sync_index()
+            return
+        # Records are never changed in place, so a copy of the list can be
+        # indexed while the list itself keeps changing.
+        tasks = list(self.original_tasks)
+        version = self._version
+        self._indexing = True
+        run_in_background(
+            lambda: TaskIndexes(tasks, self.convention),
+            lambda indexes: self._install_indexes(indexes, version, run_in_background)
         )
 
+    def _install_indexes(self, indexes, version, run_in_background):
+        self._indexing = False
+        if indexes is None or self._indexes is not None:
+            return
+        if version != self._version:
+            # Rows were removed or changed during the build
+            self.index_tasks(run_in_background)
+            return
+        self._indexes = indexes
+        self._sync_index()
+
+    def remove_rows(self, first, last):
+        """
+        Keeps the indexes and recent results in step after tasks were removed
+        from the list.
+        :param first: Index of the first removed task.
+        :param last: Index of the last removed task (inclusive).
+        """
+        # Tasks appended after the recent results were computed are checked
+        # when filtering next
+        last_seen = min(last, self._results_length - 1)
+        if first <= last_seen:
+            self._replace_result_rows(first, last_seen, removed=True)
+            self._results_length -= last_seen - first + 1
+        self._version += 1
+        if self._indexes is not None and first < len(self._indexes):
+            self._indexes.remove(first, min(last, len(self._indexes) - 1))
+
+    def update_rows(self, first, last):
+        """
+        Keeps the indexes and recent results in step after tasks were replaced
+        or changed in place.
+        :param first: Index of the first changed task.
+        :param last: Index of the last changed task (inclusive).
+        """
+        last_seen = min(last, self._results_length - 1)
+        if last_seen - first + 1 > SCAN_MAX_ROWS:
+            # Re-checking that many tasks for every result costs more than
+            # filtering again
+            self._results.clear()
+        elif first <= last_seen:
+            self._replace_result_rows(first, last_seen)
+        self._version += 1
+        if self._indexes is None:
+            return
+        for row in range(first, min(last + 1, len(self._indexes))):
+            self._indexes.replace(row, self.original_tasks[row])
+
+    def _sync_index(self):
+        """Builds the indexes on first use, then indexes appended tasks."""
+        if self._indexes is None:
+            self._indexes = TaskIndexes(convention=self.convention)
+        if len(self._indexes) < len(self.original_tasks):
+            self._indexes.extend(self.original_tasks[len(self._indexes):])
+
+    def _filter_indexed(self, search_criteria, selection):
+        """
+        Same rows as the per-task filter. Task, episode and scene filters are
+        looked up in the field indexes and intersected; each search criterion
+        is looked up in the trigram index, or scanned over the rows left when
+        too short for the index to help; the status filter is checked on the
+        status code column.
+        """
+        self._sync_index()
+        rows = None  # Every row
+        for key in NAME_SELECTION_KEYS:
+            filter_values = selection.get(key) if selection else None
+            if filter_values:
+                if not isinstance(filter_values, list):
+                    filter_values = [filter_values]
+                rows = _intersect(rows, self._indexes.fields.lookup(key, filter_values))
+
+        if search_criteria and rows != []:
+            rows = _intersect(rows, self._search_rows(search_criteria, rows))
+
+        status_codes = self._status_codes(selection)
+        if status_codes is not None:
+            rows = self._rows_with_status(rows, status_codes)
+        return list(range(len(self._indexes))) if rows is None else rows
+
+    def _search_rows(self, search_criteria, candidates):
+        """Ascending rows matching any criterion; scanned criteria only check the candidate rows (None: all)."""
+        if candidates is not None and len(candidates) < SCAN_MAX_ROWS:
+            names = self._indexes.trigrams.names
+            return [row for row in candidates if any(criterion in names[row] for criterion in search_criteria)]
+        found = [self._indexes.trigrams.search(criterion) for criterion in search_criteria]
+        if len(found) == 1 and found[0] is not None:
+            return found[0]
+        matched = set()
+        for rows_found in found:
+            if rows_found is not None:
+                matched.update(rows_found)
+        scanned = [criterion for criterion, rows_found in zip(search_criteria, found) if rows_found is None]
+        names = self._indexes.trigrams.names
+        for criterion in scanned:
+            if candidates is None:
+                matched.update(row for row, name in enumerate(names) if criterion in name)
+            else:
+                matched.update(row for row in candidates if criterion in names[row])
+        return sorted(matched)
+
+    def _rows_with_status(self, rows, status_codes):
+        """Rows (None: all) whose status code is one of status_codes."""
+        column = self._indexes.status_codes
+        if rows is None:
+            if numpy is not None:
+                # Lookup table by code; ABSENT (-1) maps to the last, False entry
+                table = numpy.zeros(len(task_statuses) + 1, dtype=bool)
+                if status_codes:
+                    table[list(status_codes)] = True
+                return numpy.flatnonzero(table[numpy.frombuffer(column, dtype=numpy.int32)]).tolist()
+            rows = range(len(column))
+        return [row for row in rows if column[row] in status_codes]
+
+
+class TaskIndexes:
+    """
+    The indexes of a task list: a trigram index of the lower-cased names,
+    field indexes of their naming-convention fields and a status code
+    column. Kept in step with the list by TaskFilter; a first build may run
+    on a worker thread (see TaskFilter.index_tasks()).
+    """
+
+    def __init__(self, tasks=(), convention=None):
+        self.trigrams = TrigramIndex()
+        self.fields = FieldIndex(convention=convention)
+        self.status_codes = array("i")
+        self.extend(tasks)
+
+    def __len__(self):
+        return len(self.status_codes)
+
+    def extend(self, tasks):
+        """Index tasks appended to the list."""
+        names = [task[TASK_NAME].lower() for task in tasks]
+        self.trigrams.extend(names)
+        self.fields.extend(names)
+        self.status_codes.extend(_status_code(task) for task in tasks)
+
+    def remove(self, first, last):
+        """Unindex rows first to last (inclusive)."""
+        self.trigrams.remove(first, last)
+        self.fields.remove(first, last)
+        del self.status_codes[first:last + 1]
+
+    def replace(self, row, task):
+        """Re-index a row holding a new or changed task."""
+        name = task[TASK_NAME].lower()
+        self.trigrams.replace(row, name)
+        self.fields.replace(row, name)
+        self.status_codes[row] = _status_code(task)
+
+
+def _status_code(task):
+    """Code of a task's status in task_statuses, or ABSENT."""
+    if type(task) is TaskRecord and task.status_code != ABSENT:
+        return task.status_code
+    status = task[TASK_STATUS]
+    return task_statuses.code(status) if isinstance(status, str) else ABSENT
+
+
+def _intersect(rows, other_rows):
+    """Intersection of two ascending row lists (rows None: all rows)."""
+    if rows is None:
+        return other_rows
+    if len(rows) > len(other_rows):
+        rows, other_rows = other_rows, rows
+    other_rows = set(other_rows)
+    return [row for row in rows if row in other_rows]
+
 
 if __name__ == '__main__':
+    import timeit
+
+    from services.mock_backend import generate_tasks
+    from services.compact_records import TaskRecord
+
     tasks = [
-        {"task_name": "Animate Scene 1", "task_status": "Approved"},
-        {"task_name": "Lighting Scene 2", "task_status": "Pending"},
-        {"task_name": "Layout Scene 1", "task_status": "Completed"}
+        {TASK_NAME: "Animate Scene 1", TASK_STATUS: "Approved"},
+        {TASK_NAME: "Lighting Scene 2", TASK_STATUS: "Pending"},
+        {TASK_NAME: "Layout Scene 1", TASK_STATUS: "Completed"}
     ]
 
     selection = {"task": ["animate", "layout"], "status": ["approved"]}
@@ -67,3 +476,96 @@ if __name__ == '__main__':
     task_filter = TaskFilter(tasks)
     filtered = task_filter.filter(search_text, selection)
     print(filtered)
+
+    # Per-keystroke cost on a 100k task project (a frame is ~16 ms).
+    records = [TaskRecord(task) for task in generate_tasks("DemoProject", 100_000)]
+    cases = [
+        ("search", "sh0010", None),
+        ("short search", "fx", None),
+        ("selection", "", {"episode": ["e003"], "scene": ["sc004"], "status": ["wip"]}),
+        ("both", "lgt, sc009_sh01", {"episode": ["e003"], "task": ["lay", "lgt"]}),
+        ("status", "", {"status": ["wip"]}),
+    ]
+    indexed = TaskFilter(records)
+    build = min(timeit.repeat(lambda: TaskFilter(records).index_tasks(), number=1, repeat=1))
+    indexed.index_tasks()
+    print(f"indexes built when loaded in {build * 1000:.0f} ms"
+          f"{'' if numpy is not None else ' (NumPy not installed)'}")
+    for label, search_text, selection in cases:
+        indexed_min_tasks, INDEXED_MIN_TASKS = INDEXED_MIN_TASKS, len(records) + 1
+        per_task = min(timeit.repeat(lambda: TaskFilter(records).filter(search_text, selection), number=1, repeat=3))
+        expected = TaskFilter(records).filter(search_text, selection)
+        INDEXED_MIN_TASKS = indexed_min_tasks
+        lookup = min(timeit.repeat(lambda: (indexed._results.clear(), indexed.filter(search_text, selection)),
+                                   number=1, repeat=3))
+        assert indexed.filter(search_text, selection) == expected
+        print(f"{label:>12}: {len(expected)} tasks, per task {per_task * 1000:.1f} ms, indexed {lookup * 1000:.1f} ms")
+
+    # Typing "e003_sc0091" then backspacing it, with and without recent results
+    typed = "e003_sc0091"
+    keystrokes = [typed[:length] for length in range(1, len(typed) + 1)]
+    keystrokes += keystrokes[-2::-1] + [""]
+    for label, task_filter in (("100k tasks", indexed), ("1500 tasks", TaskFilter(records[:1500]))):
+        expected = {}
+        for result_cache_size in (0, 16):
+            RESULT_CACHE_SIZE = result_cache_size
+            task_filter._results.clear()
+            costs = []
+            for search_text in keystrokes:
+                start = timeit.default_timer()
+                rows = task_filter.filter_rows(search_text, {"task": ["lay", "lgt"]})
+                costs.append(timeit.default_timer() - start)
+                expected.setdefault(search_text, rows)
+                assert rows == expected[search_text]
+            print(f"{label:>12} keystrokes, {result_cache_size:>2} recent results: total {sum(costs) * 1000:.1f} ms, "
+                  f"slowest {max(costs) * 1000:.2f} ms")
+
+    # The same keystrokes while a task changes and one is added between each of them
+    # (e.g. streamed pages and pushed updates), with the recent results fixed up or dropped
+    for label, size in (("100k tasks", len(records)), ("1500 tasks", 1500)):
+        costs = {}
+        for fix_up in (False, True):
+            changing = records[:size]
+            task_filter = TaskFilter(changing)
+            task_filter.index_tasks()
+            RESULT_CACHE_SIZE = 16
+            total = slowest = 0
+            for position, search_text in enumerate(keystrokes):
+                row = position * 37 % len(changing)
+                changing[row] = changing[row].merged({TASK_STATUS: "APP" if position % 2 else "WIP"})
+                task_filter.update_rows(row, row)
+                changing.append(TaskRecord({TASK_NAME: f"p_e003_sc0091_sh{position:04d}_lay", TASK_STATUS: "WIP"}))
+                task_filter.index_tasks()
+                if not fix_up:
+                    task_filter._results.clear()
+                start = timeit.default_timer()
+                rows = task_filter.filter_rows(search_text, {"task": ["lay", "lgt"]})
+                cost = timeit.default_timer() - start
+                total, slowest = total + cost, max(slowest, cost)
+                indexed_min_tasks, INDEXED_MIN_TASKS = INDEXED_MIN_TASKS, len(changing) + 1
+                assert rows == TaskFilter(changing).filter_rows(search_text, {"task": ["lay", "lgt"]})
+                INDEXED_MIN_TASKS = indexed_min_tasks
+            print(f"{label:>12} keystrokes between changes, recent results {'fixed up' if fix_up else 'dropped':>8}: "
+                  f"total {total * 1000:.1f} ms, slowest {slowest * 1000:.2f} ms")
+
+    # Indexes built in the background: the filter checks tasks one by one until they are installed
+    builds = []
+    background = TaskFilter(records)
+    background.index_tasks(lambda func, on_done: builds.append((func, on_done)))
+    assert background.indexing and background.filter_rows("sh0010") == indexed.filter_rows("sh0010")
+    func, on_done = builds.pop()
+    on_done(func())
+    assert not background.indexing and background.filter_rows("sh0001") == indexed.filter_rows("sh0001")
+    print("background build: ok")
+
+    # Incremental maintenance matches a fresh index
+    del records[100:200]
+    indexed.remove_rows(100, 199)
+    records[0] = TaskRecord({TASK_NAME: "p_e999_sc999_sh9999_fx", TASK_STATUS: "WIP"})
+    records[1] = records[1].merged({TASK_STATUS: "APP"})
+    indexed.update_rows(0, 1)
+    records.append(TaskRecord({TASK_NAME: "p_e999_sc999_sh9999_lay", TASK_STATUS: "WIP"}))
+    for search_text, selection in (("e999", None), ("sh0010", {"status": ["app"]}), ("", {"episode": ["e999"]}),
+                                   ("", {"scene": ["sc999"], "task": ["fx"]})):
+        assert indexed.filter(search_text, selection) == TaskFilter(list(records)).filter(search_text, selection)
+    print("incremental updates: ok")
@@ -0,0 +1,118 @@
+"""
+trigram_index.py
+
+Provides TrigramIndex, an inverted index from the trigrams (3-character
+substrings) of lower-cased task names to the rows holding them.
+
+A substring of 3 or more characters can only occur in a name that holds
+each of its trigrams, so a search reads the posting list of its rarest
+trigram and checks only those names, instead of every name of the list.
+A shorter query is contained in a name exactly when it is contained in
+one of the name's trigrams (names shorter than 3 characters are indexed
+under themselves), so it is looked up through the few hundred distinct
+trigrams, unless they hold so many rows that scanning the names is cheaper.
+
+The posting lists are kept by PostingIndex.
+"""
+
+import logging
+from typing import List, Optional
+
+from ui.utils.posting_index import PostingIndex
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Length of the indexed substrings; shorter queries are scanned.
+GRAM_LENGTH = 3
+
+
+def trigrams(text: str) -> set:
+    """Return the distinct trigrams of a string, or the string itself if shorter."""
+    if len(text) < GRAM_LENGTH:
+        return {text}
+    return {text[start:start + GRAM_LENGTH] for start in range(len(text) - GRAM_LENGTH + 1)}
+
+
+class TrigramIndex(PostingIndex):
+    """
+    Trigram index of a list of lower-cased names.
+
+    Attributes:
+        names (List[str]): The indexed names, by row.
+    """
+
+    @property
+    def names(self) -> List[str]:
+        return self.values
+
+    def _keys(self, name):
+        return trigrams(name)
+
+    # ------------------------------
+    # Search
+    # ------------------------------
+
+    def search(self, text: str) -> Optional[List[int]]:
+        """
+        Return the ascending rows whose name contains text (lower-case), or
+        None if text is so short that scanning the names is cheaper.
+        """
+        if len(text) < GRAM_LENGTH:
+            return self._search_short(text)
+        postings = []
+        for gram in trigrams(text):
+            posting = self._postings.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+
+        names = self.values
+        return self._to_rows(min(postings, key=len), lambda row: text in names[row])
+
+    def _search_short(self, text):
+        postings = [posting for gram, posting in self._postings.items() if text in gram]
+        if sum(map(len, postings)) > len(self.values):
+            return None
+        ids = set()
+        for posting in postings:
+            ids.update(posting)
+        return self._to_rows(ids)
+
+    def stats(self) -> dict:
+        """Return the number of names, distinct trigrams and postings."""
+        stats = super().stats()
+        return {"names": stats["values"], "trigrams": stats["keys"], "postings": stats["postings"]}
+
+
+if __name__ == "__main__":
+    import timeit
+    import tracemalloc
+
+    from services.constants import TASK_NAME
+    from services.mock_backend import generate_tasks
+
+    names = [task[TASK_NAME].lower() for task in generate_tasks("DemoProject", 100_000)]
+    tracemalloc.start()
+    build = timeit.default_timer()
+    index = TrigramIndex(names)
+    build = timeit.default_timer() - build
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"Indexed {len(names)} names in {build * 1000:.0f} ms (~{size / 1e6:.1f} MB): {index.stats()}")
+
+    for query in ("sh0010", "e003_sc004", "lgt", "sc009_sh01", "fx", "y"):
+        expected = [row for row, name in enumerate(names) if query in name]
+        assert index.search(query) in (expected, None)
+        scan = min(timeit.repeat(lambda: [row for row, name in enumerate(names) if query in name], number=1, repeat=3))
+        lookup = min(timeit.repeat(lambda: index.search(query), number=1, repeat=3))
+        print(f"  {query!r:>14}: {len(expected):>6} rows, scan {scan * 1000:.2f} ms, index {lookup * 1000:.2f} ms")
+
+    # Incremental maintenance
+    index.remove(10, 19)
+    index.replace(0, "p_e999_sc999_sh9999_fx")
+    index.extend(["p_e999_sc999_sh9999_lay"])
+    names = index.names
+    assert index.search("e999") == [row for row, name in enumerate(names) if "e999" in name]
+    assert index.search("sh0010") == [row for row, name in enumerate(names) if "sh0010" in name]
+    print("  incremental updates: ok")
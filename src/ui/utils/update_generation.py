@@ -0,0 +1,62 @@
+"""
+update_generation.py
+
+Provides UpdateGuard, which lets a widget fed by asynchronous requests
+render only the response for its current selection. Every selection change
+starts a new UpdateGeneration; responses carrying an older generation are
+discarded, and the older generation's cancellation token is cancelled so
+its requests stop consuming backend capacity.
+"""
+
+import logging
+
+from services.request_scheduler import CancellationToken
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class UpdateGeneration:
+    """
+    One selection's update: a sequence number and the cancellation token
+    for the requests made on its behalf.
+    """
+
+    def __init__(self, number: int):
+        self.number = number
+        self.token = CancellationToken()
+
+    def __repr__(self):
+        return f"UpdateGeneration({self.number})"
+
+
+class UpdateGuard:
+    """
+    Issues update generations for a widget and tells current ones from stale ones.
+    Used from the GUI thread only.
+    """
+
+    def __init__(self):
+        self._current = UpdateGeneration(0)
+
+    @property
+    def current(self) -> UpdateGeneration:
+        """The generation responses must carry to be rendered."""
+        return self._current
+
+    def begin(self) -> UpdateGeneration:
+        """
+        Start a new generation, cancelling the requests of the previous one.
+
+        Returns:
+            UpdateGeneration: Pass its token to the requests, and the
+            generation itself back with their responses.
+        """
+        previous = self._current
+        self._current = UpdateGeneration(previous.number + 1)
+        previous.token.cancel()
+        return self._current
+
+    def is_current(self, generation: UpdateGeneration) -> bool:
+        """Return True if the generation has not been superseded."""
+        return generation is self._current
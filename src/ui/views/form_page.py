@@ -14,7 +14,7 @@ from ui.components.extensions.user_form.lineedit_component import LineEditCompon
 from ui.components.extensions.user_form.combobox_component import ComboBoxComponent
 from ui.components.forms.user_form import Ui_UserForm
 from ui.utils.stylesheet_loader import load_stylesheet
-from services.data_service import get_formUiData
+from services.async_data_service import get_formUiData_async
 from services.constants import TYPE, LABEL, ID, OPTIONS, FIELD_TYPE
 
 # Initialize logger
@@ -71,15 +71,25 @@ class FormPage(QWidget):
         # Center the GIF label
         self._ui.logo_label.setAlignment(Qt.AlignCenter)
 
-        # Retrieve form data
-        self.form_ui_data = get_formUiData() or {}
-        logger.debug(f"Loaded form UI data: {self.form_ui_data}")
-
         # Create a vertical layout for our scroll area contents
         self.scroll_layout = QVBoxLayout(self._ui.scrollAreaWidgetContents)
         self.scroll_layout.setContentsMargins(0, 15, 0, 35)
         self.scroll_layout.setSpacing(0)
 
+        # Retrieve form data without blocking the UI
+        self.form_ui_data = []
+        get_formUiData_async().then(self._populate_form_fields)
+
+    def _populate_form_fields(self, form_ui_data):
+        """
+        Dynamically add form components once the form data has been fetched.
+
+        Args:
+            form_ui_data (list): Form elements with 'id', 'label', 'options' and 'type'.
+        """
+        self.form_ui_data = form_ui_data or []
+        logger.debug(f"Loaded form UI data: {self.form_ui_data}")
+
         # Dynamically add widgets based on form_ui_data
         for field in self.form_ui_data:
             field_type = field[TYPE]
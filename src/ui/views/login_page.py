@@ -15,7 +15,7 @@ from ui.components.extensions.message_box import MessageBox
 from ui.utils.stylesheet_loader import load_stylesheet
 from ui.utils.common import verify_fonts
 
-from services.data_service import login_user
+from services.async_data_service import login_user_async
 from services.constants import USER_ID, USER_LABEL, USER_PLACEHOLDER, PASS_ID, PASS_LABEL, PASS_PLACEHOLDER
 
 # Initialize logger
@@ -107,7 +107,19 @@ class LoginPage(QWidget):
             )
             return
 
-        response = login_user({"username": self.username, "password": self.password})
+        self.login_ui.login_pushButton.setEnabled(False)
+        login_user_async({"username": self.username, "password": self.password}).then(
+            self._on_login_response, self._on_login_failed
+        )
+
+    def _on_login_response(self, response):
+        """
+        Handle the login service response once it arrives.
+
+        Args:
+            response (dict): Response from the login service.
+        """
+        self.login_ui.login_pushButton.setEnabled(True)
         if not response:
             logger.error("No response received from the login service.")
             return
@@ -124,6 +136,14 @@ class LoginPage(QWidget):
                 title="Login Failed"
             )
 
+    def _on_login_failed(self, error):
+        """
+        Re-enable the login button after a failed login request.
+        The data service has already reported the error to the user.
+        """
+        logger.error(f"Login request failed: {error}")
+        self.login_ui.login_pushButton.setEnabled(True)
+
     def get_username(self):
         """
         Return the username entered by the user.
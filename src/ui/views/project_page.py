@@ -18,7 +18,7 @@ from PySide6.QtCore import Qt, QSize
 from ui.components.forms.project_form import Ui_ProjectForm
 from ui.components.extensions.message_box import MessageBox
 from ui.components.core_widgets.project_card import ProjectCard
-from services.data_service import get_projects
+from services.async_data_service import get_projects_async
 from services.constants import PROJECT_NAME, PROJECT_TYPE, THUMBNAIL_PATH
 from ui.utils.stylesheet_loader import load_stylesheet
 
@@ -117,7 +117,16 @@ class ProjectPage(QWidget):
             form_data (dict): Data from the FormPage.
         """
         logger.debug(f"Setting form data: {form_data}")
-        self.projects = get_projects(form_data)
+        get_projects_async(form_data).then(self._on_projects_loaded)
+
+    def _on_projects_loaded(self, projects):
+        """
+        Store the fetched projects and rebuild the project table.
+
+        Args:
+            projects (list): A list of project dictionaries.
+        """
+        self.projects = projects
         self._populate_project_table()
 
     def _populate_project_table(self):
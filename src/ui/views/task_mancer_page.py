@@ -6,9 +6,10 @@ for tasks, files, scenes, and episodes in the 3D Pipeline.
 """
 
 import logging
+from dataclasses import replace
 
 from PySide6.QtWidgets import QWidget, QApplication
-from PySide6.QtCore import QThread, Signal, QTimer
+from PySide6.QtCore import QThread, QTimer, Signal
 
 from ui.components.forms.task_mancer_form import Ui_TaskMancer_Form
 from ui.components.extensions.message_box import MessageBox
@@ -26,14 +27,32 @@ from ui.views.review_area_page import ReviewAreaWidget
 
 from ui.utils.stylesheet_loader import load_stylesheet
 
+from services.project_bootstrap import ProjectSnapshot, fetch_project_snapshot
+from services.project_store import load_project_snapshot, save_project_snapshot
+from services.task_sync import TaskDelta, merge_task_delta, task_sync_engine
+from services.push_channel import PushChannel
+from services.prefetch import prefetcher
+from services.task_records import task_records
+from services.entity_store import entity_store
 from services.data_service import (
-    get_episodes, get_scenes, get_tasks, get_workFiles, get_workDetails,
-    get_fileDetails, get_taskDetail, get_taskLog, get_taskData, get_taskStatus
+    get_workFiles, invalidate_cache, latest_request_token
 )
+from services.request_scheduler import CancellationToken, Priority, request_context
+from services.constants import TASK_NAME
+from services.async_data_service import (
+    run_async, run_scheduled, get_workDetails_async, get_fileDetails_async,
+    get_taskDetail_async, get_taskLog_async
+)
+from handlers.error_handler import BackendError, MissingKeyError, RequestCancelledError
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Interval between incremental task syncs while no push stream is connected (milliseconds).
+TASK_SYNC_INTERVAL_MS = 60_000
+# Delay before persisting a snapshot patched by live updates (milliseconds).
+SNAPSHOT_SAVE_DELAY_MS = 2_000
+
 
 class TaskMancerPage(QWidget):
     """
@@ -64,7 +83,36 @@ class TaskMancerPage(QWidget):
 
         # Project and task status
         self._project = None
+        self._username = None
+        # Incremented by each set_project(), to drop stored snapshots read for a previous one
+        self._project_load_id = 0
         self._taskStatus = None
+        self._snapshot = None
+        self._progress_dialog = None
+        self.data_thread = None
+        self.refresh_thread = None
+        # Cancelled fetch threads are kept referenced until they have finished
+        self._retired_threads = set()
+
+        # Periodic incremental task sync
+        self._task_sync_timer = QTimer(self)
+        self._task_sync_timer.setInterval(TASK_SYNC_INTERVAL_MS)
+        self._task_sync_timer.timeout.connect(self._sync_task_delta)
+
+        # Live updates pushed by the backend; polling is the fallback
+        self._push_connected = False
+        self._push_channel = PushChannel(self)
+        self._push_channel.task_changed.connect(self._on_task_pushed)
+        self._push_channel.task_deleted.connect(self._on_task_deletion_pushed)
+        self._push_channel.task_log_added.connect(self._on_task_log_pushed)
+        self._push_channel.connection_changed.connect(self._on_push_connection_changed)
+
+        # Patched snapshots are saved once a burst of updates has settled
+        self._snapshot_save_timer = QTimer(self)
+        self._snapshot_save_timer.setSingleShot(True)
+        self._snapshot_save_timer.setInterval(SNAPSHOT_SAVE_DELAY_MS)
+        self._snapshot_save_timer.timeout.connect(self._save_snapshot)
+        self._review_task_name = None
 
         # -- To reduce repetition, store area-specific components in a dict --
         # This makes it easier to loop over areas for certain operations.
@@ -166,10 +214,12 @@ class TaskMancerPage(QWidget):
         task list widgets, file widgets, etc.) for both 'Work Area' and 'Review'.
         """
         logger.debug("Building UI components for TaskMancerPage.")
+        self._discard_area_widgets()
 
         # -- Create Work Area Widgets --
         self.areas["work"]["selection_widget"] = SelectionWidget()
         self.areas["work"]["task_list_widget"] = TaskListWidget()
+        self.areas["work"]["task_list_widget"].bind_entity_store(entity_store, self._project)
         self.areas["work"]["file_widget"] = WorkFilesWidget()
         self.areas["work"]["file_detail_widget"] = WorkDetailsWidget(title="Work Files Details")
         self.areas["work"]["file_preview_widget"] = FileDetailsWidget(title="File Preview")
@@ -186,6 +236,7 @@ class TaskMancerPage(QWidget):
         # -- Create Review Area Widgets --
         self.areas["review"]["selection_widget"] = SelectionWidget()
         self.areas["review"]["task_list_widget"] = TaskListWidget()
+        self.areas["review"]["task_list_widget"].bind_entity_store(entity_store, self._project)
         self.areas["review"]["task_detail_widget"] = TaskDetailsWidget("Task Details")
 
         # Container widget for Review Area
@@ -195,8 +246,7 @@ class TaskMancerPage(QWidget):
             self.areas["review"]["task_detail_widget"],
         )
 
-        # Clear and re-populate the tab widget
-        self._ui.TaskMancer_tabWidget.clear()
+        # Populate the tab widget
         self._ui.TaskMancer_tabWidget.addTab(self.areas["work"]["area_widget"], "Work Area")
         self._ui.TaskMancer_tabWidget.addTab(self.areas["review"]["area_widget"], "Review")
 
@@ -208,7 +258,17 @@ class TaskMancerPage(QWidget):
         Clear UI-related data and widgets so a fresh UI can be built later.
         """
         logger.debug("Clearing TaskMancerPage UI components.")
-        self._ui.TaskMancer_tabWidget.clear()
+        # Cancel the requests of the detail panes about to be discarded
+        for area_name, key in (("work", "file_detail_widget"), ("work", "file_preview_widget"),
+                               ("review", "task_detail_widget")):
+            if self.areas[area_name][key]:
+                self.areas[area_name][key].begin_update()
+        self._task_sync_timer.stop()
+        self._push_channel.unsubscribe()
+        self._push_connected = False
+        prefetcher.cancel()
+        self._review_task_name = None
+        self._discard_area_widgets()
 
         # Reset all references and states
         for area_name in self.areas:
@@ -229,84 +289,324 @@ class TaskMancerPage(QWidget):
 
         self.sync_in_progress = False
 
+    def _discard_area_widgets(self):
+        """
+        Remove the area tabs and delete their widgets, unsubscribing the task
+        lists from the entity store first. QTabWidget.clear() alone keeps the
+        pages alive, and their lists would keep patching invisible models.
+        """
+        tab_widget = self._ui.TaskMancer_tabWidget
+        pages = [tab_widget.widget(index) for index in range(tab_widget.count())]
+        for area_name in self.areas:
+            task_list_widget = self.areas[area_name]["task_list_widget"]
+            if task_list_widget:
+                task_list_widget.unbind_entity_store()
+        tab_widget.clear()
+        for page in pages:
+            page.deleteLater()
+
     # ------------------------------------------------------------
     #                 PROJECT & DATA FETCHING
     # ------------------------------------------------------------
 
-    def set_project(self, project_name):
+    def set_project(self, project_name, username=None):
         """
         Set the current project, clear any existing UI, and fetch data from the server.
 
+        If a snapshot of the project is stored locally it is rendered as soon as
+        it has been read (off the GUI thread) and revalidated in the background;
+        otherwise the data is fetched behind a progress dialog.
+
         Args:
             project_name (str): The name of the project.
+            username (str, optional): The logged-in user, used to key the local snapshot store.
         """
         logger.info(f"Setting project to '{project_name}' and fetching data.")
         self._project = project_name
+        self._username = username
+        self._cancel_fetch_threads()
         self._clear_ui()
 
-        progress_dialog = ProgressDialog(
+        # The stored snapshot is read and decoded on a worker thread
+        self._project_load_id += 1
+        load_id = self._project_load_id
+        run_async(_load_stored_snapshot, username, project_name).then(
+            lambda snapshot: self._on_stored_snapshot(load_id, snapshot),
+            lambda error: self._on_stored_snapshot(load_id, None)
+        )
+
+    def _on_stored_snapshot(self, load_id, snapshot):
+        """
+        Render the stored snapshot of the project being opened and revalidate
+        it in the background, or fetch the project if none is stored.
+        """
+        if load_id != self._project_load_id:
+            # Another project was opened meanwhile
+            return
+        if snapshot and snapshot.tasks and snapshot.task_status:
+            logger.info(f"Rendering stored snapshot of '{self._project}' while revalidating.")
+            self._apply_snapshot(snapshot)
+            self._revalidate_project()
+            return
+        self._fetch_project()
+
+    def _fetch_project(self):
+        """
+        Fetch the current project behind a progress dialog, streaming its
+        tasks in page by page.
+        """
+        self._progress_dialog = ProgressDialog(
             self,
             title="Loading Project Data",
             message="Fetching data..."
         )
-        progress_dialog.show()
-
-        # Create and start a background thread to fetch data
-        self.data_thread = DataFetchThread({"project_name": project_name})
-
-        def on_data_fetched(task_data, task_status):
-            """
-            Handle successful data fetching from the server.
-            """
-            QTimer.singleShot(0, lambda: _build_and_populate_ui(task_data, task_status, progress_dialog))
-
-        def _build_and_populate_ui(task_data, task_status, progress_dialog):
-            """
-            Build the UI and populate with data, then close the progress dialog once done.
-            """
-            if not task_data or not task_status:
-                logger.error("Incomplete data received from the server.")
-                self.message_box.show_error("Received incomplete data from the server.")
-                progress_dialog.close()
-                return
-
-            self._taskStatus = task_status
-
-            # 1. Build UI (this can be expensive if it involves many widgets/layouts)
-            self._build_ui()
-
-            # 2. Populate your UI with the fetched data
-            self._populate(task_data, task_status)
-
-            # 3. Now that all heavy UI work is done, close the progress dialog
-            progress_dialog.close()
-
-        def on_error(error_message):
-            """
-            Handle errors that occur during data fetching.
-            """
-            progress_dialog.close()
-            logger.error(f"Error fetching data: {error_message}")
-            self.message_box.show_error(f"Error: {error_message}")
-
-        def on_cancel():
-            """
-            Handle user-cancelation of data fetching.
-            """
-            self.cancel_requested = True
-            logger.warning("Operation canceled by the user.")
-            if self.data_thread.isRunning():
-                self.data_thread.terminate()
-            progress_dialog.close()
+        self._progress_dialog.canceled.connect(self._on_load_canceled)
+        self._progress_dialog.show()
+
+        # Create and start a background thread that streams the project in page by page
+        self.data_thread = DataFetchThread(self._project, self._username, stream=True, priority=Priority.VISIBLE)
+        self.data_thread.metadata_fetched.connect(self._on_project_metadata)
+        self.data_thread.page_fetched.connect(self._on_task_page)
+        self.data_thread.data_fetched.connect(self._on_project_loaded)
+        self.data_thread.error_occurred.connect(self._on_load_error)
+        self.data_thread.start()
 
-        # Connect signals
-        self.data_thread.data_fetched.connect(on_data_fetched)
-        self.data_thread.error_occurred.connect(on_error)
-        progress_dialog.canceled.connect(on_cancel)
+    def _cancel_fetch_threads(self):
+        """
+        Cancel project fetches still running for a previously opened project.
+        """
+        for thread in (self.data_thread, self.refresh_thread):
+            if thread and thread.isRunning():
+                thread.cancel()
+                self._retired_threads.add(thread)
+                thread.finished.connect(self._release_retired_threads)
 
-        # Start thread & indefinite progress
-        self.data_thread.start()
-        progress_dialog.progress_bar.setRange(0, 0)
+    def _release_retired_threads(self):
+        """
+        Drop the references to cancelled fetch threads that have finished.
+        """
+        self._retired_threads = {thread for thread in self._retired_threads if thread.isRunning()}
+
+    def _close_progress_dialog(self):
+        """
+        Close the loading progress dialog if it is still open.
+        """
+        if self._progress_dialog:
+            self._progress_dialog.close()
+            self._progress_dialog = None
+
+    def _on_project_metadata(self, snapshot: ProjectSnapshot):
+        """
+        Build the UI (statuses, selection options, empty task lists) as soon
+        as the project metadata is known, before any task page arrives.
+        """
+        if snapshot.project_name != self._project:
+            return
+        self._apply_snapshot(snapshot)
+
+    def _on_task_page(self, project_name, tasks, loaded, total):
+        """
+        Append a page of streamed tasks to both task lists. The progress
+        dialog closes with the first page so the list is usable right away;
+        the remaining progress is shown above each task list.
+        """
+        if project_name != self._project:
+            return
+        for area_name in ("work", "review"):
+            task_list_widget = self.areas[area_name]["task_list_widget"]
+            if task_list_widget:
+                task_list_widget.append_tasks(tasks)
+                task_list_widget.set_loading_progress(loaded, total)
+        if self._progress_dialog:
+            self._progress_dialog.set_progress(loaded, total, f"Loaded {loaded} of {total} tasks")
+            self._close_progress_dialog()
+
+    def _on_project_loaded(self, snapshot: ProjectSnapshot):
+        """
+        Keep the complete snapshot once every page has been received.
+        """
+        if snapshot.project_name != self._project:
+            return
+        self._snapshot = snapshot
+        self._close_progress_dialog()
+        self._start_task_sync()
+
+    def _on_load_error(self, error_message):
+        """
+        Handle errors that occur during data fetching.
+        """
+        self._close_progress_dialog()
+        logger.error(f"Error fetching data: {error_message}")
+        self.message_box.show_error(f"Error: {error_message}")
+
+    def _on_load_canceled(self):
+        """
+        Handle user-cancelation of data fetching.
+        """
+        self.cancel_requested = True
+        logger.warning("Operation canceled by the user.")
+        if self.data_thread.isRunning():
+            # Aborts the request in flight; the thread then exits on its own.
+            self.data_thread.cancel()
+        self._progress_dialog = None
+
+    def _apply_snapshot(self, snapshot: ProjectSnapshot):
+        """
+        Build the UI and populate it from a project snapshot.
+        """
+        if snapshot.tasks:
+            # Stored snapshots are decoded from disk; use the canonical records.
+            snapshot = replace(snapshot, tasks=tuple(
+                entity_store.upsert_tasks(snapshot.project_name, snapshot.tasks, announce_new=False)
+            ))
+        self._snapshot = snapshot
+        self._taskStatus = dict(snapshot.task_status)
+        self._build_ui()
+        self._populate(snapshot)
+
+    def _revalidate_project(self):
+        """
+        Fetch a fresh snapshot of the current project in the background and
+        patch the UI if it differs from the one being displayed.
+        """
+        self.refresh_thread = DataFetchThread(self._project, self._username, priority=Priority.BULK)
+        self.refresh_thread.data_fetched.connect(self._on_snapshot_revalidated)
+        self.refresh_thread.error_occurred.connect(
+            lambda error_message: logger.warning(f"Background project refresh failed: {error_message}")
+        )
+        self.refresh_thread.start()
+
+    def _on_snapshot_revalidated(self, snapshot: ProjectSnapshot):
+        """
+        Patch the displayed project with a freshly fetched snapshot.
+        """
+        if snapshot.project_name != self._project or not self._snapshot:
+            return
+        self._start_task_sync()
+        if snapshot == self._snapshot:
+            logger.debug("Stored project snapshot is up to date.")
+            return
+
+        logger.info(f"Project '{self._project}' changed on the server; updating the UI.")
+        previous = self._snapshot
+        self._snapshot = snapshot
+        self._taskStatus = dict(snapshot.task_status)
+
+        if (snapshot.episodes, snapshot.scenes, snapshot.task_types) != \
+                (previous.episodes, previous.scenes, previous.task_types) \
+                or snapshot.task_status.keys() != previous.task_status.keys():
+            for area_name in ("work", "review"):
+                selection_widget = self.areas[area_name]["selection_widget"]
+                if selection_widget:
+                    self._populate_selection_widget(selection_widget, snapshot)
+
+        if snapshot.tasks != previous.tasks or snapshot.task_status != previous.task_status:
+            for area_name in ("work", "review"):
+                task_list_widget = self.areas[area_name]["task_list_widget"]
+                if task_list_widget:
+                    task_list_widget.set_task_status_colors(self._taskStatus)
+                    task_list_widget.set_tasks(list(snapshot.tasks))
+                    self._apply_filters(area_name)
+
+    def _start_task_sync(self):
+        """
+        Subscribe to live updates of the project and, until the push stream
+        is connected, poll the backend for task deltas.
+        """
+        self._push_channel.subscribe(self._project)
+        if task_sync_engine.supported is False or self._push_connected:
+            return
+        self._task_sync_timer.start()
+
+    def _on_push_connection_changed(self, connected):
+        """
+        Switch between push updates and delta polling. Every (re)connection
+        is followed by one delta sync to pick up changes made while the
+        stream was down.
+        """
+        self._push_connected = connected
+        if not self._project or not self._snapshot:
+            return
+        if connected:
+            logger.info(f"Live updates of '{self._project}' connected.")
+            self._task_sync_timer.stop()
+            self._sync_task_delta()
+        elif task_sync_engine.supported is not False:
+            logger.info(f"Live updates of '{self._project}' lost; polling for changes.")
+            self._task_sync_timer.start()
+
+    def _on_task_pushed(self, project_name, task):
+        """
+        Store a task pushed by the backend; the entity store patches the
+        task rows. Pushed tasks are complete records and replace any
+        hydrated one.
+        """
+        invalidate_cache("TaskDetail", task.get(TASK_NAME))
+        record, = entity_store.upsert_tasks(project_name, [task])
+        self._on_task_delta(TaskDelta(project_name, [record], []))
+        task_records.put(project_name, record)
+
+    def _on_task_deletion_pushed(self, project_name, task_name):
+        """
+        Remove a task deleted on the backend from the entity store, which
+        removes its rows.
+        """
+        entity_store.remove_tasks(project_name, [task_name])
+        self._on_task_delta(TaskDelta(project_name, [], [task_name]))
+
+    def _on_task_log_pushed(self, project_name, task_name, entry):
+        """
+        Add a pushed log entry to the Review Area if its task is displayed.
+        """
+        if project_name != self._project:
+            return
+        invalidate_cache("TaskLog", task_name)
+        detail_widget = self.areas["review"]["task_detail_widget"]
+        if detail_widget and task_name == self._review_task_name:
+            detail_widget.add_task_log(entry)
+
+    def _save_snapshot(self):
+        """
+        Persist the current snapshot in the background.
+        """
+        if self._snapshot:
+            run_async(save_project_snapshot, self._username, self._snapshot)
+
+    def _sync_task_delta(self):
+        """
+        Fetch the tasks changed since the last sync in the background.
+        """
+        if task_sync_engine.supported is False:
+            self._task_sync_timer.stop()
+            return
+        if not self._project:
+            return
+        run_scheduled(Priority.BULK, None, task_sync_engine.fetch_delta, self._project).then(
+            self._on_task_delta,
+            lambda error: logger.warning(f"Incremental task sync failed: {error}")
+        )
+
+    def _on_task_delta(self, delta: TaskDelta):
+        """
+        Patch the current snapshot with a task delta. The delta has already
+        been applied to the entity store, which patches both task lists.
+        """
+        if delta is None:
+            if task_sync_engine.supported is False:
+                self._task_sync_timer.stop()
+            return
+        if delta.project_name != self._project or not self._snapshot or delta.is_empty():
+            return
+
+        logger.info(
+            f"Applying task delta to '{self._project}': "
+            f"{len(delta.changed)} changed, {len(delta.deleted)} deleted."
+        )
+        self._snapshot = replace(
+            self._snapshot,
+            tasks=tuple(merge_task_delta(self._snapshot.tasks, delta.changed, delta.deleted))
+        )
+        self._snapshot_save_timer.start()
 
     # ------------------------------------------------------------
     #                 SHARED UI SIGNAL CONNECTIONS
@@ -337,6 +637,7 @@ class TaskMancerPage(QWidget):
                 lambda task_name, data: self._populate_work_files(task_name, data)
             )
             work_task_list.taskSelected.connect(self._sync_task_selection)
+            work_task_list.taskFocused.connect(self._prefetch_work_area)
             work_task_list.search_lineEdit.textChanged.connect(self._sync_search_text)
 
         if work_file_widget:
@@ -358,39 +659,43 @@ class TaskMancerPage(QWidget):
             )
             review_task_list.taskSelected.connect(self._update_review_task_details)
             review_task_list.taskSelected.connect(self._sync_task_selection)
+            review_task_list.taskFocused.connect(self._prefetch_review_area)
             review_task_list.search_lineEdit.textChanged.connect(self._sync_search_text)
 
     # ------------------------------------------------------------
     #                       POPULATION
     # ------------------------------------------------------------
 
-    def _populate(self, task_data, task_status):
+    def _populate(self, snapshot: ProjectSnapshot):
         """
         Populate the TaskMancerPage UI with data fetched from the server.
 
         Args:
-            task_data (list): List of tasks or related info.
-            task_status (dict): Status-color mapping or other status metadata.
+            snapshot (ProjectSnapshot): Tasks, statuses and selection options of the project.
         """
         logger.debug("Populating TaskMancerPage with fetched data.")
-        if not task_data or not task_status:
-            logger.warning("No task data or status data to populate.")
+        if not snapshot.task_status:
+            logger.warning("No task status data to populate.")
             return
 
-        # Set tasks & status colors for both areas
-        for area_name in ("work", "review"):
-            task_list_widget = self.areas[area_name]["task_list_widget"]
-            if task_list_widget:
-                task_list_widget.set_tasks(task_data)
-                task_list_widget.set_task_status_colors(task_status)
+        task_status = dict(snapshot.task_status)
 
-        # Populate selection widgets
+        # Populate selection widgets first: filling their comboboxes emits
+        # selectionChanged, which re-filters the (still empty) task lists.
         for area_name in ("work", "review"):
             selection_widget = self.areas[area_name]["selection_widget"]
             if selection_widget:
-                self._populate_selection_widget(selection_widget)
+                self._populate_selection_widget(selection_widget, snapshot)
+
+        # Set tasks & status colors for both areas. Each list gets its own copy
+        # since streamed pages are appended to it.
+        for area_name in ("work", "review"):
+            task_list_widget = self.areas[area_name]["task_list_widget"]
+            if task_list_widget:
+                task_list_widget.set_task_status_colors(task_status)
+                task_list_widget.set_tasks(list(snapshot.tasks))
 
-    def _populate_selection_widget(self, selection_widget):
+    def _populate_selection_widget(self, selection_widget, snapshot: ProjectSnapshot):
         """
         Populate shot, episode, scene, task, and status in the given selection widget.
         """
@@ -399,17 +704,10 @@ class TaskMancerPage(QWidget):
         selection_widget.shot_comboBox.clear()
         selection_widget.shot_comboBox.addItems(["Shot", "Assets"])
 
-        # Episodes
-        episodes = get_episodes(self._project)
-        self._fill_combobox(selection_widget.episode_comboBox, "Select All", episodes)
-
-        # Scenes
-        scenes = get_scenes(self._project)
-        self._fill_combobox(selection_widget.scene_comboBox, "Select All", scenes)
-
-        # Tasks
-        tasks = get_tasks(self._project)
-        self._fill_combobox(selection_widget.task_comboBox, "Select All", tasks)
+        # Episodes, scenes and tasks come from the shared project snapshot
+        self._fill_combobox(selection_widget.episode_comboBox, "Select All", list(snapshot.episodes))
+        self._fill_combobox(selection_widget.scene_comboBox, "Select All", list(snapshot.scenes))
+        self._fill_combobox(selection_widget.task_comboBox, "Select All", list(snapshot.task_types))
 
         # Status
         selection_widget.status_comboBox.clear()
@@ -483,30 +781,60 @@ class TaskMancerPage(QWidget):
         if not work_file_widget:
             return
 
-        files_data = get_workFiles(task_data)
         work_file_widget.set_task_data(task_data)
-        work_file_widget.files = files_data
+        project_name = self._project
+
+        def load_work_files(task):
+            # List records are partial; the work files request needs the complete record.
+            record = task_records.hydrate(project_name, task)
+            return record, get_workFiles(record)
+
+        def on_files_loaded(result):
+            record, files_data = result
+            widget = self.areas["work"]["file_widget"]
+            if widget:
+                widget.set_task_data(record)
+                widget.files = files_data
+
+        # Latest wins: switching tasks cancels the previous task's request
+        run_scheduled(
+            Priority.INTERACTIVE, latest_request_token("work.files"), load_work_files, task_data
+        ).then(on_files_loaded)
 
     def _update_work_details(self, workfile_data):
         """
         Update details widgets for the selected work file in the Work Area.
+
+        Each widget starts a new update generation first, which cancels the
+        requests of the previously selected file and makes the widget ignore
+        any of their responses that still arrive.
         """
         logger.debug("Updating details for Work Area.")
+        detail_widget = self.areas["work"]["file_detail_widget"]
+        preview_widget = self.areas["work"]["file_preview_widget"]
+        if not detail_widget or not preview_widget:
+            return
+
+        detail_generation = detail_widget.begin_update()
+        preview_generation = preview_widget.begin_update()
         if not workfile_data:
             # Clear data if empty
-            if self.areas["work"]["file_detail_widget"]:
-                self.areas["work"]["file_detail_widget"].details_data = {}
-            if self.areas["work"]["file_preview_widget"]:
-                self.areas["work"]["file_preview_widget"].details_data = {}
+            detail_widget.details_data = {}
+            preview_widget.details_data = {}
             return
 
-        detail_data = get_workDetails(workfile_data)
-        preview_data = get_fileDetails(workfile_data)
+        def on_details_loaded(detail_data):
+            widget = self.areas["work"]["file_detail_widget"]
+            if widget:
+                widget.apply_update(detail_generation, detail_data)
 
-        if self.areas["work"]["file_detail_widget"]:
-            self.areas["work"]["file_detail_widget"].details_data = detail_data
-        if self.areas["work"]["file_preview_widget"]:
-            self.areas["work"]["file_preview_widget"].details_data = preview_data
+        def on_preview_loaded(preview_data):
+            widget = self.areas["work"]["file_preview_widget"]
+            if widget:
+                widget.apply_update(preview_generation, preview_data)
+
+        get_workDetails_async(workfile_data, token=detail_generation.token).then(on_details_loaded)
+        get_fileDetails_async(workfile_data, token=preview_generation.token).then(on_preview_loaded)
 
     # ------------------------------------------------------------
     #                REVIEW AREA LOGIC / SLOTS
@@ -515,23 +843,61 @@ class TaskMancerPage(QWidget):
     def _update_review_task_details(self, task_name):
         """
         Update the task details and logs in the Review Area for the given task name.
+        Only the responses for the most recently selected task are rendered.
         """
         logger.debug(f"Updating task details for Review Area, task '{task_name}'.")
+        self._review_task_name = task_name
         detail_widget = self.areas["review"]["task_detail_widget"]
 
         if not detail_widget:
             return
 
+        generation = detail_widget.begin_update()
+
         # Clear if no task name
         if not task_name:
             detail_widget.details_data = {}
             detail_widget.task_logs = []
             return
 
-        task_detail_data = get_taskDetail(task_name)
-        task_log_data = get_taskLog(task_name)
-        detail_widget.details_data = task_detail_data
-        detail_widget.task_logs = task_log_data
+        def on_detail_loaded(task_detail_data):
+            widget = self.areas["review"]["task_detail_widget"]
+            if widget:
+                widget.apply_update(generation, details_data=task_detail_data)
+
+        def on_log_loaded(task_log_data):
+            widget = self.areas["review"]["task_detail_widget"]
+            if widget:
+                widget.apply_update(generation, task_logs=task_log_data)
+
+        get_taskDetail_async(task_name, token=generation.token).then(on_detail_loaded)
+        get_taskLog_async(task_name, token=generation.token).then(on_log_loaded)
+
+    # ------------------------------------------------------------
+    #                      PREFETCHING
+    # ------------------------------------------------------------
+
+    def _prefetch_work_area(self, task_name, task_data):
+        """
+        Warm the cache with the Work Area data the user is likely to open
+        next, superseding the prefetches of the previously focused task.
+        """
+        task_list_widget = self.areas["work"]["task_list_widget"]
+        if task_list_widget:
+            prefetcher.prefetch_work_area(
+                self._project, task_data, task_list_widget.get_neighbour_tasks(task_name, prefetcher.neighbours)
+            )
+
+    def _prefetch_review_area(self, task_name, task_data):
+        """
+        Warm the cache with the Review Area details and logs of the tasks
+        around the focused one.
+        """
+        task_list_widget = self.areas["review"]["task_list_widget"]
+        if task_list_widget:
+            prefetcher.prefetch_review_area(
+                task_name, task_list_widget.get_neighbour_tasks(task_name, prefetcher.neighbours)
+            )
 
     # ------------------------------------------------------------
     #                SYNCHRONIZATION LOGIC
@@ -632,38 +998,97 @@ class TaskMancerPage(QWidget):
         logger.debug("Download project files menu action clicked.")
 
 
+def _load_stored_snapshot(username, project_name):
+    """
+    Read and decode the stored snapshot of a project (on a worker thread)
+    and make its tasks the canonical records of the entity store.
+
+    Returns:
+        ProjectSnapshot or None: None if nothing usable is stored.
+    """
+    snapshot = load_project_snapshot(username, project_name)
+    if snapshot and snapshot.tasks:
+        snapshot = replace(snapshot, tasks=tuple(
+            entity_store.upsert_tasks(project_name, snapshot.tasks, announce_new=False)
+        ))
+    return snapshot
+
+
 class DataFetchThread(QThread):
     """
-    Thread responsible for fetching data related to tasks and their statuses.
-    Emit signals on success or error.
+    Thread responsible for fetching the project snapshot (tasks, statuses,
+    episodes, scenes and task types). Emit signals on success or error.
+
+    In streaming mode the metadata and every page of tasks are emitted as
+    they arrive, before the complete snapshot.
+
+    The fetch can be stopped with cancel(), which aborts the request in
+    flight; the thread then finishes without emitting anything.
     """
-    data_fetched = Signal(list, dict)
+    data_fetched = Signal(object)
+    metadata_fetched = Signal(object)
+    page_fetched = Signal(str, list, int, int)
     error_occurred = Signal(str)
 
-    def __init__(self, project_data):
+    def __init__(self, project_name, username=None, stream=False, priority=Priority.VISIBLE):
         """
         Initialize the DataFetchThread.
 
         Args:
-            project_data (dict): Dictionary containing project-related information (e.g., project name).
+            project_name (str): The name of the project to load.
+            username (str, optional): User whose local snapshot store is updated.
+            stream (bool): Emit metadata_fetched and page_fetched while loading.
+            priority (Priority): Request priority class of the fetch.
         """
         super().__init__()
-        self.project_data = project_data
+        self.project_name = project_name
+        self.username = username
+        self.stream = stream
+        self.priority = priority
+        self._token = CancellationToken()
+
+    def cancel(self):
+        """
+        Stop the fetch cooperatively: queued requests are dropped and the
+        socket of the request in flight is shut down.
+        """
+        logger.debug(f"Cancelling project fetch of '{self.project_name}'.")
+        self._token.cancel()
 
     def run(self):
         """
-        Fetch task data and task status in a background thread. Emit signals upon completion or error.
+        Fetch the project snapshot in a background thread. Emit signals upon completion or error.
         """
-        logger.debug("DataFetchThread started. Fetching task data and task status.")
+        with request_context(self.priority, self._token):
+            self._fetch()
+
+    def _fetch(self):
+        logger.debug("DataFetchThread started. Fetching project snapshot.")
+        try:
+            # Take the delta high-water mark before loading, so changes made
+            # during the load are picked up by the next incremental sync.
+            task_sync_engine.mark(self.project_name)
+        except (BackendError, MissingKeyError) as ex:
+            logger.warning(f"Could not mark the task sync cursor: {ex}")
+        except RequestCancelledError:
+            logger.info(f"Project fetch of '{self.project_name}' cancelled.")
+            return
         try:
-            task_data = get_taskData(self.project_data)
-            if not task_data:
-                raise Exception("Failed to fetch task data.")
-            task_status = get_taskStatus(self.project_data)
-            if not task_status:
-                raise Exception("Failed to fetch task status.")
+            if self.stream:
+                snapshot = fetch_project_snapshot(
+                    self.project_name,
+                    on_metadata=self.metadata_fetched.emit,
+                    on_page=lambda tasks, loaded, total: self.page_fetched.emit(
+                        self.project_name, tasks, loaded, total
+                    )
+                )
+            else:
+                snapshot = fetch_project_snapshot(self.project_name)
+            save_project_snapshot(self.username, snapshot)
             logger.debug("Data fetched successfully, emitting data_fetched signal.")
-            self.data_fetched.emit(task_data, task_status)
+            self.data_fetched.emit(snapshot)
+        except RequestCancelledError:
+            logger.info(f"Project fetch of '{self.project_name}' cancelled.")
         except Exception as e:
             logger.error(f"Error in DataFetchThread: {e}", exc_info=True)
             self.error_occurred.emit(str(e))